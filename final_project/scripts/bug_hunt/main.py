@@ -8,29 +8,24 @@ import logging
 # Add the parent directory to sys.path for proper imports
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from utils.logging_config import configure_logging
+
 # Setup logging first
 def setup_logging():
     logs_dir = Path(__file__).parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(logs_dir / "biome.log", encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    # Records are queued and written to logs/biome.log by a background thread
+    configure_logging(logs_dir)
     return logging.getLogger(__name__)
 
 # Initialize logging
 logger = setup_logging()
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
+from collections import Counter
 import json
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
-from rich.markdown import Markdown
 from rich.console import Console
 import typer
 import esprima
@@ -42,9 +37,14 @@ from textual.containers import Container
 from textual.widgets import Button, Header, Footer, Static
 from textual.binding import Binding
 
+from utils.analysis_cache import AnalysisCache, hash_plugin_sources
 from utils.checkpoint_manager import CheckpointManager
+from utils.diagnostics_store import GROUP_COLUMNS, DiagnosticsStore
+from utils.git_scope import PluginChanges, changed_plugin_files, merge_analysis_results
 from utils.node_manager import NodeManager
-from utils.reporting import BiomeReportGenerator
+from utils.plugin_discovery import PluginDiscovery
+from utils.report_pager import page_report
+from utils.reporting import BiomeReportGenerator, ReportIndex
 
 # Initialize rich console
 console = Console()
@@ -93,19 +93,10 @@ class PluginAnalyzerApp(App):
         """Resume a previous analysis session."""
         self.exit(result=("resume", None))
 
-    async def view_reports(self) -> None:
-        """View existing analysis reports."""
-        reports_dir = Path("reports")
-        if not reports_dir.exists():
-            console.print("[red]No reports found![/red]")
-            return
+    def action_view_reports(self) -> None:
+        """View existing analysis reports in the paged report viewer."""
+        self.exit(result=("reports", None))
 
-        for report_file in reports_dir.glob("*.md"):
-            with open(report_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Use rich's Markdown renderer
-                console.print(Markdown(content))
-                console.print("\n---\n")
 
 def show_main_menu() -> tuple[str, Optional[str]]:
     """Show the main TUI menu and return the selected action."""
@@ -126,12 +117,124 @@ def generate_analysis_report(analysis_result: Dict[str, Any]) -> str:
 
     return report_gen.generate_markdown_report()
 
+
+def analyze_plugin(
+    node_manager: NodeManager,
+    plugin_path: Path,
+    config_data: Dict[str, Any],
+    changes: Optional[PluginChanges] = None,
+    previous_result: Optional[Dict[str, Any]] = None,
+    biome_result: Optional[Dict[str, Any]] = None,
+    precomputed_result: Optional[Dict[str, Any]] = None,
+    report_index: Optional[ReportIndex] = None,
+) -> Dict[str, Any]:
+    """Analyze a single plugin and write its report. Safe to run from a worker thread.
+
+    When `changes` is given only those files are linted and the fresh diagnostics
+    are merged with `previous_result` for every untouched file. A `biome_result`
+    from a batched Biome run replaces the per-plugin Biome invocation, and a
+    `precomputed_result` from the async strategy replaces the whole analysis.
+    The report's index entry is staged in `report_index` when one is given.
+    """
+    if changes and previous_result:
+        if changes.changed:
+            fresh_result = node_manager.analyze_typescript(
+                str(plugin_path),
+                config=config_data,
+                files=changes.changed,
+                biome_result=biome_result,
+            )
+        else:
+            # Only deletions: nothing to lint, just drop their old diagnostics and keep the
+            # previous dependency result, since no file-scoped check ran
+            previous_dependencies = previous_result.get("results", {}).get("dependencies", {})
+            fresh_result = {
+                "success": previous_dependencies.get("success", True),
+                "results": {"biome": {"success": True}, "dependencies": previous_dependencies},
+            }
+        analysis_result = merge_analysis_results(previous_result, fresh_result, changes)
+    elif precomputed_result is not None:
+        analysis_result = precomputed_result
+    else:
+        # Run TypeScript analysis with configuration
+        analysis_result = node_manager.analyze_typescript(
+            str(plugin_path), config=config_data, biome_result=biome_result
+        )
+    analysis_result["plugin_name"] = plugin_path.name
+    # Fingerprint the sources so resume can tell whether this result went stale;
+    # whole-plugin analyses already hashed them for the cache key
+    if not analysis_result.get("source_hash"):
+        analysis_result["source_hash"] = hash_plugin_sources(plugin_path)
+
+    # Generate and save report
+    report_dir = Path("reports")
+    report_dir.mkdir(exist_ok=True)
+
+    # Create report generator
+    report_gen = BiomeReportGenerator()
+
+    # Hand the Biome result, diagnostics table included, straight to the report
+    biome_results = analysis_result.get("results", {}).get("biome", {})
+    report_gen.load_result(biome_results, plugin_name=plugin_path.name)
+
+    # Save report
+    report_gen.save_report(report_dir, report_index)
+
+    return analysis_result
+
+
 @app.command()
 def start(
-    plugins: Optional[List[str]] = typer.Option(None, "--plugins", "-p", help="Specific plugins to analyze"),
+    plugins: Optional[List[str]] = typer.Option(
+        None, "--plugins", "-p", help="Specific plugins to analyze"
+    ),
     config_path: Path = typer.Option(
-        Path("config/analysis.config.json"), "--config", "-c",
-        help="Analysis configuration file"
+        Path("config/analysis.config.json"), "--config", "-c", help="Analysis configuration file"
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of plugins to analyze concurrently (defaults to CPU count)",
+    ),
+    reporter: str = typer.Option(
+        "verbose",
+        "--reporter",
+        "-r",
+        help="Biome reporter to parse: 'verbose' text or structured 'json'",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-analyze every plugin instead of reusing cached results"
+    ),
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="Only lint files changed since this git ref, reusing the previous session for the rest",
+    ),
+    strategy: str = typer.Option(
+        "per-plugin",
+        "--strategy",
+        help="Biome invocation strategy: 'per-plugin', one 'batch' run over all plugins, "
+        "or 'async' to run every plugin's Biome process on one event loop",
+    ),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon",
+        help="Route Biome checks through a long-lived Biome server for this session",
+    ),
+    stream_output: bool = typer.Option(
+        False,
+        "--stream-output",
+        help="Parse Biome output as it streams and spill raw logs to logs/raw/ instead of memory",
+    ),
+    log_raw_output: bool = typer.Option(
+        False, "--log-raw-output", help="Also log every line of Biome output to logs/biome.log"
+    ),
+    tool_overhead: bool = typer.Option(
+        False,
+        "--tool-overhead",
+        help="After the session, time pnpm against the resolved tools to estimate the startup saved",
     ),
 ):
     """Start a new analysis session."""
@@ -142,19 +245,195 @@ def start(
 
     # Initialize session and managers
     session_name = Prompt.ask("Enter session name", default="bug_hunt_session")
-    checkpoint_manager.start_session(session_name)
 
-    # Initialize and setup Node environment
-    console.print("[yellow]Setting up Node.js environment...[/yellow]")
-    node_manager = NodeManager(work_dir=str(workspace_root))
+    # Results from the previous session seed --since runs; read them before starting a new one
+    previous_checkpoint = checkpoint_manager.latest_checkpoint() if since else None
+    previous_results = _previous_results(previous_checkpoint)
+
+    checkpoint_manager.start_session(
+        session_name,
+        options={
+            "plugins": plugins,
+            "config_path": str(config_path),
+            "reporter": reporter,
+            "no_cache": no_cache,
+            "strategy": strategy,
+            "daemon": daemon,
+            "stream_output": stream_output,
+            "log_raw_output": log_raw_output,
+            "since": since,
+            "previous_checkpoint": str(previous_checkpoint) if previous_checkpoint else None,
+        },
+    )
 
-    # Load configuration
+    _execute_session(
+        workspace_root,
+        config_path,
+        plugins,
+        jobs,
+        reporter,
+        no_cache,
+        strategy,
+        daemon,
+        since,
+        previous_results,
+        stream_output=stream_output,
+        log_raw_output=log_raw_output,
+        session_name=session_name,
+        tool_overhead=tool_overhead,
+    )
+
+
+def _previous_results(checkpoint: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+    """Latest result per plugin recorded in a checkpoint, used to seed --since runs"""
+    if not checkpoint or not checkpoint.exists():
+        return {}
+    session = checkpoint_manager.load_checkpoint(checkpoint)
+    return {entry["plugin_name"]: entry["results"] for entry in session.get("plugins_analyzed", [])}
+
+
+def _load_config(config_path: Path) -> Dict[str, Any]:
+    """Load the analysis configuration, falling back to defaults"""
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+            return json.load(f)
     except FileNotFoundError:
         console.print(f"[red]Configuration file not found: {config_path}[/red]")
-        config_data = {"plugins_dir": "packages", "exclude_patterns": []}
+        return {"plugins_dir": "packages", "exclude_patterns": []}
+
+
+def _execute_session(
+    workspace_root: Path,
+    config_path: Path,
+    plugins: Optional[List[str]],
+    jobs: int,
+    reporter: str,
+    no_cache: bool,
+    strategy: str,
+    daemon: bool,
+    since: Optional[str] = None,
+    previous_results: Optional[Dict[str, Dict[str, Any]]] = None,
+    plugin_filter: Optional[Callable[[List[Path]], List[Path]]] = None,
+    stream_output: bool = False,
+    log_raw_output: bool = False,
+    session_name: Optional[str] = None,
+    tool_overhead: bool = False,
+) -> None:
+    """Set up the Node tooling and run the analysis for the active session"""
+    # Load configuration
+    config_data = _load_config(config_path)
+
+    if strategy not in ("per-plugin", "batch", "async"):
+        console.print(f"[red]Unknown strategy '{strategy}'[/red]")
+        raise typer.Exit(1)
+    if strategy == "batch" and reporter != "json":
+        # Diagnostics can only be routed back to plugins from structured output
+        console.print("[yellow]Batch strategy uses the JSON reporter[/yellow]")
+        reporter = "json"
+
+    # Initialize and setup Node environment
+    console.print("[yellow]Setting up Node.js environment...[/yellow]")
+    analysis_cache = None
+    if not no_cache:
+        analysis_cache = AnalysisCache(
+            max_size_mb=config_data.get("cache", {}).get("max_size_mb", 256)
+        )
+    node_manager = NodeManager(
+        work_dir=str(workspace_root),
+        reporter=reporter,
+        cache=analysis_cache,
+        use_daemon=daemon,
+        stream_output=stream_output,
+        log_raw_output=log_raw_output,
+    )
+    # Every recorded plugin result also goes into the cross-session diagnostics history
+    history = None
+    record_history = None
+    history_config = config_data.get("history", {})
+    if history_config.get("enabled", True) and checkpoint_manager.active_checkpoint:
+        checkpoint = checkpoint_manager.active_checkpoint
+        history = DiagnosticsStore(history_config.get("db_path"))
+        history_session = history.session_id(session_name or checkpoint.stem, str(checkpoint))
+        record_history = lambda plugin_name, result: history.record_plugin(
+            history_session, plugin_name, result
+        )
+    report_index = ReportIndex(Path("reports"))
+
+    try:
+        _run_analysis(
+            node_manager,
+            workspace_root,
+            config_data,
+            plugins,
+            jobs,
+            strategy,
+            since,
+            previous_results or {},
+            plugin_filter,
+            record_history,
+            report_index=report_index,
+        )
+    finally:
+        # Index entries of every report written this session go to disk in one write
+        report_index.flush()
+        node_manager.close()
+        if history:
+            # Optional retention, e.g. a year of nightly runs
+            if history_config.get("keep_sessions"):
+                history.prune(history_config["keep_sessions"])
+            history.close()
+
+    if analysis_cache:
+        stats = analysis_cache.stats()
+        console.print(
+            f"[blue]Analysis cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evicted[/blue]"
+        )
+
+    if not tool_overhead:
+        return
+    # Startup overhead avoided by exec'ing resolved tools instead of going through pnpm
+    for tool, info in node_manager.tools.overhead_report().items():
+        if info["saved_total"] is None:
+            console.print(
+                f"[blue]{tool}: {info['invocations']} direct calls via {info['command']}[/blue]"
+            )
+        else:
+            console.print(
+                f"[blue]{tool}: {info['invocations']} direct calls via {info['command']}, "
+                f"saved ~{info['saved_total']:.1f}s of pnpm startup "
+                f"({info['saved_per_call'] * 1000:.0f}ms per call)[/blue]"
+            )
+
+
+def _run_analysis(
+    node_manager: NodeManager,
+    workspace_root: Path,
+    config_data: Dict[str, Any],
+    plugins: Optional[List[str]],
+    jobs: int,
+    strategy: str,
+    since: Optional[str],
+    previous_results: Dict[str, Dict[str, Any]],
+    plugin_filter: Optional[Callable[[List[Path]], List[Path]]] = None,
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    report_index: Optional[ReportIndex] = None,
+) -> None:
+    """Discover plugins and analyze them, recording progress in the active session.
+
+    `plugin_filter` narrows the discovered plugins, e.g. to those a resumed
+    session still has to analyze. `on_result` is called from this thread with
+    every result that gets checkpointed. Report index entries are staged in
+    `report_index`, which the caller flushes.
+    """
+
+    def record_result(plugin_name: str, analysis_result: Dict[str, Any]) -> None:
+        checkpoint_manager.save_plugin_progress(plugin_name, analysis_result)
+        if on_result:
+            try:
+                on_result(plugin_name, analysis_result)
+            except Exception as e:
+                logger.error(f"Failed to record history for {plugin_name}: {str(e)}")
 
     # Initialize progress tracking
     with Progress(
@@ -171,72 +450,153 @@ def start(
         if plugins:
             plugin_paths = [plugins_dir / p for p in plugins]
         else:
-            # Look for plugins with TypeScript files
-            plugin_paths = []
-            for plugin_dir in plugins_dir.glob("plugin-*"):
-                if list(plugin_dir.glob("**/*.ts")) or list(plugin_dir.glob("**/*.tsx")):
-                    plugin_paths.append(plugin_dir)
-                    console.print(f"[green]Found TypeScript files in {plugin_dir.name}[/green]")
+            # Look for plugins with TypeScript files, pruning excluded directories
+            exclude_patterns = config_data.get("exclude_patterns") or config_data.get(
+                "analysis", {}
+            ).get("exclude_patterns", [])
+            plugin_paths = PluginDiscovery(exclude_patterns).discover(plugins_dir)
+            for plugin_dir in plugin_paths:
+                console.print(f"[green]Found TypeScript files in {plugin_dir.name}[/green]")
 
         if not plugin_paths:
             console.print("[red]No plugins with TypeScript files found![/red]")
             return
 
-        # Create analysis task
-        task = progress.add_task("Analyzing plugins...", total=len(plugin_paths))
-
-        # Analyze each plugin
-        for plugin_path in plugin_paths:
-            progress.update(task, description=f"Analyzing {plugin_path.name}")
+        if plugin_filter:
+            plugin_paths = plugin_filter(plugin_paths)
+            if not plugin_paths:
+                console.print("[green]Nothing left to analyze.[/green]")
+                return
 
+        plugin_changes: Dict[str, PluginChanges] = {}
+        if since:
             try:
-                # Run TypeScript analysis with configuration
-                analysis_result = node_manager.analyze_typescript(str(plugin_path), config=config_data)
-                analysis_result["plugin_name"] = plugin_path.name
-
-                # Generate and save report
-                report_dir = Path("reports")
-                report_dir.mkdir(exist_ok=True)
-
-                # Create report generator
-                report_gen = BiomeReportGenerator()
-
-                # Parse Biome output - pass the entire result as JSON
-                biome_results = analysis_result.get("results", {}).get("biome", {})
-                report_gen.parse_biome_output(
-                    biome_output=json.dumps(biome_results),
-                    plugin_name=plugin_path.name
+                plugin_changes = changed_plugin_files(workspace_root, since, plugins_dir)
+            except Exception as e:
+                console.print(f"[red]Could not compute changes since '{since}': {str(e)}[/red]")
+                raise typer.Exit(1)
+
+            # Untouched plugins carry their previous results into this session unchanged
+            scoped_paths = []
+            for plugin_path in plugin_paths:
+                if plugin_path.name in plugin_changes or plugin_path.name not in previous_results:
+                    scoped_paths.append(plugin_path)
+                else:
+                    record_result(plugin_path.name, previous_results[plugin_path.name])
+            console.print(
+                f"[blue]{len(scoped_paths)} of {len(plugin_paths)} plugins changed since {since}[/blue]"
+            )
+            plugin_paths = scoped_paths
+
+            if not plugin_paths:
+                console.print("[green]No plugin changes to analyze.[/green]")
+                return
+
+        # Batch strategy: one Biome process for every plugin that actually needs linting
+        batch_results: Dict[str, Dict[str, Any]] = {}
+        if strategy == "batch":
+            batch_targets: Dict[str, Optional[List[str]]] = {}
+            for plugin_path in plugin_paths:
+                changes = plugin_changes.get(plugin_path.name)
+                if changes and plugin_path.name in previous_results:
+                    if not changes.changed:
+                        continue
+                    files = changes.changed
+                elif node_manager.has_cached_result(str(plugin_path), config_data):
+                    continue
+                else:
+                    files = None
+                # Plugins with their own biome.json need Biome started from their directory
+                if node_manager.has_own_biome_config(plugin_path):
+                    continue
+                batch_targets[str(plugin_path)] = files
+
+            if batch_targets:
+                batch_task = progress.add_task(
+                    f"Running Biome over {len(batch_targets)} plugins...", total=None
                 )
-
-                # Save report
-                report_gen.save_report(report_dir)
-
-                # Update checkpoint
-                checkpoint_manager.save_plugin_progress(
-                    plugin_path.name,
-                    analysis_result
+                batch_results = node_manager.run_biome_batch(batch_targets, config_data)
+                progress.remove_task(batch_task)
+
+        # Async strategy: full analyses share one event loop; since-scoped plugins still merge per plugin
+        async_results: Dict[str, Dict[str, Any]] = {}
+        if strategy == "async":
+            async_targets = [
+                plugin_path
+                for plugin_path in plugin_paths
+                if not (plugin_path.name in plugin_changes and plugin_path.name in previous_results)
+            ]
+            if async_targets:
+                async_task = progress.add_task(
+                    f"Analyzing {len(async_targets)} plugins asynchronously...", total=None
                 )
-
-            except Exception as e:
-                logger.error(f"Failed to analyze {plugin_path.name}: {str(e)}")
-                checkpoint_manager.add_error(
-                    plugin_path.name,
-                    str(e)
+                results = asyncio.run(
+                    node_manager.analyze_plugins_async([str(p) for p in async_targets], config_data)
                 )
+                async_results = {p.name: result for p, result in zip(async_targets, results)}
+                progress.remove_task(async_task)
 
-            progress.advance(task)
+        # Create analysis task
+        task = progress.add_task("Analyzing plugins...", total=len(plugin_paths))
+        workers = min(jobs, len(plugin_paths))
+        logger.info(f"Analyzing {len(plugin_paths)} plugins with {workers} workers")
+
+        # Analyze plugins concurrently; results are recorded from this thread only,
+        # so checkpoint writes and progress updates never interleave.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bug-hunt") as executor:
+            futures = {
+                executor.submit(
+                    analyze_plugin,
+                    node_manager,
+                    plugin_path,
+                    config_data,
+                    plugin_changes.get(plugin_path.name),
+                    previous_results.get(plugin_path.name),
+                    batch_results.get(plugin_path.name),
+                    async_results.get(plugin_path.name),
+                    report_index,
+                ): plugin_path
+                for plugin_path in plugin_paths
+            }
+
+            for future in as_completed(futures):
+                plugin_path = futures[future]
+                progress.update(task, description=f"Analyzed {plugin_path.name}")
+
+                try:
+                    analysis_result = future.result()
+
+                    # Update checkpoint
+                    record_result(plugin_path.name, analysis_result)
+
+                except Exception as e:
+                    logger.error(f"Failed to analyze {plugin_path.name}: {str(e)}")
+                    checkpoint_manager.add_error(plugin_path.name, str(e))
+
+                progress.advance(task)
 
         progress.update(task, description="Analysis complete!")
 
+
 @app.command()
 def resume(
     session: str = typer.Option(None, "--session", "-s", help="Session name to resume"),
+    retries: int = typer.Option(
+        2, "--retries", min=0, help="Retry budget for plugins that failed in the session"
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of plugins to analyze concurrently (defaults to CPU count)",
+    ),
 ):
     """Resume a previous analysis session."""
     if not session:
         # List available sessions
-        checkpoints = list(Path("checkpoints").glob("*.json"))
-        if not checkpoints:
+        sessions = checkpoint_manager.list_sessions()
+        if not sessions:
             console.print("[red]No previous sessions found![/red]")
             raise typer.Exit(1)
 
@@ -245,25 +605,75 @@ def resume(
         table.add_column("Last Updated")
         table.add_column("Plugins Analyzed")
 
-        for checkpoint in checkpoints:
-            with open(checkpoint, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                table.add_row(
-                    data["session_name"],
-                    data["last_updated"],
-                    str(len(data["plugins_analyzed"]))
-                )
+        for session_info in sessions:
+            table.add_row(
+                session_info["session_name"],
+                session_info["last_updated"],
+                str(session_info["plugins_analyzed"]),
+            )
 
         console.print(table)
         session = Prompt.ask("Enter session name to resume")
 
-    checkpoint = checkpoint_manager.load_latest_session(session)
+    checkpoint = checkpoint_manager.resume_session(session)
     if not checkpoint:
         console.print(f"[red]Session '{session}' not found![/red]")
         raise typer.Exit(1)
 
     logger.info(f"Resumed session: {session}")
-    # TODO: Continue analysis from checkpoint
+
+    # Latest record per plugin wins; invalidated plugins are re-recorded later in the journal
+    analyzed = {entry["plugin_name"]: entry for entry in checkpoint.get("plugins_analyzed", [])}
+    failures = Counter(error["plugin_name"] for error in checkpoint.get("errors", []))
+
+    def pending_plugins(plugin_paths: List[Path]) -> List[Path]:
+        """Plugins the session still has to (re)analyze"""
+        pending = []
+        for plugin_path in plugin_paths:
+            entry = analyzed.get(plugin_path.name)
+            if entry:
+                stored_hash = entry.get("results", {}).get("source_hash")
+                if stored_hash and stored_hash != hash_plugin_sources(plugin_path):
+                    console.print(
+                        f"[yellow]{plugin_path.name} changed since it was checkpointed[/yellow]"
+                    )
+                    pending.append(plugin_path)
+                continue
+            if failures[plugin_path.name] > retries:
+                console.print(
+                    f"[red]Skipping {plugin_path.name}: failed {failures[plugin_path.name]} times[/red]"
+                )
+                continue
+            pending.append(plugin_path)
+
+        console.print(
+            f"[blue]{len(pending)} plugins pending, {len(analyzed)} already analyzed[/blue]"
+        )
+        return pending
+
+    # Continue with the options the session was started with
+    options = checkpoint.get("options", {})
+    since = options.get("since")
+    previous_checkpoint = options.get("previous_checkpoint")
+    _execute_session(
+        workspace_root=Path(__file__).parent.parent.parent,
+        config_path=Path(options.get("config_path", "config/analysis.config.json")),
+        plugins=options.get("plugins"),
+        jobs=jobs,
+        reporter=options.get("reporter", "verbose"),
+        no_cache=options.get("no_cache", False),
+        strategy=options.get("strategy", "per-plugin"),
+        daemon=options.get("daemon", False),
+        since=since,
+        previous_results=(
+            _previous_results(Path(previous_checkpoint)) if since and previous_checkpoint else {}
+        ),
+        plugin_filter=pending_plugins,
+        stream_output=options.get("stream_output", False),
+        log_raw_output=options.get("log_raw_output", False),
+        session_name=checkpoint.get("session_name"),
+    )
+
 
 @app.command()
 def view_reports(
@@ -275,44 +685,212 @@ def view_reports(
         console.print("[red]No reports found![/red]")
         raise typer.Exit(1)
 
+    index = ReportIndex(reports_dir)
     if plugin:
-        report_file = reports_dir / f"{plugin}_report.md"
+        entry = index.get(plugin)
+        report_file = reports_dir / (entry["report"] if entry else f"{plugin}_report.md")
         if not report_file.exists():
             console.print(f"[red]No report found for plugin '{plugin}'![/red]")
             raise typer.Exit(1)
 
-        with open(report_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Use rich's Markdown renderer
-            console.print(Markdown(content))
+        # Render section by section so huge reports show their summary immediately
+        page_report(console, report_file)
     else:
         # List all reports
         table = Table(title="Available Reports")
         table.add_column("Plugin")
         table.add_column("Last Updated")
         table.add_column("Issues Found")
-
-        for report in reports_dir.glob("*_report.md"):
-            # TODO: Parse report metadata
-            table.add_row(report.stem.replace("_report", ""), "N/A", "N/A")
+        table.add_column("Top Rules")
+        table.add_column("Size", justify="right")
+
+        # Everything comes from the index; the reports themselves are never opened
+        entries = index.entries()
+        for name, entry in sorted(entries.items()):
+            severities = entry.get("issues_by_severity", {})
+            issues = f"{entry.get('total_issues', 0)} ({severities.get('error', 0)} errors, {severities.get('warning', 0)} warnings)"
+            top_rules = ", ".join(
+                f"{rule} ({count})" for rule, count in entry.get("top_rules", [])[:3]
+            )
+            table.add_row(
+                name,
+                entry.get("timestamp", "")[:19].replace("T", " "),
+                issues,
+                top_rules,
+                f"{entry.get('size', 0) / 1024:.1f} KB",
+            )
+
+        # Reports written before the index existed
+        indexed = {entry.get("report") for entry in entries.values()}
+        for report in sorted(reports_dir.glob("*_report.md")):
+            if report.name not in indexed:
+                table.add_row(report.stem.replace("_report", ""), "N/A", "N/A", "", "")
 
         console.print(table)
 
+
+def _open_history(backfill: bool, config_path: Path) -> DiagnosticsStore:
+    """Open the diagnostics history, optionally importing checkpoints it has not seen"""
+    history = DiagnosticsStore(_load_config(config_path).get("history", {}).get("db_path"))
+    if backfill:
+        imported = 0
+        for session_info in checkpoint_manager.list_sessions():
+            if not history.has_session(session_info["path"]):
+                history.import_session(
+                    session_info["path"],
+                    checkpoint_manager.load_checkpoint(Path(session_info["path"])),
+                )
+                imported += 1
+        console.print(f"[blue]Imported {imported} checkpointed sessions into the history[/blue]")
+    return history
+
+
+@app.command()
+def query(
+    group_by: str = typer.Option(
+        "rule", "--group-by", "-g", help="Group counts by plugin, file, rule or severity"
+    ),
+    plugin: Optional[str] = typer.Option(
+        None, "--plugin", "-p", help="Only this plugin (trailing * for a prefix)"
+    ),
+    rule: Optional[str] = typer.Option(
+        None, "--rule", "-r", help="Only this rule (trailing * for a prefix)"
+    ),
+    severity: Optional[str] = typer.Option(None, "--severity", help="Only this severity"),
+    file: Optional[str] = typer.Option(
+        None, "--file", "-f", help="Only this file (trailing * for a prefix)"
+    ),
+    session: Optional[str] = typer.Option(
+        None, "--session", "-s", help="Session name; defaults to the latest"
+    ),
+    limit: int = typer.Option(50, "--limit", "-n", min=1, help="Maximum number of rows"),
+    backfill: bool = typer.Option(
+        False, "--backfill", help="Import checkpoints missing from the history first"
+    ),
+    config_path: Path = typer.Option(
+        Path("config/analysis.config.json"),
+        "--config",
+        "-c",
+        help="Analysis configuration file naming the history database",
+    ),
+):
+    """Count diagnostics in a recorded session."""
+    if group_by not in GROUP_COLUMNS:
+        console.print(
+            f"[red]Cannot group by '{group_by}', expected one of {', '.join(GROUP_COLUMNS)}[/red]"
+        )
+        raise typer.Exit(1)
+
+    history = _open_history(backfill, config_path)
+    try:
+        latest = history.latest_session(session)
+        if not latest:
+            console.print("[red]No sessions recorded in the history![/red]")
+            raise typer.Exit(1)
+        session_id, session_name, started_at = latest
+
+        rows = history.query(
+            session_id,
+            group_by=group_by,
+            limit=limit,
+            plugin=plugin,
+            rule=rule,
+            severity=severity,
+            file=file,
+        )
+    finally:
+        history.close()
+
+    table = Table(title=f"Diagnostics in {session_name} ({started_at[:19].replace('T', ' ')})")
+    table.add_column(group_by.capitalize())
+    table.add_column("Count", justify="right")
+    for value, count in rows:
+        table.add_row(value, str(count))
+    console.print(table)
+
+
+@app.command()
+def trends(
+    plugin: Optional[str] = typer.Option(
+        None, "--plugin", "-p", help="Only this plugin (trailing * for a prefix)"
+    ),
+    rule: Optional[str] = typer.Option(
+        None, "--rule", "-r", help="Only this rule (trailing * for a prefix)"
+    ),
+    severity: Optional[str] = typer.Option(None, "--severity", help="Only this severity"),
+    file: Optional[str] = typer.Option(
+        None, "--file", "-f", help="Only this file (trailing * for a prefix)"
+    ),
+    last: int = typer.Option(30, "--last", "-n", min=1, help="Number of most recent sessions"),
+    backfill: bool = typer.Option(
+        False, "--backfill", help="Import checkpoints missing from the history first"
+    ),
+    config_path: Path = typer.Option(
+        Path("config/analysis.config.json"),
+        "--config",
+        "-c",
+        help="Analysis configuration file naming the history database",
+    ),
+):
+    """Show how diagnostic counts changed over recent sessions."""
+    history = _open_history(backfill, config_path)
+    try:
+        rows = history.trends(last=last, plugin=plugin, rule=rule, severity=severity, file=file)
+    finally:
+        history.close()
+
+    if not rows:
+        console.print("[red]No sessions recorded in the history![/red]")
+        raise typer.Exit(1)
+
+    table = Table(title="Diagnostic Trends")
+    table.add_column("Session")
+    table.add_column("Started")
+    table.add_column("Count", justify="right")
+    table.add_column("Change", justify="right")
+    previous = None
+    for session_name, started_at, count in rows:
+        if count is None:
+            table.add_row(session_name, started_at[:19].replace("T", " "), "-", "")
+            continue
+        change = "" if previous is None else f"{count - previous:+d}"
+        table.add_row(session_name, started_at[:19].replace("T", " "), str(count), change)
+        previous = count
+    console.print(table)
+
+
 def main():
     """Main entry point for the CLI."""
     try:
         action, params = show_main_menu()
         if action == "start":
             # Call start with default values when coming from menu
-            start(plugins=None, config_path=Path("config/analysis.config.json"))
+            start(
+                plugins=None,
+                config_path=Path("config/analysis.config.json"),
+                jobs=os.cpu_count() or 1,
+                reporter="verbose",
+                no_cache=False,
+                since=None,
+                strategy="per-plugin",
+                daemon=False,
+                stream_output=False,
+                log_raw_output=False,
+                tool_overhead=False,
+            )
         elif action == "resume":
-            resume()
+            resume(session=None, retries=2, jobs=os.cpu_count() or 1)
         elif action == "reports":
-            view_reports()
+            # List the reports, then open the chosen one in the pager
+            view_reports(plugin=params)
+            if not params:
+                plugin = Prompt.ask("Plugin report to open (blank to exit)", default="")
+                if plugin:
+                    view_reports(plugin=plugin)
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
         console.print_exception()
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
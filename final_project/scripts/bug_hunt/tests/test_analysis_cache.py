@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from utils.analysis_cache import AnalysisCache, hash_plugin_sources
+from utils.diagnostics import DiagnosticTable
+
+
+def result(size=0):
+    diagnostics = DiagnosticTable()
+    diagnostics.append("src/index.ts", 1, 1, "error", "noAny", "x" * size)
+    return {"success": False, "results": {"biome": {"diagnostics": diagnostics}}}
+
+
+def disk_size(cache):
+    return sum(path.stat().st_size for path in cache.cache_dir.glob("*.json"))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AnalysisCache(tmp_path / "cache")
+
+
+def test_hit_and_miss_are_counted(cache):
+    assert cache.get("plugin-a", "k1") is None
+    cache.put("plugin-a", "k1", result())
+    cached = cache.get("plugin-a", "k1")
+    assert isinstance(cached["results"]["biome"]["diagnostics"], DiagnosticTable)
+    assert cache.contains("plugin-a", "k1")
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_put_replaces_stale_entries_of_the_same_plugin(cache):
+    cache.put("plugin-a", "k1", result())
+    cache.put("plugin-b", "k1", result())
+    cache.put("plugin-a", "k2", result(100))
+    assert sorted(p.name for p in cache.cache_dir.glob("*.json")) == [
+        "plugin-a--k2.json",
+        "plugin-b--k1.json",
+    ]
+    assert cache._size == disk_size(cache)
+
+
+def test_existing_entries_are_listed_once(tmp_path, monkeypatch):
+    AnalysisCache(tmp_path / "cache").put("plugin-a", "k1", result())
+    cache = AnalysisCache(tmp_path / "cache")
+    scans = []
+    original = cache._scan
+    monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or original())
+    for key in ("k2", "k3", "k4"):
+        cache.put("plugin-a", key, result())
+        cache.put("plugin-b", key, result())
+    assert scans == [1]
+    assert len(list(cache.cache_dir.glob("*.json"))) == 2
+    assert cache._size == disk_size(cache)
+
+
+def test_evicts_least_recently_used_over_budget(cache):
+    for index, name in enumerate(("plugin-a", "plugin-b", "plugin-c")):
+        cache.put(name, "k", result(200))
+        os.utime(cache._entry_path(name, "k"), (index, index))
+    entry_size = cache._entry_path("plugin-a", "k").stat().st_size
+    cache.max_size_bytes = entry_size * 3 + entry_size // 2
+
+    # A hit makes plugin-a the most recently used entry
+    assert cache.get("plugin-a", "k") is not None
+    cache.put("plugin-d", "k", result(200))
+    assert not cache.contains("plugin-b", "k")
+    assert all(cache.contains(name, "k") for name in ("plugin-a", "plugin-c", "plugin-d"))
+    assert cache.stats()["evictions"] == 1
+    assert cache._size == disk_size(cache) <= cache.max_size_bytes
+
+
+def test_compute_key_tracks_sources_config_and_tools(cache, tmp_path):
+    plugin = tmp_path / "plugin"
+    (plugin / "src").mkdir(parents=True)
+    (plugin / "node_modules").mkdir()
+    source = plugin / "src" / "index.ts"
+    source.write_text("export const a = 1;\n")
+    key = cache.compute_key(plugin, {}, [], {"biome": "1.0"})
+
+    (plugin / "node_modules" / "dep.js").write_text("ignored")
+    assert cache.compute_key(plugin, {}, [], {"biome": "1.0"}) == key
+    assert cache.compute_key(plugin, {}, [], {"biome": "1.0"}, hash_plugin_sources(plugin)) == key
+    assert cache.compute_key(plugin, {"strict": True}, [], {"biome": "1.0"}) != key
+    assert cache.compute_key(plugin, {}, [], {"biome": "2.0"}) != key
+    source.write_text("export const a = 2;\n")
+    assert cache.compute_key(plugin, {}, [], {"biome": "1.0"}) != key
@@ -0,0 +1,158 @@
+import re
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from utils.report_digest import pack_blocks, split_batch_response
+
+
+def test_split_batch_response_tolerates_markdown_markers():
+    response = "## === REPORT 1 ===\nfirst\n\n**=== REPORT 2 ===**\nsecond\n"
+
+    assert split_batch_response(response, 2) == {0: "first", 1: "second"}
+
+
+def test_split_batch_response_drops_missing_empty_and_unknown_sections():
+    response = (
+        "preamble\n=== REPORT 1 ===\none\n=== REPORT 3 ===\n\n=== REPORT 9 ===\nnine\n"
+        "=== REPORT 1 ===\nduplicate\n"
+    )
+
+    assert split_batch_response(response, 3) == {0: "one"}
+
+
+def test_pack_blocks_respects_budget_and_block_limit():
+    assert pack_blocks([3, 3, 3, 3], 7, size=lambda n: n) == [[3, 3], [3, 3]]
+    assert pack_blocks([1, 1, 1, 1, 1], 100, max_blocks=2, size=lambda n: n) == [
+        [1, 1],
+        [1, 1],
+        [1],
+    ]
+    # A block larger than the budget still gets a chunk of its own
+    assert pack_blocks([2, 50, 2], 10, size=lambda n: n) == [[2], [50], [2]]
+
+
+class FakeAgent:
+    """Stand-in agent answering batched prompts section by section"""
+
+    def __init__(self, calls, fail_batches=False, skip_reports=()):
+        self.calls = calls
+        self.fail_batches = fail_batches
+        self.skip_reports = set(skip_reports)
+        self.model = None
+
+    def run(self, prompt, stream=False):
+        self.calls.append(prompt)
+        ids = re.findall(r'<report id="(\d+)">\n(.*?)\n</report>', prompt, re.DOTALL)
+        if not ids:
+            return f"analysis of {prompt}"
+        if self.fail_batches:
+            raise ValueError("bad request")
+        return "\n".join(
+            f"=== REPORT {report_id} ===\nanalysis of {payload}"
+            for report_id, payload in ids
+            if payload not in self.skip_reports
+        )
+
+
+def stub_module(monkeypatch, name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+@pytest.fixture
+def make_workflow(tmp_path, monkeypatch):
+    # The workflow only talks to FakeAgent here, so phi and dotenv are stubbed when missing
+    try:
+        import phi.agent
+        import phi.model.deepseek
+    except ImportError:
+        stub_module(monkeypatch, "phi")
+        stub_module(monkeypatch, "phi.model")
+        stub_module(monkeypatch, "phi.agent", Agent=object)
+        stub_module(monkeypatch, "phi.model.deepseek", DeepSeekChat=object)
+    try:
+        import dotenv
+    except ImportError:
+        stub_module(monkeypatch, "dotenv", load_dotenv=lambda *args, **kwargs: False)
+    from utils.agent import BiomeWorkflow
+    from utils.llm_metrics import MetricsRecorder
+
+    def make(**agent_options):
+        calls = []
+        lock = threading.Lock()
+
+        def factory():
+            with lock:
+                return FakeAgent(calls, **agent_options)
+
+        workflow = BiomeWorkflow(
+            agent_factory=factory,
+            use_cache=False,
+            max_retries=0,
+            requests_per_minute=60000,
+            batch_size=10,
+            metrics=MetricsRecorder(tmp_path / "metrics.jsonl"),
+        )
+        return workflow, calls
+
+    return make
+
+
+def test_small_reports_share_one_request(make_workflow):
+    workflow, calls = make_workflow()
+    reports = [f"report {index}" for index in range(5)]
+
+    responses = workflow._analyze_payloads(reports, [f"r{index}" for index in range(5)])
+
+    assert len(calls) == 1
+    assert [response["final_response"] for response in responses] == [
+        f"analysis of {report}" for report in reports
+    ]
+
+
+def test_only_missing_sections_are_retried(make_workflow):
+    workflow, calls = make_workflow(skip_reports={"report 2"})
+    reports = [f"report {index}" for index in range(4)]
+
+    responses = workflow._analyze_payloads(reports)
+
+    assert len(calls) == 2
+    assert calls[1] == "report 2"
+    assert all(response["status"] == "success" for response in responses)
+
+
+def test_failed_batch_is_not_retried_report_by_report(make_workflow):
+    workflow, calls = make_workflow(fail_batches=True)
+    reports = [f"report {index}" for index in range(4)]
+
+    responses = workflow._analyze_payloads(reports)
+
+    assert len(calls) == 1
+    assert all(response["status"] == "failed" for response in responses)
+    assert all("bad request" in response["error"] for response in responses)
+
+
+def test_run_reads_only_plugin_reports(make_workflow, tmp_path):
+    from utils.agent import CONSOLIDATED_PREFIX
+    from utils.reporting import ReportIndex
+
+    reports = tmp_path / "reports"
+    reports.mkdir()
+    for name in ("plugin-a.json", "plugin-b.json", ReportIndex.FILE_NAME):
+        (reports / name).write_text(f'{{"name": "{name}"}}')
+    (reports / f"{CONSOLIDATED_PREFIX}20240101_000000.json").write_text("{}")
+    workflow, calls = make_workflow()
+
+    result = workflow.run(reports)
+
+    assert result["status"] == "success"
+    assert [Path(item["file"]).name for item in result["results"]] == [
+        "plugin-a.json",
+        "plugin-b.json",
+    ]
+    assert not any(ReportIndex.FILE_NAME in prompt for prompt in calls)
@@ -0,0 +1,31 @@
+import sys
+
+from utils.biome_daemon import BiomeDaemon
+
+
+def test_missing_executable_reports_the_daemon_unavailable(tmp_path):
+    daemon = BiomeDaemon(tmp_path, base_cmd=[str(tmp_path / "missing-biome")])
+    assert daemon.start() is False
+    assert daemon.ensure_running() is False
+    assert daemon.restart(daemon.generation) is False
+    assert daemon.running is False
+    daemon.stop()
+
+
+def test_start_restart_and_stop(tmp_path):
+    # Stand-in for the Biome CLI that accepts every subcommand
+    daemon = BiomeDaemon(tmp_path, base_cmd=[sys.executable, "-c", "pass"])
+    assert daemon.ensure_running() is True
+    assert daemon.restart(daemon.generation) is True
+    assert (daemon.generation, daemon.restarts) == (1, 1)
+    # A crash already handled by another check does not restart the server again
+    assert daemon.restart(0) is True
+    assert daemon.restarts == 1
+    daemon.stop()
+    assert daemon.running is False
+
+
+def test_server_failure_signatures():
+    assert BiomeDaemon.is_server_failure("Error: Failed to connect to the server")
+    assert not BiomeDaemon.is_server_failure("lint/style/useConst: 3 errors")
+    assert not BiomeDaemon.is_server_failure(None)
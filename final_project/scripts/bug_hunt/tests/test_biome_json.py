@@ -0,0 +1,121 @@
+import json
+import random
+
+import pytest
+
+from utils.biome_json import BiomeJsonStreamParser
+
+SOURCE = 'const a = "}";\nlet b = 1;\n'
+
+
+def diagnostic(category, severity, description, file="src/index.ts", span=None):
+    location = {"path": {"file": file}}
+    if span is not None:
+        location.update(span=span, sourceCode=SOURCE)
+    return {
+        "category": category,
+        "severity": severity,
+        "description": description,
+        "location": location,
+    }
+
+
+DIAGNOSTICS = [
+    diagnostic(
+        "lint/style/useConst", "error", 'Closing "}" and "]" inside a string', span=[15, 18]
+    ),
+    diagnostic("lint/suspicious/noEscape", "warning", 'Escaped \\" quote, {braces} and [brackets]'),
+    diagnostic("format", "information", "Unicode ✓ message", file="src/other.ts", span=[0, 5]),
+]
+SUMMARY = {"changed": 0, "unchanged": 2, "errors": 1, "warnings": 1}
+
+
+def document(diagnostics=DIAGNOSTICS, summary=SUMMARY):
+    return json.dumps(
+        {"summary": summary, "diagnostics": diagnostics, "command": "check"}, indent=2
+    )
+
+
+def parse(chunks):
+    parser = BiomeJsonStreamParser()
+    diagnostics = [d for chunk in chunks for d in parser.feed(chunk)]
+    return parser, diagnostics, parser.close()
+
+
+def test_parses_whole_document():
+    parser, diagnostics, summary = parse([document()])
+    assert summary == SUMMARY
+    assert [d.rule for d in diagnostics] == [d["category"] for d in DIAGNOSTICS]
+    assert [d.message for d in diagnostics] == [d["description"] for d in DIAGNOSTICS]
+    assert parser.counts == {"error": 1, "warning": 1, "info": 1}
+    assert parser.files == {"src/index.ts", "src/other.ts"}
+
+
+def test_resolves_byte_spans_to_lines_and_columns():
+    _, diagnostics, _ = parse([document()])
+    assert (diagnostics[0].line, diagnostics[0].column) == (2, 1)
+    assert (diagnostics[1].line, diagnostics[1].column) == (0, 0)
+    assert (diagnostics[2].line, diagnostics[2].column) == (1, 1)
+
+
+def test_every_chunk_boundary_gives_the_same_result():
+    text = document()
+    _, expected, _ = parse([text])
+    for split in range(1, len(text)):
+        _, diagnostics, summary = parse([text[:split], text[split:]])
+        assert diagnostics == expected, split
+        assert summary == SUMMARY, split
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_chunk_sizes(seed):
+    text = document()
+    rng = random.Random(seed)
+    chunks, pos = [], 0
+    while pos < len(text):
+        size = rng.randint(1, 40)
+        chunks.append(text[pos : pos + size])
+        pos += size
+    _, expected, _ = parse([text])
+    _, diagnostics, summary = parse(chunks)
+    assert diagnostics == expected
+    assert summary == SUMMARY
+
+
+def test_yields_diagnostics_as_soon_as_they_complete():
+    text = document()
+    cut = text.index('"lint/suspicious/noEscape"')
+    parser = BiomeJsonStreamParser()
+    assert [d.rule for d in parser.feed(text[:cut])] == ["lint/style/useConst"]
+    assert len(list(parser.feed(text[cut:]))) == 2
+
+
+def test_empty_diagnostics_array():
+    parser, diagnostics, summary = parse([document(diagnostics=[])])
+    assert diagnostics == []
+    assert summary == SUMMARY
+    assert parser.counts == {"error": 0, "warning": 0, "info": 0}
+
+
+def test_output_without_diagnostics_key():
+    _, diagnostics, summary = parse([json.dumps({"summary": SUMMARY})])
+    assert diagnostics == []
+    assert summary == SUMMARY
+
+
+def test_invalid_or_empty_output_has_no_summary():
+    assert parse([""])[2] == {}
+    assert parse(['{"summary": {"errors": 1}, "diagnostics": [], "comm'])[2] == {}
+
+
+def test_message_parts_are_joined_without_description():
+    element = {
+        "category": "lint/a",
+        "severity": "hint",
+        "message": [{"content": "Use "}, {"content": "const"}, "ignored"],
+        "location": {"path": "src/a.ts"},
+    }
+    _, [diagnostic], _ = parse([document(diagnostics=[element])])
+    assert diagnostic.message == "Use const"
+    assert diagnostic.file_path == "src/a.ts"
+    assert diagnostic.severity == "info"
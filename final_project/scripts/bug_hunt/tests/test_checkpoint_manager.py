@@ -0,0 +1,134 @@
+import json
+import time
+
+import pytest
+
+from utils.checkpoint_manager import CheckpointManager
+from utils.diagnostics import DiagnosticTable
+
+
+def analysis(message="x"):
+    diagnostics = DiagnosticTable()
+    diagnostics.append("src/index.ts", 3, 1, "error", "noAny", message)
+    return {
+        "success": False,
+        "results": {
+            "biome": {
+                "success": False,
+                "output": "line one\nline two",
+                "errors": "",
+                "diagnostics": diagnostics,
+                "raw_output": "STDOUT:\n...",
+                "all_output": ["line one", "line two"],
+            }
+        },
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return CheckpointManager(tmp_path / "checkpoints")
+
+
+def records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_journal_append_and_replay(manager):
+    checkpoint = manager.start_session("nightly", {"jobs": 4})
+    manager.save_plugin_progress("plugin-a", analysis("first"))
+    manager.add_error("plugin-b", "boom")
+    manager.save_plugin_progress("plugin-c", analysis("second"))
+
+    lines = records(manager.active_checkpoint)
+    assert [line["type"] for line in lines] == ["session", "plugin", "error", "plugin"]
+    # Copies of the Biome output are rebuilt on load rather than journaled
+    assert "raw_output" not in lines[1]["results"]["results"]["biome"]
+
+    data = manager.load_checkpoint(manager.active_checkpoint)
+    assert data["session_name"] == "nightly"
+    assert data["options"] == {"jobs": 4}
+    assert [p["plugin_name"] for p in data["plugins_analyzed"]] == ["plugin-a", "plugin-c"]
+    assert data["errors"][0]["error"] == "boom"
+    assert data["last_updated"] == data["plugins_analyzed"][-1]["analyzed_at"]
+
+    biome = data["plugins_analyzed"][0]["results"]["results"]["biome"]
+    assert isinstance(biome["diagnostics"], DiagnosticTable)
+    assert [d.message for d in biome["diagnostics"]] == ["first"]
+    assert biome["all_output"] == ["line one", "line two"]
+    assert biome["raw_output"].startswith("STDOUT:\nline one")
+    assert checkpoint == str(manager.active_checkpoint)
+
+
+def test_torn_last_line_is_skipped_and_the_next_append_starts_fresh(manager):
+    manager.start_session("crashy")
+    manager.save_plugin_progress("plugin-a", analysis())
+    with open(manager.active_checkpoint, "a", encoding="utf-8") as f:
+        f.write('{"type": "plugin", "plugin_name": "plugin-b", "res')
+
+    data = manager.load_checkpoint(manager.active_checkpoint)
+    assert [p["plugin_name"] for p in data["plugins_analyzed"]] == ["plugin-a"]
+
+    manager.save_plugin_progress("plugin-c", analysis())
+    data = manager.load_checkpoint(manager.active_checkpoint)
+    assert [p["plugin_name"] for p in data["plugins_analyzed"]] == ["plugin-a", "plugin-c"]
+
+
+def test_resume_appends_to_the_latest_journal(manager, tmp_path):
+    manager.start_session("nightly")
+    manager.save_plugin_progress("plugin-a", analysis())
+
+    resumed = CheckpointManager(tmp_path / "checkpoints")
+    data = resumed.resume_session("nightly")
+    assert [p["plugin_name"] for p in data["plugins_analyzed"]] == ["plugin-a"]
+    assert resumed.active_checkpoint == manager.active_checkpoint
+    assert records(resumed.active_checkpoint)[-1]["type"] == "resume"
+    assert resumed.resume_session("missing") is None
+
+
+def test_legacy_json_checkpoint_is_loaded_and_updated(manager):
+    legacy = manager.checkpoints_dir / "old_20240101_000000.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "session_name": "old",
+                "started_at": "2024-01-01T00:00:00",
+                "last_updated": "2024-01-01T00:00:00",
+                "plugins_analyzed": [
+                    {
+                        "plugin_name": "plugin-a",
+                        "results": {
+                            "results": {
+                                "biome": {
+                                    "diagnostics": [{"file": "src/a.ts", "severity": "warning"}]
+                                }
+                            }
+                        },
+                    }
+                ],
+                "errors": [],
+            }
+        )
+    )
+
+    data = manager.resume_session("old")
+    assert data["plugins_analyzed"][0]["plugin_name"] == "plugin-a"
+    assert manager.active_checkpoint == legacy
+
+    manager.save_plugin_progress("plugin-b", analysis())
+    manager.add_error("plugin-c", "boom")
+    data = json.loads(legacy.read_text())
+    assert [p["plugin_name"] for p in data["plugins_analyzed"]] == ["plugin-a", "plugin-b"]
+    assert data["errors"][0]["plugin_name"] == "plugin-c"
+    assert data["last_updated"] != "2024-01-01T00:00:00"
+
+
+def test_list_sessions_oldest_first(manager):
+    manager.start_session("first")
+    time.sleep(0.01)
+    manager.start_session("second")
+    manager.save_plugin_progress("plugin-a", analysis())
+    sessions = manager.list_sessions()
+    assert [s["session_name"] for s in sessions] == ["first", "second"]
+    assert [s["plugins_analyzed"] for s in sessions] == [0, 1]
+    assert manager.latest_checkpoint("first").name.startswith("first_")
@@ -0,0 +1,120 @@
+import json
+import os
+
+import pytest
+
+from utils.dependency_graph import (
+    SpecifierCache,
+    WorkspaceGraph,
+    cyclic_components,
+    find_cycles,
+    lexical_specifiers,
+    parse_specifiers,
+    shortest_cycle,
+    strongly_connected_components,
+)
+
+
+def test_strongly_connected_components_groups_cycles():
+    graph = {"a": ["b"], "b": ["c"], "c": ["a", "d"], "d": ["e"], "e": ["d"], "f": []}
+    components = sorted(sorted(c) for c in strongly_connected_components(graph))
+    assert components == [["a", "b", "c"], ["d", "e"], ["f"]]
+
+
+def test_strongly_connected_components_emits_sinks_first():
+    graph = {"a": ["b"], "b": ["c"], "c": []}
+    assert strongly_connected_components(graph) == [["c"], ["b"], ["a"]]
+
+
+def test_strongly_connected_components_follows_nodes_missing_from_graph():
+    assert strongly_connected_components({"a": ["missing"]}) == [["missing"], ["a"]]
+
+
+def test_strongly_connected_components_handles_deep_chains():
+    depth = 20000
+    graph = {i: [i + 1] for i in range(depth)}
+    graph[depth] = [0]
+    [component] = strongly_connected_components(graph)
+    assert len(component) == depth + 1
+
+
+def test_cyclic_components_keeps_self_imports_only():
+    graph = {"a": ["a"], "b": ["c"], "c": []}
+    assert cyclic_components(graph) == [["a"]]
+
+
+def test_shortest_cycle_prefers_fewest_hops():
+    graph = {"a": ["b", "d"], "b": ["c"], "c": ["a"], "d": ["a"]}
+    assert shortest_cycle(graph, "a", {"a", "b", "c", "d"}) == ["a", "d"]
+
+
+def test_shortest_cycle_stays_inside_members():
+    graph = {"a": ["x", "b"], "x": ["a"], "b": ["a"]}
+    assert shortest_cycle(graph, "a", {"a", "b"}) == ["a", "b"]
+
+
+def test_find_cycles_one_per_component():
+    graph = {"a": ["b"], "b": ["a"], "c": ["d"], "d": ["e"], "e": ["c"], "f": ["f"], "g": ["a"]}
+    cycles = sorted(find_cycles(graph))
+    assert cycles == [["a", "b"], ["c", "d", "e"], ["f"]]
+
+
+def test_find_cycles_acyclic_graph():
+    assert find_cycles({"a": ["b"], "b": []}) == []
+
+
+def test_parse_specifiers_javascript():
+    source = """
+    import a from "./a";
+    export * from './b';
+    const c = require("./c");
+    import("./d");
+    // import e from "./e";
+    const s = "import f from './f'";
+    import a2 from "./a";
+    """
+    assert parse_specifiers(source) == ["./a", "./b", "./c", "./d"]
+
+
+@pytest.mark.parametrize("suffix", [".ts", ".js"])
+def test_parse_specifiers_falls_back_for_typescript(suffix):
+    source = 'import type { A } from "./types";\nconst x: A = require(`./x`);\n'
+    assert parse_specifiers(source, suffix) == ["./types", "./x"]
+
+
+def test_lexical_specifiers_skip_comments_and_strings():
+    source = "/* import a from './a' */ const t = `require('./t')`; export { b } from './b';"
+    assert lexical_specifiers(source) == ["./b"]
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "package.json").write_text(json.dumps({"workspaces": ["packages/*"]}))
+    for name, source in (("a", 'import "b";\n'), ("b", 'import "a";\n')):
+        package = tmp_path / "packages" / name
+        (package / "src").mkdir(parents=True)
+        (package / "package.json").write_text(json.dumps({"name": name, "main": "src/index.ts"}))
+        (package / "src" / "index.ts").write_text(source)
+    return tmp_path
+
+
+def test_workspace_graph_contains_without_building(workspace):
+    graph = WorkspaceGraph(workspace, cache=SpecifierCache(workspace / "specifiers.json"))
+    assert graph.contains(workspace / "packages" / "a")
+    assert not graph.contains(workspace / "packages")
+    assert not graph.built
+
+
+def test_workspace_fingerprint_tracks_other_packages(workspace):
+    cache = SpecifierCache(workspace / "specifiers.json")
+    graph = WorkspaceGraph(workspace, cache=cache)
+    report = graph.plugin_report(workspace / "packages" / "a")
+    assert report["dependencies"] == [["src/index.ts", "../b/src/index.ts"]]
+    assert report["workspace_fingerprint"] == WorkspaceGraph(workspace, cache=cache).fingerprint()
+
+    source = workspace / "packages" / "b" / "src" / "index.ts"
+    source.write_text("export {};\n")
+    os.utime(source, ns=(0, 0))
+    assert WorkspaceGraph(workspace, cache=cache).fingerprint() != report["workspace_fingerprint"]
+    # Computed once per session, like the graph itself
+    assert graph.fingerprint() == report["workspace_fingerprint"]
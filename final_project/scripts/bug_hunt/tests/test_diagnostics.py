@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from utils.diagnostics import BiomeDiagnostic, DiagnosticTable, hydrate_result, json_default
+
+
+@pytest.fixture
+def table():
+    table = DiagnosticTable()
+    table.append("src/b.ts", 3, 1, "warning", "noVar", "second")
+    table.append("src/a.ts", 7, 4, "error", "noAny", "first", ["let x: any"])
+    table.append("src/a.ts", 2, 9, "error", "noAny", "third")
+    table.append("src/b.ts", 1, 1, "info", "useConst", "fourth")
+    return table
+
+
+def test_append_interns_paths_and_rules(table):
+    assert len(table) == 4
+    assert table.paths == ["src/b.ts", "src/a.ts"]
+    assert table.rules == ["noVar", "noAny", "useConst"]
+    assert table.row(1) == BiomeDiagnostic(
+        "first", "src/a.ts", 7, 4, "error", "noAny", ["let x: any"]
+    )
+
+
+def test_append_clamps_positions_and_unknown_severity():
+    table = DiagnosticTable()
+    table.append("src/a.ts", -1, None, "fatal", "rule", None)
+    assert table.row(0) == BiomeDiagnostic("", "src/a.ts", 0, 0, "warning", "rule")
+
+
+def test_json_round_trip(table):
+    restored = DiagnosticTable.from_json(json.loads(json.dumps(table.to_json())))
+    assert list(restored) == list(table)
+    # Interning survives, so appending a known path reuses its id
+    restored.append("src/a.ts", 1, 1, "error", "noAny", "fifth")
+    assert restored.paths == table.paths
+    assert restored.file_ids[-1] == 1
+
+
+def test_json_default_serializes_tables(table):
+    text = json.dumps({"diagnostics": table}, default=json_default)
+    assert DiagnosticTable.coerce(json.loads(text)["diagnostics"]).messages == table.messages
+    with pytest.raises(TypeError):
+        json.dumps({"value": object()}, default=json_default)
+
+
+def test_from_dicts_reads_legacy_checkpoints():
+    table = DiagnosticTable.from_dicts(
+        [
+            {"file": "src/a.ts", "line": 5, "column": 2, "severity": "error", "rule": "r"},
+            {"file": "src/a.ts", "message": "m", "code_snippet": []},
+        ]
+    )
+    assert list(table) == [
+        BiomeDiagnostic("", "src/a.ts", 5, 2, "error", "r"),
+        BiomeDiagnostic("m", "src/a.ts", 0, 0, "warning", ""),
+    ]
+
+
+def test_coerce(table):
+    assert DiagnosticTable.coerce(table) is table
+    assert list(DiagnosticTable.coerce(table.to_json())) == list(table)
+    assert len(DiagnosticTable.coerce([{"file": "src/a.ts"}])) == 1
+    assert len(DiagnosticTable.coerce(None)) == 0
+    assert len(DiagnosticTable.coerce({"diagnostics": []})) == 0
+
+
+def test_counts_and_files_skip_files(table):
+    assert table.counts() == {"error": 2, "warning": 1, "info": 1}
+    assert table.counts(skip_files={"src/a.ts", "src/missing.ts"}) == {
+        "error": 0,
+        "warning": 1,
+        "info": 1,
+    }
+    assert table.files() == ["src/a.ts", "src/b.ts"]
+    assert table.files(skip_files={"src/b.ts"}) == ["src/a.ts"]
+
+
+def test_extend_skips_files_and_keeps_snippets(table):
+    merged = DiagnosticTable()
+    merged.append("src/c.ts", 1, 1, "error", "noAny", "own")
+    merged.extend(table, skip_files=["src/b.ts"])
+    assert [d.message for d in merged] == ["own", "first", "third"]
+    assert merged.rules == ["noAny"]
+    assert merged.row(1).code_snippet == ["let x: any"]
+    assert merged.row(2).code_snippet is None
+
+
+def test_group_by_file_and_rule_is_sorted(table):
+    assert table.group_by_file_and_rule() == {
+        "src/a.ts": {"noAny": [2, 1]},
+        "src/b.ts": {"noVar": [0], "useConst": [3]},
+    }
+    assert list(table.group_by_file_and_rule(skip_files=["src/a.ts"])) == ["src/b.ts"]
+
+
+def test_hydrate_result_restores_table(table):
+    result = {"results": {"biome": {"diagnostics": table.to_json()}}}
+    assert isinstance(hydrate_result(result)["results"]["biome"]["diagnostics"], DiagnosticTable)
+    assert hydrate_result({"results": {}}) == {"results": {}}
@@ -0,0 +1,124 @@
+import pytest
+
+from utils.diagnostics import DiagnosticTable
+from utils.diagnostics_store import DiagnosticsStore
+
+
+def result(*rows, summary=None):
+    diagnostics = DiagnosticTable()
+    for file_path, rule, severity in rows:
+        diagnostics.append(file_path, 1, 1, severity, rule, f"{rule} in {file_path}")
+    biome = {"diagnostics": diagnostics}
+    if summary is not None:
+        biome["summary"] = summary
+    return {"results": {"biome": biome}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DiagnosticsStore(tmp_path / "history.db")
+    yield store
+    store.close()
+
+
+def session(store, name, day):
+    return store.session_id(name, f"checkpoints/{name}.jsonl", f"2024-01-{day:02d}T00:00:00")
+
+
+def test_insert_and_query_round_trip(store):
+    sid = session(store, "nightly", 1)
+    store.record_plugin(
+        sid,
+        "plugin-a",
+        result(
+            ("src/a.ts", "noAny", "error"),
+            ("src/a.ts", "noAny", "error"),
+            ("src/b.ts", "useConst", "warning"),
+            ("Summary", "summary", "info"),
+        ),
+    )
+    store.record_plugin(sid, "plugin-b", result(("src/a.ts", "noAny", "warning")))
+
+    assert store.query(sid, group_by="rule") == [("noAny", 3), ("useConst", 1)]
+    assert store.query(sid, group_by="file", plugin="plugin-a") == [
+        ("src/a.ts", 2),
+        ("src/b.ts", 1),
+    ]
+    assert store.query(sid, group_by="plugin", rule="noAny") == [("plugin-a", 2), ("plugin-b", 1)]
+    assert store.query(sid, group_by="rule", file="src/*", severity="warning") == [
+        ("noAny", 1),
+        ("useConst", 1),
+    ]
+    assert store.query(sid, group_by="plugin", plugin="plugin-*", limit=1) == [("plugin-a", 3)]
+
+
+def test_totals_include_diagnostics_biome_did_not_print(store):
+    sid = session(store, "nightly", 1)
+    store.record_plugin(
+        sid,
+        "plugin-a",
+        result(("src/a.ts", "noAny", "error"), summary={"errors": 40, "warnings": 2, "infos": 0}),
+    )
+    assert store.query(sid, group_by="severity") == [("error", 40), ("warning", 2)]
+    assert store.query(sid, group_by="plugin", severity="error") == [("plugin-a", 40)]
+    # Rule filters need the individual rows
+    assert store.query(sid, group_by="severity", rule="noAny") == [("error", 1)]
+
+
+def test_recording_a_plugin_again_replaces_its_rows(store):
+    sid = session(store, "nightly", 1)
+    store.record_plugin(sid, "plugin-a", result(("src/a.ts", "noAny", "error")))
+    store.record_plugin(sid, "plugin-a", result(("src/a.ts", "useConst", "warning")))
+    assert store.query(sid, group_by="rule") == [("useConst", 1)]
+    assert session(store, "nightly", 1) == sid
+
+
+def test_trends_per_session(store):
+    for day, errors in ((1, 3), (2, 1)):
+        sid = session(store, f"run-{day}", day)
+        rows = [("src/a.ts", "noAny", "error")] * errors
+        store.record_plugin(sid, "plugin-a", result(*rows))
+    session(store, "run-3", 3)
+
+    assert store.trends(plugin="plugin-a") == [
+        ("run-1", "2024-01-01T00:00:00", 3),
+        ("run-2", "2024-01-02T00:00:00", 1),
+        ("run-3", "2024-01-03T00:00:00", None),
+    ]
+    assert [count for _, _, count in store.trends(plugin="plugin-a", rule="noAny")] == [3, 1, None]
+    assert [count for _, _, count in store.trends(last=2, rule="noAny")] == [1, 0]
+    assert store.latest_session()[1] == "run-3"
+    assert store.latest_session("run-1")[1] == "run-1"
+
+
+def test_import_session_from_checkpoint(store):
+    data = {
+        "session_name": "old",
+        "started_at": "2023-12-31T00:00:00",
+        "plugins_analyzed": [
+            {
+                "plugin_name": "plugin-a",
+                "analyzed_at": "2023-12-31T01:00:00",
+                "results": result(("src/a.ts", "noAny", "error")),
+            }
+        ],
+    }
+    sid = store.import_session("checkpoints/old.jsonl", data)
+    assert store.has_session("checkpoints/old.jsonl")
+    assert store.query(sid, group_by="plugin") == [("plugin-a", 1)]
+
+
+def test_prune_keeps_the_newest_sessions(store):
+    ids = []
+    for day in (3, 1, 2):
+        sid = session(store, f"run-{day}", day)
+        store.record_plugin(sid, "plugin-a", result(("src/a.ts", "noAny", "error")))
+        ids.append(sid)
+
+    assert store.prune(2) == 1
+    assert [name for name, _, _ in store.trends()] == ["run-2", "run-3"]
+    assert store.query(ids[1], group_by="rule") == []
+    assert store.query(ids[0], group_by="rule") == [("noAny", 1)]
+    for table in ("sessions", "plugin_runs", "diagnostics"):
+        assert store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 2
+    assert store.prune(2) == 0
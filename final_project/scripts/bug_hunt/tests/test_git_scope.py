@@ -0,0 +1,123 @@
+from utils.diagnostics import DiagnosticTable
+from utils.git_scope import PluginChanges, merge_analysis_results, merge_biome_results
+
+
+def table(*rows):
+    diagnostics = DiagnosticTable()
+    for file_path, severity in rows:
+        diagnostics.append(file_path, 1, 1, severity, "rule", f"{severity} in {file_path}")
+    return diagnostics
+
+
+def biome(rows, summary=None, success=None):
+    diagnostics = table(*rows)
+    result = {"diagnostics": diagnostics}
+    if summary is not None:
+        result["summary"] = summary
+    if success is None:
+        success = diagnostics.counts()["error"] == 0
+    result["success"] = success
+    return result
+
+
+PREVIOUS = biome(
+    [
+        ("src/touched.ts", "error"),
+        ("src/touched.ts", "warning"),
+        ("src/deleted.ts", "error"),
+        ("src/kept.ts", "warning"),
+        ("src/kept.ts", "info"),
+    ],
+    summary={
+        "errors": 2,
+        "warnings": 2,
+        "infos": 1,
+        "files": ["src/deleted.ts", "src/kept.ts", "src/quiet.ts", "src/touched.ts"],
+    },
+    success=False,
+)
+
+
+def test_touched_rows_are_replaced_and_untouched_rows_kept():
+    fresh = biome([("src/touched.ts", "warning")], summary={"errors": 0, "warnings": 1})
+    merged = merge_biome_results(PREVIOUS, fresh, {"src/touched.ts", "src/deleted.ts"})
+
+    assert [(d.file_path, d.severity) for d in merged["diagnostics"]] == [
+        ("src/kept.ts", "warning"),
+        ("src/kept.ts", "info"),
+        ("src/touched.ts", "warning"),
+    ]
+    assert merged["merged_from_previous"] == 2
+    assert merged["summary"]["errors"] == 0
+    assert merged["summary"]["warnings"] == 2
+    assert merged["summary"]["infos"] == 1
+    assert merged["summary"]["files"] == ["src/kept.ts", "src/quiet.ts", "src/touched.ts"]
+    assert merged["success"] is True
+
+
+def test_untouched_errors_keep_the_merge_failing():
+    fresh = biome([], summary={"errors": 0, "warnings": 0}, success=True)
+    merged = merge_biome_results(PREVIOUS, fresh, {"src/touched.ts"})
+
+    assert merged["summary"]["errors"] == 1
+    assert merged["success"] is False
+
+
+def test_diagnostics_biome_did_not_print_are_kept():
+    previous = biome(
+        [("src/a.ts", "error"), ("src/b.ts", "error")],
+        summary={"errors": 5, "warnings": 0, "infos": 0, "diagnostics_not_printed": 3},
+        success=False,
+    )
+    fresh = biome(
+        [("src/a.ts", "warning")],
+        summary={"errors": 0, "warnings": 4, "infos": 0, "diagnostics_not_printed": 3},
+    )
+    merged = merge_biome_results(previous, fresh, {"src/a.ts"})
+
+    # Four errors were never printed for untouched files, or for src/b.ts
+    assert merged["summary"]["errors"] == 4
+    assert merged["summary"]["warnings"] == 4
+    assert merged["summary"]["diagnostics_not_printed"] == 6
+    assert merged["success"] is False
+
+
+def test_counts_fall_back_to_rows_and_skip_summary_rows():
+    previous = biome([("src/a.ts", "error"), ("Summary", "error")], success=False)
+    fresh = biome([("src/a.ts", "warning"), ("Summary", "info")])
+    merged = merge_biome_results(previous, fresh, {"src/a.ts"})
+
+    assert merged["summary"]["errors"] == 0
+    assert merged["summary"]["warnings"] == 1
+    assert merged["summary"]["files"] == ["src/a.ts"]
+    assert merged["success"] is True
+
+
+def test_a_broken_fresh_run_fails_the_merge():
+    fresh = {"success": False, "errors": "server crashed", "diagnostics": DiagnosticTable()}
+    merged = merge_biome_results(biome([("src/a.ts", "warning")]), fresh, {"src/b.ts"})
+    assert merged["summary"]["errors"] == 0
+    assert merged["success"] is False
+
+
+def test_analysis_success_comes_from_merged_results():
+    changes = PluginChanges("plugin", changed=["src/touched.ts"])
+    fresh = {
+        "success": True,
+        "results": {
+            "biome": biome([], summary={"errors": 0, "warnings": 0}),
+            "dependencies": {"success": True, "dependencies": []},
+        },
+    }
+    previous = {"success": False, "results": {"biome": PREVIOUS}}
+    merged = merge_analysis_results(previous, fresh, changes)
+    assert merged["results"]["biome"]["summary"]["errors"] == 1
+    assert merged["success"] is False
+    assert merged["scope"] == {"changed": ["src/touched.ts"], "deleted": []}
+
+    fresh["results"]["dependencies"]["success"] = False
+    previous = {"results": {"biome": biome([("src/touched.ts", "error")], success=False)}}
+    merged = merge_analysis_results(previous, fresh, changes)
+    assert merged["results"]["biome"]["success"] is True
+    assert merged["success"] is False
+    assert merge_analysis_results(None, fresh, changes) is fresh
@@ -0,0 +1,73 @@
+import json
+import os
+import time
+
+from utils.llm_cache import ResponseCache, normalize_payload
+
+
+def test_key_ignores_volatile_fields_and_key_order():
+    first = json.dumps({"plugin": "core", "timestamp": "2024-01-01", "issues": [1, 2]})
+    second = json.dumps({"issues": [1, 2], "timestamp": "2025-06-30", "plugin": "core"})
+
+    assert normalize_payload(first) == normalize_payload(second)
+    assert ResponseCache.compute_key(first, ["be terse"], "m") == ResponseCache.compute_key(
+        second, ["be terse"], "m"
+    )
+    assert ResponseCache.compute_key(first, ["be terse"], "m") != ResponseCache.compute_key(
+        first, ["be terse"], "other"
+    )
+
+
+def test_round_trip_and_stats(tmp_path):
+    cache = ResponseCache(tmp_path)
+    assert cache.get("k") is None
+
+    cache.put("k", "answer", model="m")
+
+    assert cache.get("k") == "answer"
+    assert cache.stats() == {"hits": 1, "misses": 1, "expired": 0}
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_seconds=60)
+    cache.put("k", "answer")
+    entry = tmp_path / "k.json"
+    data = json.loads(entry.read_text())
+    data["created_at"] = time.time() - 120
+    entry.write_text(json.dumps(data))
+
+    assert cache.get("k") is None
+    assert not entry.exists()
+    assert cache.stats()["expired"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path, max_size_mb=1)
+    # Room for three entries of about 360 bytes each
+    cache.max_size_bytes = 1200
+    response = "x" * 300
+    for index, key in enumerate(("a", "b", "c")):
+        cache.put(key, response)
+        # Distinct mtimes, oldest first
+        os.utime(tmp_path / f"{key}.json", (index, index))
+
+    # Reading "a" makes it the most recently used entry
+    assert cache.get("a") == response
+    cache.put("d", response)
+
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["a", "c", "d"]
+
+
+def test_size_is_tracked_without_rescanning(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path)
+    cache.put("a", "first")
+
+    scans = []
+    original_evict = cache._evict
+    monkeypatch.setattr(cache, "_evict", lambda: (scans.append(True), original_evict()))
+    cache.put("b", "second")
+    cache.put("a", "replaced")
+
+    expected = sum(path.stat().st_size for path in tmp_path.glob("*.json"))
+    assert cache._size == expected
+    assert scans == []
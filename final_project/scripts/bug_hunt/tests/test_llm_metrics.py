@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from utils.llm_metrics import CallMetric, MetricsRecorder, percentile, usage_from_metrics
+
+
+def test_percentile_empty():
+    assert percentile([], 50) is None
+
+
+def test_percentile_single_value():
+    assert percentile([3.0], 50) == 3.0
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_percentile_interpolates_between_neighbours():
+    values = [4.0, 1.0, 3.0, 2.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 100) == 4.0
+    assert percentile(values, 50) == pytest.approx(2.5)
+    assert percentile(values, 95) == pytest.approx(3.85)
+
+
+def test_usage_from_metrics_sums_per_response_lists():
+    usage = usage_from_metrics(
+        {"input_tokens": [10, 5], "output_tokens": 7, "time_to_first_token": [0.4, 0.2]}
+    )
+    assert usage == {"prompt_tokens": 15, "completion_tokens": 7, "ttft": 0.4}
+
+
+def test_usage_from_metrics_without_token_counts():
+    assert usage_from_metrics({"time_to_first_token": 0.1}) is None
+    assert usage_from_metrics(None) is None
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    return MetricsRecorder(tmp_path / "metrics.jsonl", input_price=1.0, output_price=2.0)
+
+
+def test_summary_separates_call_and_queued_latency(recorder):
+    recorder.record(
+        CallMetric("agent", ["a"], "m", "success", attempts=1, latency=1.0, queued_latency=1.5)
+    )
+    recorder.record(
+        CallMetric("agent", ["b"], "m", "success", attempts=3, latency=2.0, queued_latency=9.0)
+    )
+    summary = recorder.summary()
+    assert summary["latency"]["p50"] == pytest.approx(1.5)
+    assert summary["queued_latency"]["p50"] == pytest.approx(5.25)
+    assert summary["retries"] == 2
+    assert summary["ttft"]["p50"] is None
+
+
+def test_summary_splits_batched_usage_between_labels(recorder):
+    recorder.record(
+        CallMetric(
+            "agent",
+            ["a", "b"],
+            "m",
+            "success",
+            attempts=1,
+            latency=2.0,
+            prompt_tokens=100,
+            completion_tokens=50,
+        )
+    )
+    recorder.record(CallMetric("cache", ["c"], "m", "success"))
+    summary = recorder.summary()
+    assert summary["calls"] == 1
+    assert summary["cache_hits"] == 1
+    assert summary["cost"] == pytest.approx(200 / 1_000_000)
+    labels = {item["label"]: item for item in summary["top_labels"]}
+    assert labels["a"] == {"label": "a", "tokens": 75.0, "latency": 1.0, "calls": 0.5}
+    assert labels["b"]["tokens"] == 75.0
+    assert "c" not in labels
+
+
+def test_summary_since_mark(recorder):
+    recorder.record(CallMetric("agent", ["a"], "m", "error", attempts=1))
+    mark = recorder.mark()
+    recorder.record(CallMetric("agent", ["b"], "m", "success", attempts=1, ttft=0.2))
+    summary = recorder.summary(since=mark)
+    assert summary["calls"] == 1
+    assert summary["failed"] == 0
+    assert summary["ttft"]["p50"] == 0.2
+
+
+def test_record_appends_json_lines(recorder):
+    recorder.record(CallMetric("agent", ["a"], "m", "success", attempts=2, queued_latency=3.0))
+    line = json.loads(recorder.metrics_path.read_text().splitlines()[0])
+    assert line["retries"] == 1
+    assert line["queued_latency"] == 3.0
@@ -0,0 +1,161 @@
+import time
+
+import pytest
+
+from utils.llm_runner import ConcurrentRunner, TokenBucket, is_retryable
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps on it"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+def test_token_bucket_allows_burst_then_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.acquire(sleep=clock.sleep) == 0.0
+    assert bucket.acquire(sleep=clock.sleep) == 0.0
+    assert bucket.acquire(sleep=clock.sleep) == pytest.approx(0.5)
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_token_bucket_never_exceeds_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+    bucket.acquire(sleep=clock.sleep)
+
+    clock.now += 100
+    assert bucket.acquire(sleep=clock.sleep) == 0.0
+    assert bucket.acquire(sleep=clock.sleep) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (StatusError(429), True),
+        (StatusError(408), True),
+        (StatusError(503), True),
+        (StatusError(409), False),
+        (StatusError(400), False),
+        (ConnectionError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+def make_runner(call, **options):
+    clock = FakeClock()
+    runner = ConcurrentRunner(call, sleep=clock.sleep, **options)
+    runner.bucket = TokenBucket(rate=100.0, capacity=runner.max_concurrency, clock=clock)
+    return runner, clock
+
+
+def test_runner_retries_rate_limits_until_success():
+    failures = iter([StatusError(429), StatusError(500)])
+
+    def call(item):
+        error = next(failures, None)
+        if error:
+            raise error
+        return item * 2
+
+    runner, _ = make_runner(call, max_retries=4)
+    [outcome] = runner.run([21])
+
+    assert outcome.ok
+    assert outcome.value == 42
+    assert outcome.attempts == 3
+
+
+def test_runner_honours_retry_after():
+    failures = iter([StatusError(429, {"retry-after": "7"})])
+
+    def call(item):
+        error = next(failures, None)
+        if error:
+            raise error
+        return item
+
+    runner, clock = make_runner(call)
+    runner.run(["x"])
+
+    assert 7.0 in clock.sleeps
+
+
+def test_runner_gives_up_after_max_retries():
+    def call(item):
+        raise StatusError(503)
+
+    runner, _ = make_runner(call, max_retries=2)
+    [outcome] = runner.run(["x"])
+
+    assert not outcome.ok
+    assert outcome.attempts == 3
+
+
+def test_runner_does_not_retry_client_errors():
+    def call(item):
+        raise StatusError(409)
+
+    runner, _ = make_runner(call, max_retries=4)
+    [outcome] = runner.run(["x"])
+
+    assert outcome.attempts == 1
+    assert outcome.error.status_code == 409
+
+
+def test_runner_keeps_input_order():
+    runner, _ = make_runner(lambda item: item.upper(), max_concurrency=4)
+
+    assert [outcome.value for outcome in runner.run(list("abcdef"))] == list("ABCDEF")
+
+
+def test_runner_call_time_excludes_backoff():
+    failures = iter([StatusError(429)])
+
+    def call(item):
+        error = next(failures, None)
+        if error:
+            raise error
+        return item
+
+    runner = ConcurrentRunner(call, sleep=lambda seconds: time.sleep(0.05), base_delay=1.0)
+    [outcome] = runner.run(["a"])
+    assert outcome.value == "a"
+    assert outcome.attempts == 2
+    assert outcome.elapsed >= 0.05
+    assert outcome.call_time < 0.05
+
+
+@pytest.mark.parametrize("rate", [0, -1.0])
+def test_token_bucket_rejects_non_positive_rates(rate):
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate)
+
+
+def test_runner_without_rate_limit_never_waits():
+    sleeps = []
+    runner = ConcurrentRunner(lambda item: item * 2, requests_per_minute=0, sleep=sleeps.append)
+    assert runner.bucket is None
+    assert [outcome.value for outcome in runner.run(list(range(20)))] == list(range(0, 40, 2))
+    assert sleeps == []
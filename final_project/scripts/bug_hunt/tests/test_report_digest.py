@@ -0,0 +1,97 @@
+import json
+
+from utils.diagnostics import DiagnosticTable
+from utils.report_digest import (
+    ReportDigest,
+    cluster_diagnostics,
+    estimate_tokens,
+    extract_diagnostics,
+    normalize_message,
+)
+
+
+def make_table(count: int, files: int = 5) -> DiagnosticTable:
+    table = DiagnosticTable()
+    for index in range(count):
+        table.append(
+            f"src/file{index % files}.ts",
+            index + 1,
+            3,
+            "warning" if index % 3 else "error",
+            f"lint/rule{index % 4}",
+            f"Variable `name{index}` is unused on line {index}",
+            ["const x = 1;"],
+        )
+    return table
+
+
+def test_normalize_message_masks_identifiers_and_numbers():
+    assert (
+        normalize_message("Variable `foo` is unused on line 12\nmore")
+        == "Variable … is unused on line N"
+    )
+    assert normalize_message("") == ""
+
+
+def test_clusters_collapse_variants_and_rank_errors_first():
+    clusters = cluster_diagnostics(make_table(40), max_examples=2)
+
+    assert len(clusters) == 4
+    assert sum(cluster.count for cluster in clusters) == 40
+    assert clusters[0].severity == "error"
+    assert all(len(cluster.examples) <= 2 for cluster in clusters)
+    # Examples come from different files
+    assert all(
+        len({example[0] for example in cluster.examples}) == len(cluster.examples)
+        for cluster in clusters
+    )
+
+
+def test_summary_rows_are_not_clustered():
+    table = make_table(3)
+    table.append("Summary", 0, 0, "warning", "multiple-issues", "Found 3 warnings", [])
+
+    assert sum(cluster.count for cluster in cluster_diagnostics(table)) == 3
+
+
+def test_extract_diagnostics_understands_nested_results():
+    payload = json.dumps({"results": {"biome": {"diagnostics": make_table(6).to_json()}}})
+
+    assert len(extract_diagnostics(payload)) == 6
+    assert extract_diagnostics("plain text") is None
+
+
+def test_small_report_is_one_prompt():
+    payload = json.dumps({"diagnostics": make_table(10).to_json()})
+
+    [prompt] = ReportDigest(token_budget=12000).prompts(payload, "core")
+    assert "10 diagnostics" in prompt
+    assert "4 distinct problems" in prompt
+
+
+def test_large_report_is_split_within_budget():
+    table = DiagnosticTable()
+    for index in range(400):
+        table.append(
+            f"src/f{index}.ts",
+            1,
+            1,
+            "warning",
+            f"lint/rule{index}",
+            f"Problem kind {chr(65 + index % 26)}{index}",
+            [],
+        )
+    payload = json.dumps({"diagnostics": table.to_json()})
+
+    prompts = ReportDigest(token_budget=1000).prompts(payload, "core")
+    assert len(prompts) > 1
+    assert all(estimate_tokens(prompt) <= 1000 for prompt in prompts)
+    assert "part 1 of" in prompts[0]
+
+
+def test_raw_text_is_chunked_by_lines():
+    payload = "\n".join(f"line {index} " + "x" * 80 for index in range(200))
+
+    prompts = ReportDigest(token_budget=500).prompts(payload, "raw")
+    assert len(prompts) > 1
+    assert all(estimate_tokens(prompt) <= 500 for prompt in prompts)
@@ -0,0 +1,40 @@
+import stat
+
+import pytest
+
+from utils import tool_resolver
+from utils.tool_resolver import ToolResolver
+
+
+def executable(path, body):
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    return ToolResolver(tmp_path / "workspace", tools_dir=tmp_path / "tools")
+
+
+def test_prefers_workspace_binaries(resolver):
+    bin_dir = resolver.work_dir / "node_modules" / ".bin"
+    bin_dir.mkdir(parents=True)
+    biome = executable(bin_dir / "biome", "exit 0")
+    assert resolver.resolve("biome") == [str(biome)]
+    assert resolver.command("biome") == [str(biome)]
+    assert resolver.invocations["biome"] == 1
+
+
+def test_hung_install_falls_back_to_pnpm(resolver, tmp_path, monkeypatch):
+    npm = executable(tmp_path / "npm", "sleep 5")
+    monkeypatch.setattr(tool_resolver.shutil, "which", lambda name: str(npm))
+    monkeypatch.setattr(resolver, "_bin_dirs", lambda: [])
+    resolver.install_timeout = 0.2
+    assert resolver.resolve("biome") == ["pnpm", "biome"]
+
+
+def test_unrunnable_npm_falls_back_to_pnpm(resolver, tmp_path, monkeypatch):
+    monkeypatch.setattr(tool_resolver.shutil, "which", lambda name: str(tmp_path / "no-npm"))
+    monkeypatch.setattr(resolver, "_bin_dirs", lambda: [])
+    assert resolver.resolve("biome") == ["pnpm", "biome"]
@@ -1,73 +1,163 @@
-from typing import List, Dict, Any, Optional
+import json
 import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from phi.agent import Agent
+from phi.model.deepseek import DeepSeekChat
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-import json
-from datetime import datetime
-from phi.agent import Agent
-from phi.model.deepseek import DeepSeekChat
-import os
-import sys
+from rich.table import Table
+
 sys.path.append(str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 
+from utils.llm_cache import ResponseCache
+from utils.llm_metrics import AgentReply, CallMetric, MetricsRecorder, usage_from_metrics
+from utils.llm_runner import ConcurrentRunner, RunOutcome
+from utils.report_digest import (
+    ReportDigest,
+    batch_prompt,
+    estimate_tokens,
+    pack_blocks,
+    split_batch_response,
+)
+from utils.reporting import ReportIndex
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
-)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 # Initialize Rich console
 console = Console()
 
 # Configure logger
 logger = logging.getLogger("biome_workflow")
 
+# Consolidated results are saved next to the reports, so `run` must not read them back
+CONSOLIDATED_PREFIX = "consolidated_analysis_"
+
+
 class BiomeWorkflow:
-    def __init__(self):
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 4,
+        agent_factory: Optional[Callable[[], Any]] = None,
+        use_cache: Optional[bool] = None,
+        cache: Optional[ResponseCache] = None,
+        chunk_tokens: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        metrics: Optional[MetricsRecorder] = None,
+    ):
+        # Unset options come from the environment when the workflow is built, not when it is imported
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("BIOME_AGENT_CONCURRENCY", "4"))
+        if requests_per_minute is None:
+            requests_per_minute = float(os.getenv("BIOME_AGENT_RPM", "30"))
+        if use_cache is None:
+            use_cache = os.getenv("BIOME_AGENT_CACHE", "1") != "0"
+        if chunk_tokens is None:
+            chunk_tokens = int(os.getenv("BIOME_AGENT_CHUNK_TOKENS", "12000"))
+        if batch_size is None:
+            batch_size = int(os.getenv("BIOME_AGENT_BATCH_SIZE", "10"))
+
+        # Agents keep per-run state, so each worker thread gets its own instance.
+        # A custom factory lets the workflow run against a local stand-in.
+        self.agent_factory = agent_factory or self._create_agent
+        self._local = threading.local()
+        self.biome_agent = self._local.agent = self.agent_factory()
+
+        # Bounded, rate-limited calls with jittered retries on 429/5xx
+        self.runner = ConcurrentRunner(
+            self._analyze,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            max_retries=max_retries,
+        )
+
+        # Responses are reused for unchanged reports, as long as the prompt setup and model match
+        self.cache = cache or (ResponseCache() if use_cache else None)
+        model = getattr(self.biome_agent, "model", None)
+        self.model_name = str(getattr(model, "id", None) or type(model).__name__)
+        self.prompt_fingerprint = {
+            field: getattr(self.biome_agent, field, None)
+            for field in ("instructions", "guidelines", "expected_output", "reasoning", "markdown")
+        }
+
+        # Reports are condensed into clustered, token-budgeted prompts before they reach the agent
+        self.digest = ReportDigest(token_budget=chunk_tokens)
+        # Up to `batch_size` small prompts share one request; 1 disables batching
+        self.batch_size = max(1, batch_size)
+
+        # Per-call tokens, latency and retries, appended to logs/agent_metrics.jsonl
+        self.metrics = metrics or MetricsRecorder(
+            input_price=(
+                float(os.environ["BIOME_AGENT_PRICE_INPUT"])
+                if os.getenv("BIOME_AGENT_PRICE_INPUT")
+                else None
+            ),
+            output_price=(
+                float(os.environ["BIOME_AGENT_PRICE_OUTPUT"])
+                if os.getenv("BIOME_AGENT_PRICE_OUTPUT")
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _create_agent() -> Agent:
+        # DEEPSEEK_BASE_URL points the model at another OpenAI-compatible endpoint
+        model_options = (
+            {"base_url": os.environ["DEEPSEEK_BASE_URL"]} if os.getenv("DEEPSEEK_BASE_URL") else {}
+        )
 
         # LLD (Low Level Design) agent for architecture and design analysis
-        self.biome_agent = Agent(
+        return Agent(
             name="Biome Agent",
-            model=DeepSeekChat(),
+            model=DeepSeekChat(**model_options),
             instructions=[
                 "You are an expert code quality analyst specializing in Biome linter reports and code optimization.",
                 "Your expertise lies in analyzing Biome linter outputs and providing actionable solutions.",
                 "Core Analysis Areas:",
                 "1. Linter Report Analysis:",
-                    "- Parse and categorize Biome warnings and errors",
-                    "- Identify patterns in reported issues",
-                    "- Prioritize fixes based on severity",
-                    "- Track recurring code quality issues",
-                    "- Analyze impact of reported problems",
+                "- Parse and categorize Biome warnings and errors",
+                "- Identify patterns in reported issues",
+                "- Prioritize fixes based on severity",
+                "- Track recurring code quality issues",
+                "- Analyze impact of reported problems",
                 "2. Code Optimization:",
-                    "- Propose specific fixes for linter warnings",
-                    "- Recommend code style improvements",
-                    "- Suggest refactoring opportunities",
-                    "- Provide examples of optimized code",
-                    "- Consider performance implications",
+                "- Propose specific fixes for linter warnings",
+                "- Recommend code style improvements",
+                "- Suggest refactoring opportunities",
+                "- Provide examples of optimized code",
+                "- Consider performance implications",
                 "3. Best Practices Implementation:",
-                    "- Align solutions with coding standards",
-                    "- Recommend modern syntax alternatives",
-                    "- Suggest consistent code patterns",
-                    "- Promote maintainable code structure",
-                    "- Guide on error prevention",
+                "- Align solutions with coding standards",
+                "- Recommend modern syntax alternatives",
+                "- Suggest consistent code patterns",
+                "- Promote maintainable code structure",
+                "- Guide on error prevention",
                 "4. Technical Debt Management:",
-                    "- Identify technical debt indicators",
-                    "- Propose debt reduction strategies",
-                    "- Prioritize critical improvements",
-                    "- Track recurring patterns",
-                    "- Plan incremental fixes",
+                "- Identify technical debt indicators",
+                "- Propose debt reduction strategies",
+                "- Prioritize critical improvements",
+                "- Track recurring patterns",
+                "- Plan incremental fixes",
                 "5. Solution Guidance:",
-                    "- Provide step-by-step fix instructions",
-                    "- Include code examples for fixes",
-                    "- Explain reasoning behind solutions",
-                    "- Consider implementation complexity",
-                    "- Suggest testing approaches"
+                "- Provide step-by-step fix instructions",
+                "- Include code examples for fixes",
+                "- Explain reasoning behind solutions",
+                "- Consider implementation complexity",
+                "- Suggest testing approaches",
             ],
             guidelines=[
                 "Focus on practical, implementable solutions for Biome warnings",
@@ -79,7 +169,7 @@ class BiomeWorkflow:
                 "Include before/after code comparisons",
                 "Consider maintainability in solutions",
                 "Align with modern coding standards",
-                "Suggest automated fix options when available"
+                "Suggest automated fix options when available",
             ],
             expected_output="""A comprehensive Biome analysis report containing:
 
@@ -130,67 +220,380 @@ Format:
             monitoring=True,
         )
 
-    def generate_final_response(self, biome_data: str) -> Dict[str, Any]:
-        """Generate final response using PR reasoning agent to analyze Biome report"""
-        try:
-            logger.info("Generating final PR analysis")
-            result = self.biome_agent.run(biome_data)
-
-            # Handle the response
-            if hasattr(result, 'content'):
-                content = result.content
-            elif isinstance(result, dict) and 'content' in result:
-                content = result['content']
-            elif isinstance(result, str):
-                content = result
-            else:
-                content = str(result)
+    def _agent(self) -> Any:
+        """The calling thread's agent instance"""
+        agent = getattr(self._local, "agent", None)
+        if agent is None:
+            agent = self._local.agent = self.agent_factory()
+        return agent
+
+    def _analyze(self, biome_data: str) -> AgentReply:
+        """One streamed agent round-trip; errors propagate so the runner can retry them"""
+        agent = self._agent()
+        start = time.perf_counter()
+        first_token: Optional[float] = None
+        first_answer: Optional[float] = None
+        result = agent.run(biome_data, stream=True)
+
+        # Handle the response
+        if hasattr(result, "content"):
+            content = result.content
+        elif isinstance(result, dict) and "content" in result:
+            content = result["content"]
+        elif isinstance(result, str):
+            content = result
+        else:
+            # Streamed chunks; reasoning steps arrive as non-text content. They count
+            # towards the time to first token but not towards the time to answer.
+            parts = []
+            for chunk in result:
+                text = getattr(chunk, "content", chunk)
+                if first_token is None and (text or getattr(chunk, "reasoning_content", None)):
+                    first_token = time.perf_counter() - start
+                if isinstance(text, str) and text:
+                    if first_answer is None:
+                        first_answer = time.perf_counter() - start
+                    parts.append(text)
+            content = (
+                "".join(parts) or getattr(getattr(agent, "run_response", None), "content", "") or ""
+            )
+
+        content = content if isinstance(content, str) else str(content)
+        usage = usage_from_metrics(getattr(getattr(agent, "run_response", None), "metrics", None))
+        if usage is None:
+            return AgentReply(
+                content,
+                estimate_tokens(biome_data),
+                estimate_tokens(content),
+                first_token,
+                first_answer,
+                estimated=True,
+            )
+        return AgentReply(
+            content,
+            usage["prompt_tokens"],
+            usage["completion_tokens"],
+            first_token or usage["ttft"],
+            first_answer,
+        )
 
-            # Log the final analysis
-            logger.info("Final analysis generated")
-            console.print(Panel(content, title="Final PR Analysis", style="blue"))
+    def _to_response(self, outcome: RunOutcome, cached: bool = False) -> Dict[str, Any]:
+        """Shape a runner outcome into the workflow's response dict"""
+        if not outcome.ok:
+            error_msg = f"Error generating final response: {str(outcome.error)}"
+            logger.error(error_msg)
+            return {"error": error_msg, "status": "failed", "attempts": outcome.attempts}
+
+        return {
+            "status": "success",
+            "final_response": outcome.value,
+            "analysis_timestamp": datetime.now().isoformat(),
+            "analysis_type": "biome_workflow",
+            "attempts": outcome.attempts,
+            "cached": cached,
+        }
+
+    def _analyze_payloads(
+        self, payloads: List[str], labels: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Responses for many payloads in order, serving cache hits and sending the rest to the agent"""
+        labels = labels or ["report"] * len(payloads)
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+        keys: List[Optional[str]] = [None] * len(payloads)
+        # Identical payloads in one run are sent once; key -> indexes waiting on it
+        pending: Dict[str, List[int]] = {}
+
+        for index, payload in enumerate(payloads):
+            if not self.cache:
+                pending[str(index)] = [index]
+                continue
+            key = keys[index] = self.cache.compute_key(
+                payload, self.prompt_fingerprint, self.model_name
+            )
+            if key in pending:
+                pending[key].append(index)
+                continue
+            content = self.cache.get(key)
+            if content is not None:
+                responses[index] = self._to_response(
+                    RunOutcome(payload, value=content), cached=True
+                )
+                self.metrics.record(
+                    CallMetric("cache", [labels[index]], self.model_name, "success")
+                )
+            else:
+                pending[key] = [index]
 
-            return {
-                "status": "success",
-                "final_response": content,
-                "analysis_timestamp": datetime.now().isoformat(),
-                "analysis_type": "biome_workflow"
-            }
+        groups = list(pending.values())
+        outcomes = self._run_batched(
+            [payloads[indexes[0]] for indexes in groups], [labels[indexes[0]] for indexes in groups]
+        )
+        for indexes, outcome in zip(groups, outcomes):
+            if outcome.ok and self.cache:
+                self.cache.put(keys[indexes[0]], outcome.value, self.model_name)
+            response = self._to_response(outcome)
+            for index in indexes:
+                responses[index] = response
+        return responses
+
+    def _run_calls(self, prompts: List[str], labels: List[List[str]]) -> List[RunOutcome]:
+        """Agent round-trips for prompts, recording a metric per call and unwrapping replies to text"""
+        outcomes = self.runner.run(prompts)
+        for call_labels, outcome in zip(labels, outcomes):
+            reply: Optional[AgentReply] = outcome.value if outcome.ok else None
+            self.metrics.record(
+                CallMetric(
+                    "agent",
+                    call_labels,
+                    self.model_name,
+                    "success" if outcome.ok else "failed",
+                    attempts=outcome.attempts,
+                    latency=outcome.call_time,
+                    queued_latency=outcome.elapsed,
+                    ttft=reply.ttft if reply else None,
+                    time_to_answer=reply.time_to_answer if reply else None,
+                    prompt_tokens=reply.prompt_tokens if reply else 0,
+                    completion_tokens=reply.completion_tokens if reply else 0,
+                    tokens_estimated=reply.estimated if reply else False,
+                )
+            )
+            if reply:
+                outcome.value = reply.content
+        return outcomes
+
+    def _run_batched(self, prompts: List[str], labels: List[str]) -> List[RunOutcome]:
+        """Run prompts through the agent, packing small ones into shared requests.
+
+        Each packed request asks for marked per-report sections, which are
+        split back into one outcome per prompt. Prompts whose section is
+        missing from a successful reply are sent again on their own. A batch
+        that failed was already retried by the runner, so its reports share
+        its failure instead of multiplying the requests that just failed.
+        """
+        if self.batch_size == 1 or len(prompts) < 2:
+            return self._run_calls(prompts, [[label] for label in labels])
+
+        # Only prompts small enough for several to share the budget are packed
+        small_limit = self.digest.token_budget // 4
+        small = [
+            index for index, prompt in enumerate(prompts) if estimate_tokens(prompt) <= small_limit
+        ]
+        batches = [
+            batch
+            for batch in pack_blocks(
+                small,
+                self.digest.token_budget,
+                self.batch_size,
+                size=lambda index: estimate_tokens(prompts[index]),
+            )
+            if len(batch) > 1
+        ]
+        batched = {index for batch in batches for index in batch}
+        singles = [index for index in range(len(prompts)) if index not in batched]
+        if batches:
+            logger.info(f"Packed {len(batched)} small reports into {len(batches)} requests")
+
+        outcomes: List[Optional[RunOutcome]] = [None] * len(prompts)
+        jobs = [prompts[index] for index in singles] + [
+            batch_prompt([prompts[i] for i in batch]) for batch in batches
+        ]
+        results = self._run_calls(
+            jobs,
+            [[labels[index]] for index in singles]
+            + [[labels[i] for i in batch] for batch in batches],
+        )
+        for index, outcome in zip(singles, results):
+            outcomes[index] = outcome
+
+        retry: List[int] = []
+        for batch, outcome in zip(batches, results[len(singles) :]):
+            if not outcome.ok:
+                for index in batch:
+                    outcomes[index] = RunOutcome(
+                        prompts[index],
+                        error=outcome.error,
+                        attempts=outcome.attempts,
+                        elapsed=outcome.elapsed,
+                        call_time=outcome.call_time,
+                    )
+                continue
+            sections = split_batch_response(str(outcome.value), len(batch))
+            for position, index in enumerate(batch):
+                if position in sections:
+                    outcomes[index] = RunOutcome(
+                        prompts[index],
+                        value=sections[position],
+                        attempts=outcome.attempts,
+                        elapsed=outcome.elapsed,
+                    )
+                else:
+                    retry.append(index)
+        if retry:
+            logger.warning(
+                f"{len(retry)} batched reports came back without their section; analyzing them separately"
+            )
+            retried = self._run_calls(
+                [prompts[index] for index in retry], [[labels[index]] for index in retry]
+            )
+            for index, outcome in zip(retry, retried):
+                outcomes[index] = outcome
+        return outcomes
+
+    def _reduce_groups(self, label: str, partials: List[str]) -> List[List[str]]:
+        """Partials grouped so each merge prompt fits the budget; merged again until one remains"""
+        if estimate_tokens(self.digest.reduce_prompt(label, partials)) <= self.digest.token_budget:
+            return [partials]
+        groups = pack_blocks(partials, self.digest.token_budget)
+        # Partials too large to pair up still have to be merged in one go
+        return [partials] if len(groups) == len(partials) else groups
+
+    def _analyze_reports(self, payloads: List[str], labels: List[str]) -> List[Dict[str, Any]]:
+        """One analysis per report, mapping oversized reports over chunks and reducing the partials"""
+        report_prompts = [
+            self.digest.prompts(payload, label) for payload, label in zip(payloads, labels)
+        ]
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+
+        # Map: every chunk of every report goes through the runner together
+        mapped = iter(
+            self._analyze_payloads(
+                [prompt for prompts in report_prompts for prompt in prompts],
+                [label for label, prompts in zip(labels, report_prompts) for _ in prompts],
+            )
+        )
+        partials: Dict[int, List[Dict[str, Any]]] = {
+            index: [next(mapped) for _ in prompts] for index, prompts in enumerate(report_prompts)
+        }
+
+        # Reduce: merge partial analyses, in rounds when they do not fit one prompt
+        while partials:
+            owners: List[int] = []
+            merge_prompts: List[str] = []
+            for index, parts in partials.items():
+                failed = next((part for part in parts if part["status"] != "success"), None)
+                if failed or len(parts) == 1:
+                    responses[index] = dict(failed or parts[0], chunks=len(report_prompts[index]))
+                    continue
+                for group in self._reduce_groups(
+                    labels[index], [part["final_response"] for part in parts]
+                ):
+                    owners.append(index)
+                    merge_prompts.append(self.digest.reduce_prompt(labels[index], group))
+
+            partials = {}
+            merged = self._analyze_payloads(merge_prompts, [labels[index] for index in owners])
+            for index, response in zip(owners, merged):
+                partials.setdefault(index, []).append(response)
+
+        for label, response in zip(labels, responses):
+            if response["status"] == "success":
+                logger.info(
+                    f"{'Cached analysis reused' if response['cached'] else 'Final analysis generated'} for {label}"
+                )
+                console.print(
+                    Panel(
+                        response["final_response"],
+                        title=f"Final PR Analysis: {label}",
+                        style="blue",
+                    )
+                )
+        return responses
+
+    def _print_metrics(self, summary: Dict[str, Any]) -> None:
+        """Latency/TTFT percentiles and the reports using the most tokens"""
+
+        def seconds(value: Optional[float]) -> str:
+            return f"{value:.2f}s" if value is not None else "N/A"
+
+        estimated = " (estimated)" if summary["tokens_estimated"] else ""
+        cost = f", ${summary['cost']:.4f}" if summary["cost"] is not None else ""
+        console.print(
+            f"[blue]Agent calls: {summary['calls']} ({summary['failed']} failed, {summary['retries']} retries, "
+            f"{summary['cache_hits']} cache hits), tokens: {summary['prompt_tokens']} prompt / "
+            f"{summary['completion_tokens']} completion{estimated}{cost}[/blue]"
+        )
+        if not summary["calls"]:
+            return
+
+        table = Table(title="Agent Call Latency")
+        table.add_column("Metric", style="cyan")
+        for q in ("p50", "p95", "p99"):
+            table.add_column(q, justify="right")
+        for name, key in (
+            ("Call latency", "latency"),
+            ("Latency incl. queueing", "queued_latency"),
+            ("Time to first token", "ttft"),
+            ("Time to answer", "time_to_answer"),
+        ):
+            table.add_row(name, *(seconds(summary[key][q]) for q in ("p50", "p95", "p99")))
+        console.print(table)
+
+        top = Table(title="Most Expensive Reports")
+        top.add_column("Report", style="cyan")
+        top.add_column("Tokens", justify="right")
+        top.add_column("Latency", justify="right")
+        for item in summary["top_labels"]:
+            top.add_row(item["label"], f"{item['tokens']:.0f}", seconds(item["latency"]))
+        console.print(top)
 
-        except Exception as e:
-            error_msg = f"Error generating final response: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg, "status": "failed"}
+    def generate_final_response(self, biome_data: str) -> Dict[str, Any]:
+        """Generate final response using PR reasoning agent to analyze Biome report"""
+        logger.info("Generating final PR analysis")
+        return self._analyze_reports([biome_data], ["report"])[0]
 
-    def run(self) -> Dict[str, Any]:
+    def run(self, reports_path: Optional[Path] = None) -> Dict[str, Any]:
         """Run the complete analysis workflow for all reports"""
         logger.info("Starting analysis workflow for reports")
+        metrics_start = self.metrics.mark()
 
         try:
-            results = []
-
-            # Process each report file in the reports directory
-            for report_file in PR_REPORTS_PATH.glob("*.json"):
+            report_files = []
+            payloads = []
+
+            # Read every report in the reports directory, skipping this workflow's own
+            # output and the report metadata index
+            for report_file in sorted((reports_path or PR_REPORTS_PATH).glob("*.json")):
+                if (
+                    report_file.name.startswith(CONSOLIDATED_PREFIX)
+                    or report_file.name == ReportIndex.FILE_NAME
+                ):
+                    continue
                 logger.info(f"Processing report file: {report_file}")
 
                 try:
                     with open(report_file, encoding="utf-8") as f:
-                        biome_data = f.read()
-
-                    # Generate analysis for this report
-                    final_response = self.generate_final_response(biome_data)
-                    results.append({
-                        "file": str(report_file),
-                        "analysis": final_response
-                    })
+                        payloads.append(f.read())
+                    report_files.append(report_file)
 
                 except Exception as e:
                     logger.error(f"Error processing file {report_file}: {str(e)}")
                     continue
 
+            # Analyze the reports concurrently; responses come back in file order
+            responses = self._analyze_reports(
+                payloads, [report_file.stem for report_file in report_files]
+            )
+            results = [
+                {"file": str(report_file), "analysis": response}
+                for report_file, response in zip(report_files, responses)
+            ]
+
+            if self.cache:
+                stats = self.cache.stats()
+                console.print(
+                    f"[blue]Response cache: {stats['hits']} hits, {stats['misses']} misses "
+                    f"({stats['expired']} expired)[/blue]"
+                )
+
+            metrics = self.metrics.summary(since=metrics_start)
+            self._print_metrics(metrics)
+            logger.info(f"Agent call metrics written to {self.metrics.metrics_path}")
+
             return {
                 "results": results,
-                "status": "success"
+                "status": "success",
+                "cache": self.cache.stats() if self.cache else None,
+                "metrics": metrics,
             }
 
         except Exception as e:
@@ -198,9 +601,12 @@ Format:
             logger.error(error_msg)
             return {"error": error_msg, "status": "failed"}
 
+
 if __name__ == "__main__":
     # Configure paths
-    PR_REPORTS_PATH = Path("/Users/ilessio/dev-agents/ELIZA_FIX/eliza_aiflow/scripts/bug_hunt/reports")
+    PR_REPORTS_PATH = Path(
+        "/Users/ilessio/dev-agents/ELIZA_FIX/eliza_aiflow/scripts/bug_hunt/reports"
+    )
 
     choice = input("\nEnter your choice (1-2): ")
 
@@ -217,7 +623,7 @@ if __name__ == "__main__":
         if result.get("status") == "success":
             # Save the consolidated report
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_file = PR_REPORTS_PATH / f"consolidated_analysis_{timestamp}.json"
+            report_file = PR_REPORTS_PATH / f"{CONSOLIDATED_PREFIX}{timestamp}.json"
 
             with open(report_file, "w", encoding="utf-8") as f:
                 json.dump(result, f, indent=2, ensure_ascii=False)
@@ -228,11 +634,13 @@ if __name__ == "__main__":
             # Display summary for each analyzed file
             console.print("\n[bold]Analysis Summary:[/bold]")
             for file_result in result["results"]:
-                console.print(Panel(
-                    file_result["analysis"].get("final_response", "No summary available"),
-                    title=f"Analysis Results for {Path(file_result['file']).name}",
-                    style="cyan"
-                ))
+                console.print(
+                    Panel(
+                        file_result["analysis"].get("final_response", "No summary available"),
+                        title=f"Analysis Results for {Path(file_result['file']).name}",
+                        style="cyan",
+                    )
+                )
         else:
             console.print(f"\n[red]Analysis failed: {result.get('error', 'Unknown error')}[/red]")
 
@@ -240,6 +648,3 @@ if __name__ == "__main__":
         console.print("[yellow]Exiting...[/yellow]")
     else:
         console.print("[red]Invalid choice![/red]")
-
-
-
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.diagnostics import hydrate_result, json_default
+
+# Directories never worth hashing; they are build output or installed dependencies
+SKIP_DIRS = {"node_modules", "dist", "build", ".turbo", ".git", "coverage"}
+
+# Files that influence Biome or dependency check results for a plugin
+SOURCE_SUFFIXES = {".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".mts", ".cts", ".json"}
+
+
+def iter_source_files(plugin_dir: Path) -> List[Path]:
+    """Source files of a plugin in a stable order, skipping build output"""
+    files = []
+    for root, dirs, filenames in os.walk(plugin_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1] in SOURCE_SUFFIXES:
+                files.append(Path(root) / filename)
+    return files
+
+
+def hash_file(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        digest.update(b"<missing>")
+    return digest.digest()
+
+
+def hash_plugin_sources(plugin_dir: Path) -> str:
+    """Fingerprint of a plugin's source files, used to detect changes between runs"""
+    plugin_dir = Path(plugin_dir)
+    digest = hashlib.sha256()
+    for source_file in iter_source_files(plugin_dir):
+        digest.update(source_file.relative_to(plugin_dir).as_posix().encode("utf-8"))
+        digest.update(hash_file(source_file))
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """On-disk cache of per-plugin analysis results keyed by a content hash.
+
+    Entries are listed once on the first write and then tracked per plugin,
+    so a write only lists the directory again when it pushes the cache over
+    `max_size_mb`.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_mb: int = 256):
+        # Get the root directory (scripts/bug_hunt), next to checkpoints/
+        self.root_dir = Path(__file__).parent.parent
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root_dir / "cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        self._lock = threading.Lock()
+        # Entry sizes by plugin; None until the first write needs them
+        self._entries: Optional[Dict[str, Dict[Path, int]]] = None
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Setup logging
+        self.logger = logging.getLogger(__name__)
+        self.logger.debug(f"Initialized AnalysisCache with cache dir: {self.cache_dir}")
+
+    def compute_key(
+        self,
+        plugin_dir: Path,
+        config: Optional[Dict[str, Any]],
+        config_files: Iterable[Path],
+        tool_versions: Dict[str, str],
+        source_hash: Optional[str] = None,
+    ) -> str:
+        """Hash the plugin sources, effective configuration and tool versions.
+
+        Pass `source_hash` when the caller already fingerprinted the sources.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(tool_versions, sort_keys=True).encode("utf-8"))
+        digest.update(json.dumps(config or {}, sort_keys=True, default=str).encode("utf-8"))
+
+        for config_file in config_files:
+            digest.update(str(config_file).encode("utf-8"))
+            digest.update(hash_file(config_file))
+
+        digest.update((source_hash or hash_plugin_sources(plugin_dir)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, plugin_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a plugin, or None on a miss"""
+        entry = self._entry_path(plugin_name, key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        hydrate_result(result)
+
+        # Touch the entry so eviction treats it as recently used
+        os.utime(entry)
+        with self._lock:
+            self.hits += 1
+        self.logger.info(f"Cache hit for {plugin_name}")
+        return result
+
+    def contains(self, plugin_name: str, key: str) -> bool:
+        """Check for an entry without counting a hit or miss"""
+        return self._entry_path(plugin_name, key).exists()
+
+    def put(self, plugin_name: str, key: str, result: Dict[str, Any]) -> None:
+        """Store a result atomically, dropping stale entries for the same plugin"""
+        entry = self._entry_path(plugin_name, key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, default=json_default)
+            os.replace(tmp_path, entry)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        size = self._file_size(entry)
+        with self._lock:
+            if self._entries is None:
+                self._scan()
+            # Older results for the same plugin can never be hit again
+            for stale, stale_size in self._entries.pop(plugin_name, {}).items():
+                if stale != entry:
+                    stale.unlink(missing_ok=True)
+                self._size -= stale_size
+            self._entries[plugin_name] = {entry: size}
+            self._size += size
+            if self._size > self.max_size_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters for the current session"""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def _scan(self) -> List[tuple[float, int, Path]]:
+        """List the entries on disk, oldest first, and reset the tracked sizes from them"""
+        listed: List[tuple[float, int, Path]] = []
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            listed.append((stat.st_mtime, stat.st_size, entry))
+        listed.sort()
+
+        self._entries = {}
+        self._size = 0
+        for _, size, entry in listed:
+            self._entries.setdefault(self._plugin_of(entry), {})[entry] = size
+            self._size += size
+        return listed
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size budget"""
+        for _, size, entry in self._scan():
+            if self._size <= self.max_size_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            self._entries.get(self._plugin_of(entry), {}).pop(entry, None)
+            self._size -= size
+            self.evictions += 1
+            self.logger.debug(f"Evicted cache entry: {entry.name}")
+
+    @staticmethod
+    def _plugin_of(entry: Path) -> str:
+        return entry.stem.rsplit("--", 1)[0]
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _entry_path(self, plugin_name: str, key: str) -> Path:
+        return self.cache_dir / f"{plugin_name}--{key}.json"
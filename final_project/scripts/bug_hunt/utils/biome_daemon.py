@@ -0,0 +1,112 @@
+import logging
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# Fragments of Biome's stderr when `--use-server` lost its server, lowercased
+SERVER_FAILURE_SIGNATURES = (
+    "server is not running",
+    "failed to connect",
+    "connection refused",
+    "connection reset",
+    "broken pipe",
+    "daemon",
+)
+
+
+class BiomeDaemon:
+    """Lifecycle of a long-lived Biome server shared by every check in a session.
+
+    `biome start` launches the server (and is a no-op when one is already
+    running), `biome check --use-server` routes work through it so parsed
+    configuration and caches stay warm, and `biome stop` shuts it down.
+
+    `generation` counts restarts. Workers read it before a check and pass it
+    to `restart`, so when several of them see the same crash only the first
+    restarts the server and the rest simply retry against the new one.
+    """
+
+    def __init__(
+        self, work_dir: Path, base_cmd: Optional[List[str]] = None, health_interval: float = 30.0
+    ):
+        self.work_dir = Path(work_dir)
+        self.base_cmd = base_cmd or ["pnpm", "biome"]
+        self.health_interval = health_interval
+        self.running = False
+        self.restarts = 0
+        self.generation = 0
+        self._last_health_check = 0.0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        cmd = [*self.base_cmd, *args]
+        try:
+            return subprocess.run(
+                cmd,
+                cwd=str(self.work_dir),
+                capture_output=True,
+                text=True,
+                env={**os.environ},
+            )
+        except OSError as e:
+            # Missing or non-executable Biome: report the daemon as unavailable so
+            # checks fall back to one-shot runs
+            return subprocess.CompletedProcess(cmd, 127, "", str(e))
+
+    def start(self) -> bool:
+        """Start the server if it is not already running"""
+        with self._lock:
+            return self._start_locked()
+
+    def _start_locked(self) -> bool:
+        result = self._run("start")
+        self.running = result.returncode == 0
+        self._last_health_check = time.monotonic()
+        if self.running:
+            self.logger.info("Biome daemon is running")
+        else:
+            self.logger.error(f"Failed to start Biome daemon: {result.stderr.strip()}")
+        return self.running
+
+    def ensure_running(self) -> bool:
+        """Health-check the server at most once per interval, restarting it if it died"""
+        with self._lock:
+            if self.running and time.monotonic() - self._last_health_check < self.health_interval:
+                return True
+            # `biome start` is idempotent, so it doubles as a cheap liveness probe
+            return self._start_locked()
+
+    @staticmethod
+    def is_server_failure(stderr: str) -> bool:
+        """Whether a failed check's stderr points at the server rather than the code"""
+        stderr = (stderr or "").lower()
+        return any(signature in stderr for signature in SERVER_FAILURE_SIGNATURES)
+
+    def restart(self, generation: int) -> bool:
+        """Force a fresh server after a crash seen by a check started in `generation`"""
+        with self._lock:
+            if generation != self.generation:
+                # Someone else restarted the server since this check began
+                return self.running
+            self.logger.warning("Restarting Biome daemon")
+            self.restarts += 1
+            self.generation += 1
+            self._run("stop")
+            self.running = False
+            return self._start_locked()
+
+    def stop(self) -> None:
+        """Shut the server down at the end of a session"""
+        with self._lock:
+            if not self.running:
+                return
+            result = self._run("stop")
+            self.running = False
+            if result.returncode != 0:
+                self.logger.error(f"Failed to stop Biome daemon: {result.stderr.strip()}")
+            else:
+                self.logger.info("Biome daemon stopped")
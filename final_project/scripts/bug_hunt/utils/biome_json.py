@@ -0,0 +1,171 @@
+import json
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.diagnostics import BiomeDiagnostic
+
+logger = logging.getLogger(__name__)
+
+# Biome severities mapped onto the names used throughout the reports
+SEVERITY_MAP = {
+    "fatal": "error",
+    "error": "error",
+    "warning": "warning",
+    "information": "info",
+    "hint": "info",
+}
+
+
+class BiomeJsonStreamParser:
+    """Incremental parser for `biome check --reporter=json` output.
+
+    Biome writes a single JSON document of the form
+    `{"summary": {...}, "diagnostics": [...], "command": "check"}`. Chunks read
+    from the pipe are fed in as they arrive and each element of the
+    `diagnostics` array is decoded and yielded as soon as it is complete, so
+    only one diagnostic is ever held in the buffer at a time.
+
+    Decoding works from a scan position into the buffer instead of slicing it
+    after every element, and an incomplete element is only retried once a
+    chunk could have closed it, so parsing stays linear in the output size.
+    """
+
+    _ARRAY_KEY = '"diagnostics"'
+    # Whitespace and separators between array elements
+    _SEPARATORS = re.compile(r"[ \t\r\n,]*")
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        # The last decode attempt ran out of data in the middle of an element
+        self._incomplete = False
+        self._state = "prefix"  # prefix -> array -> suffix
+        self._prefix = ""
+        self._suffix = ""
+        self._line_cache_file: Optional[str] = None
+        self._line_starts: List[int] = []
+        self.summary: Dict[str, Any] = {}
+        self.counts = {"error": 0, "warning": 0, "info": 0}
+        self.files: set = set()
+
+    def feed(self, chunk: str) -> Iterator[BiomeDiagnostic]:
+        """Feed a chunk of reporter output and yield every diagnostic it completes"""
+        # Drop what was already decoded; only the unfinished tail is copied
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+
+        if self._state == "prefix":
+            key_pos = self._buffer.find(self._ARRAY_KEY)
+            if key_pos == -1:
+                return
+            bracket_pos = self._buffer.find("[", key_pos)
+            if bracket_pos == -1:
+                return
+            self._prefix = self._buffer[:key_pos]
+            self._buffer = self._buffer[bracket_pos + 1 :]
+            self._state = "array"
+
+        if self._state == "array":
+            # Every element is an object, so it cannot complete without a closing brace
+            if self._incomplete and "}" not in chunk:
+                return
+            yield from self._drain_array()
+
+        if self._state == "suffix":
+            self._suffix += self._buffer
+            self._buffer = ""
+
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing and return the reporter summary"""
+        if self._state == "prefix":
+            # No diagnostics array at all; the whole output is the document
+            document = self._buffer
+        else:
+            document = self._prefix + self._ARRAY_KEY + ": []" + self._suffix
+
+        try:
+            data = json.loads(document) if document.strip() else {}
+            self.summary = data.get("summary", {}) if isinstance(data, dict) else {}
+        except json.JSONDecodeError as e:
+            logger.error(f"Could not decode Biome JSON summary: {str(e)}")
+            self.summary = {}
+
+        self._buffer = ""
+        self._pos = 0
+        self._line_starts = []
+        return self.summary
+
+    def _drain_array(self) -> Iterator[BiomeDiagnostic]:
+        buffer = self._buffer
+        while True:
+            pos = self._SEPARATORS.match(buffer, self._pos).end()
+            self._pos = pos
+            if pos >= len(buffer):
+                self._incomplete = False
+                return
+            if buffer[pos] == "]":
+                self._buffer = buffer[pos + 1 :]
+                self._pos = 0
+                self._state = "suffix"
+                return
+            try:
+                element, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element not complete yet; wait for more data
+                self._incomplete = True
+                return
+            self._pos = end
+            yield self.to_diagnostic(element)
+
+    def to_diagnostic(self, element: Dict[str, Any]) -> BiomeDiagnostic:
+        """Convert one already decoded element of the `diagnostics` array"""
+        location = element.get("location") or {}
+        path = location.get("path") or {}
+        file_path = path.get("file", "") if isinstance(path, dict) else str(path)
+        line, column = self._resolve_position(file_path, location)
+
+        severity = SEVERITY_MAP.get(element.get("severity", "error"), "warning")
+        self.counts[severity] += 1
+        if file_path:
+            self.files.add(file_path)
+
+        message = element.get("description") or "".join(
+            part.get("content", "") for part in element.get("message", []) if isinstance(part, dict)
+        )
+
+        return BiomeDiagnostic(
+            message=message,
+            file_path=file_path,
+            line=line,
+            column=column,
+            severity=severity,
+            rule=element.get("category", "") or "",
+        )
+
+    def _resolve_position(self, file_path: str, location: Dict[str, Any]) -> tuple[int, int]:
+        """Convert a byte span into 1-based line/column using the embedded source"""
+        span = location.get("span")
+        source = location.get("sourceCode")
+        if not span or source is None:
+            return 0, 0
+
+        if file_path != self._line_cache_file:
+            # Diagnostics arrive grouped by file, so caching one table is enough
+            self._line_cache_file = file_path
+            self._line_starts = [0]
+            offset = 0
+            for line in source.encode("utf-8").splitlines(keepends=True):
+                offset += len(line)
+                self._line_starts.append(offset)
+
+        start = span[0]
+        lo, hi = 0, len(self._line_starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._line_starts[mid] <= start:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo + 1, start - self._line_starts[lo] + 1
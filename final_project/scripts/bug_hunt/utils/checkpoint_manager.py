@@ -1,83 +1,119 @@
 import json
-from pathlib import Path
-from datetime import datetime
 import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.diagnostics import biome_section, hydrate_result, json_default
+
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock still serializes our own writers
+    fcntl = None
+
+# Copies of the Biome output that can be rebuilt from "output" and are not journaled
+DERIVED_BIOME_FIELDS = ("raw_output", "all_output")
+
 
 class CheckpointManager:
-    def __init__(self):
+    """Session checkpoints stored as an append-only JSON-lines journal.
+
+    Every record (session header, analyzed plugin, error) is one line appended
+    with a single write, so saving progress costs O(1) regardless of how many
+    plugins were analyzed before. A torn final line from a crash is skipped on
+    load. Legacy whole-file `*.json` checkpoints are still read and updated.
+    """
+
+    def __init__(self, checkpoints_dir: Optional[Path] = None):
         # Get the root directory (scripts/bug_hunt)
         self.root_dir = Path(__file__).parent.parent
-        self.checkpoints_dir = self.root_dir / "checkpoints"
-        self.checkpoints_dir.mkdir(exist_ok=True)
+        self.checkpoints_dir = (
+            Path(checkpoints_dir) if checkpoints_dir else self.root_dir / "checkpoints"
+        )
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+
+        # Serialize appends when plugins finish concurrently
+        self._lock = threading.Lock()
+        self.active_checkpoint: Optional[Path] = None
 
         # Setup logging
         self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"Initialized CheckpointManager with checkpoints dir: {self.checkpoints_dir}")
+        self.logger.debug(
+            f"Initialized CheckpointManager with checkpoints dir: {self.checkpoints_dir}"
+        )
 
-    def start_session(self, session_name: str) -> str:
-        """Start a new analysis session"""
+    def start_session(self, session_name: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """Start a new analysis session, remembering the options needed to resume it"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        checkpoint_file = self.checkpoints_dir / f"{session_name}_{timestamp}.json"
-
-        checkpoint_data = {
-            "session_name": session_name,
-            "started_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "plugins_analyzed": [],
-            "errors": []
-        }
+        checkpoint_file = self.checkpoints_dir / f"{session_name}_{timestamp}.jsonl"
 
         self.logger.info(f"Starting new session: {session_name}")
         self.logger.info(f"Checkpoint file: {checkpoint_file}")
 
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        self._append(
+            checkpoint_file,
+            {
+                "type": "session",
+                "session_name": session_name,
+                "started_at": datetime.now().isoformat(),
+                "options": options or {},
+            },
+        )
+        self.active_checkpoint = checkpoint_file
 
         return str(checkpoint_file)
 
+    def resume_session(self, session_name: str) -> Optional[dict]:
+        """Make an existing session the active one so new progress is appended to it"""
+        checkpoint = self._get_latest_checkpoint(session_name)
+        if not checkpoint:
+            return None
+
+        data = self.load_checkpoint(checkpoint)
+        if checkpoint.suffix != ".json":
+            self._append(checkpoint, {"type": "resume", "resumed_at": datetime.now().isoformat()})
+        self.active_checkpoint = checkpoint
+
+        self.logger.info(f"Resuming session {session_name} from {checkpoint}")
+        return data
+
     def save_plugin_progress(self, plugin_name: str, analysis_result: dict) -> None:
         """Save analysis results for a plugin"""
-        latest_checkpoint = self._get_latest_checkpoint()
-        if not latest_checkpoint:
+        checkpoint = self._active_or_latest()
+        if not checkpoint:
             self.logger.error("No active session found")
             return
 
-        with open(latest_checkpoint, "r", encoding="utf-8") as f:
-            checkpoint_data = json.load(f)
-
-        # Update checkpoint data
-        checkpoint_data["plugins_analyzed"].append({
+        record = {
             "plugin_name": plugin_name,
             "analyzed_at": datetime.now().isoformat(),
-            "results": analysis_result
-        })
-        checkpoint_data["last_updated"] = datetime.now().isoformat()
-
-        with open(latest_checkpoint, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2)
+            "results": self._compact_result(analysis_result),
+        }
+        if checkpoint.suffix == ".json":
+            self._update_legacy(checkpoint, "plugins_analyzed", record)
+        else:
+            self._append(checkpoint, {"type": "plugin", **record})
 
         self.logger.info(f"Saved progress for plugin: {plugin_name}")
 
     def add_error(self, plugin_name: str, error_message: str) -> None:
         """Add an error to the current session"""
-        latest_checkpoint = self._get_latest_checkpoint()
-        if not latest_checkpoint:
+        checkpoint = self._active_or_latest()
+        if not checkpoint:
             self.logger.error("No active session found")
             return
 
-        with open(latest_checkpoint, "r", encoding="utf-8") as f:
-            checkpoint_data = json.load(f)
-
-        # Add error
-        checkpoint_data["errors"].append({
+        record = {
             "plugin_name": plugin_name,
             "error": error_message,
-            "timestamp": datetime.now().isoformat()
-        })
-        checkpoint_data["last_updated"] = datetime.now().isoformat()
-
-        with open(latest_checkpoint, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2)
+            "timestamp": datetime.now().isoformat(),
+        }
+        if checkpoint.suffix == ".json":
+            self._update_legacy(checkpoint, "errors", record)
+        else:
+            self._append(checkpoint, {"type": "error", **record})
 
         self.logger.error(f"Added error for plugin {plugin_name}: {error_message}")
 
@@ -87,15 +123,149 @@ class CheckpointManager:
         if not latest_checkpoint:
             return None
 
-        with open(latest_checkpoint, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return self.load_checkpoint(latest_checkpoint)
 
-    def _get_latest_checkpoint(self, session_name: str = None) -> Path:
-        """Get the path to the latest checkpoint file"""
+    def latest_checkpoint(self, session_name: str = None) -> Optional[Path]:
+        """Path of the latest checkpoint, optionally for one session"""
+        return self._get_latest_checkpoint(session_name)
+
+    def load_checkpoint(self, checkpoint: Path) -> dict:
+        """Load a journal or legacy checkpoint into the session dict shape"""
+        if checkpoint.suffix == ".json":
+            with open(checkpoint, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return self._replay(checkpoint)
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Summaries of every checkpoint, oldest first"""
+        sessions = []
+        for checkpoint in self._checkpoint_files():
+            data = self.load_checkpoint(checkpoint)
+            sessions.append(
+                {
+                    "session_name": data.get("session_name", checkpoint.stem),
+                    "last_updated": data.get("last_updated", ""),
+                    "plugins_analyzed": len(data.get("plugins_analyzed", [])),
+                    "path": str(checkpoint),
+                }
+            )
+        return sessions
+
+    def _active_or_latest(self) -> Optional[Path]:
+        if self.active_checkpoint and self.active_checkpoint.exists():
+            return self.active_checkpoint
+        return self._get_latest_checkpoint()
+
+    def _append(self, checkpoint: Path, record: Dict[str, Any]) -> None:
+        """Append one record as a single line and flush it to disk"""
+        line = (json.dumps(record, separators=(",", ":"), default=json_default) + "\n").encode(
+            "utf-8"
+        )
+        with self._lock:
+            with open(checkpoint, "ab+") as f:
+                if fcntl:
+                    # Also serialize against other processes writing the same session
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    # Start on a fresh line if a crash left a torn record behind
+                    end = f.seek(0, os.SEEK_END)
+                    if end:
+                        f.seek(end - 1)
+                        if f.read(1) != b"\n":
+                            line = b"\n" + line
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                finally:
+                    if fcntl:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _replay(self, checkpoint: Path) -> dict:
+        """Rebuild the session dict from a journal, ignoring a torn trailing line"""
+        data = {
+            "session_name": checkpoint.stem,
+            "started_at": "",
+            "last_updated": "",
+            "options": {},
+            "plugins_analyzed": [],
+            "errors": [],
+        }
+        with open(checkpoint, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(
+                        f"Skipping corrupt record {line_number} in {checkpoint.name}"
+                    )
+                    continue
+
+                record_type = record.pop("type", None)
+                if record_type == "session":
+                    data["session_name"] = record.get("session_name", data["session_name"])
+                    data["started_at"] = record.get("started_at", "")
+                    data["last_updated"] = data["started_at"]
+                    data["options"] = record.get("options", {})
+                elif record_type == "resume":
+                    data["last_updated"] = record.get("resumed_at", data["last_updated"])
+                elif record_type == "plugin":
+                    record["results"] = self._expand_result(record.get("results", {}))
+                    data["plugins_analyzed"].append(record)
+                    data["last_updated"] = record.get("analyzed_at", data["last_updated"])
+                elif record_type == "error":
+                    data["errors"].append(record)
+                    data["last_updated"] = record.get("timestamp", data["last_updated"])
+        return data
+
+    def _update_legacy(self, checkpoint: Path, key: str, record: Dict[str, Any]) -> None:
+        """Whole-file rewrite for sessions started before the journal format"""
+        with self._lock:
+            with open(checkpoint, "r", encoding="utf-8") as f:
+                checkpoint_data = json.load(f)
+
+            checkpoint_data[key].append(record)
+            checkpoint_data["last_updated"] = datetime.now().isoformat()
+
+            with open(checkpoint, "w", encoding="utf-8") as f:
+                json.dump(checkpoint_data, f, indent=2, default=json_default)
+
+    @staticmethod
+    def _compact_result(analysis_result: dict) -> dict:
+        """Drop Biome output copies that can be rebuilt from the "output" field"""
+        biome = biome_section(analysis_result)
+        if biome is None or not any(field in biome for field in DERIVED_BIOME_FIELDS):
+            return analysis_result
+
+        compact_biome = {k: v for k, v in biome.items() if k not in DERIVED_BIOME_FIELDS}
+        return {
+            **analysis_result,
+            "results": {**analysis_result["results"], "biome": compact_biome},
+        }
+
+    @staticmethod
+    def _expand_result(result: dict) -> dict:
+        """Restore the Biome output copies dropped by _compact_result and the diagnostics table"""
+        biome = biome_section(hydrate_result(result))
+        if biome is not None:
+            output = biome.get("output", "")
+            errors = biome.get("errors", "")
+            biome.setdefault("all_output", output.splitlines() if output else [])
+            biome.setdefault("raw_output", f"STDOUT:\n{output}\n\nSTDERR:\n{errors}")
+        return result
+
+    def _checkpoint_files(self) -> List[Path]:
         if not self.checkpoints_dir.exists():
-            return None
+            return []
+        checkpoints = list(self.checkpoints_dir.glob("*.jsonl")) + list(
+            self.checkpoints_dir.glob("*.json")
+        )
+        return sorted(checkpoints, key=lambda x: x.stat().st_mtime)
 
-        checkpoints = list(self.checkpoints_dir.glob("*.json"))
+    def _get_latest_checkpoint(self, session_name: str = None) -> Path:
+        """Get the path to the latest checkpoint file"""
+        checkpoints = self._checkpoint_files()
         if not checkpoints:
             return None
 
@@ -105,8 +275,9 @@ class CheckpointManager:
             if not checkpoints:
                 return None
 
-        # Sort by modification time and return latest
-        return sorted(checkpoints, key=lambda x: x.stat().st_mtime)[-1]
+        # Sorted by modification time; return latest
+        return checkpoints[-1]
+
 
 if __name__ == "__main__":
     # Test the checkpoint manager
@@ -114,15 +285,14 @@ if __name__ == "__main__":
     cm.start_session("test_analysis")
 
     # Simulate some analysis
-    cm.save_plugin_progress("plugin-test", {
-        "errors_found": 5,
-        "warnings": 10,
-        "files_analyzed": ["test1.ts", "test2.ts"]
-    })
+    cm.save_plugin_progress(
+        "plugin-test",
+        {"errors_found": 5, "warnings": 10, "files_analyzed": ["test1.ts", "test2.ts"]},
+    )
 
     # Simulate an error
     cm.add_error("plugin-test", "Failed to parse file.ts")
 
     # Load the session back
     loaded = cm.load_latest_session("test_analysis")
-    print(json.dumps(loaded, indent=2))
+    print(json.dumps(loaded, indent=2, default=json_default))
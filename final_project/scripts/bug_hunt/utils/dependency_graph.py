@@ -0,0 +1,780 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import esprima
+
+from utils.analysis_cache import SKIP_DIRS
+
+# Bump when specifier extraction changes so cached results are not reused
+PARSER_VERSION = "1"
+
+# Module files the graph follows, in the order extensionless specifiers are tried
+SOURCE_EXTENSIONS = (".ts", ".tsx", ".mts", ".cts", ".js", ".jsx", ".mjs", ".cjs")
+# TypeScript sources compiled to the JavaScript extension a specifier names
+COMPILED_EXTENSIONS = {
+    ".js": (".ts", ".tsx"),
+    ".jsx": (".tsx",),
+    ".mjs": (".mts",),
+    ".cjs": (".cts",),
+}
+
+# Single pass over the source: comments and string literals are consumed whole so
+# import-like text inside them is never mistaken for a real import
+_LEXICAL = re.compile(
+    r"""
+      //[^\n]*
+    | /\*.*?\*/
+    | (?<![\w$.])(?:import|export)\s+(?:type\s+)?(?:[\w$*{}\s,]+?\s+from\s*)?(?P<q1>["'])(?P<static>[^"'\n]+)(?P=q1)
+    | (?<![\w$.])(?:require|import)\s*\(\s*(?P<q2>["'`])(?P<call>[^"'`\n$]+)(?P=q2)\s*\)
+    | "(?:\\.|[^"\\\n])*"
+    | '(?:\\.|[^'\\\n])*'
+    | `(?:\\.|[^`\\])*`
+    """,
+    re.S | re.X,
+)
+_JSON_COMMENT = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.S)
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
+
+def lexical_specifiers(source: str) -> List[str]:
+    """Module specifiers found by scanning tokens, for syntax esprima cannot parse (e.g. TypeScript)"""
+    specifiers = []
+    for match in _LEXICAL.finditer(source):
+        specifier = match.group("static") or match.group("call")
+        if specifier:
+            specifiers.append(specifier)
+    return specifiers
+
+
+def parse_specifiers(source: str, suffix: str = ".js") -> List[str]:
+    """Specifiers of import/export-from/require/import() in a module, in source order"""
+    specifiers: List[str] = []
+
+    def collect(node, metadata) -> None:
+        if node.type in ("ImportDeclaration", "ExportAllDeclaration", "ExportNamedDeclaration"):
+            if getattr(node, "source", None) is not None:
+                specifiers.append(node.source.value)
+        elif (
+            node.type == "CallExpression" and node.arguments and node.arguments[0].type == "Literal"
+        ):
+            callee = node.callee
+            if callee.type == "Import" or (
+                callee.type == "Identifier" and callee.name == "require"
+            ):
+                if isinstance(node.arguments[0].value, str):
+                    specifiers.append(node.arguments[0].value)
+
+    try:
+        esprima.parseModule(source, {"jsx": suffix in (".jsx", ".tsx"), "tolerant": True}, collect)
+    except (esprima.Error, RecursionError):
+        # Type annotations and other TS-only syntax; usually fails within the first few lines
+        return list(dict.fromkeys(lexical_specifiers(source)))
+    return list(dict.fromkeys(specifiers))
+
+
+def load_jsonc(path: Path) -> Dict:
+    """JSON with comments and trailing commas, as used by tsconfig files"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    text = _JSON_COMMENT.sub(lambda m: m.group(0) if m.group(0).startswith('"') else "", text)
+    return json.loads(_TRAILING_COMMA.sub(r"\1", text))
+
+
+def workspace_packages(work_dir: Path) -> Dict[str, Path]:
+    """Workspace package names mapped to their directories.
+
+    Package globs come from pnpm-workspace.yaml, falling back to the
+    `workspaces` field of the root package.json.
+    """
+    work_dir = Path(work_dir)
+    patterns: List[str] = []
+    workspace_file = work_dir / "pnpm-workspace.yaml"
+    if workspace_file.exists():
+        in_packages = False
+        for line in workspace_file.read_text(encoding="utf-8").splitlines():
+            stripped = line.split("#", 1)[0].strip()
+            if not stripped:
+                continue
+            if not line[0].isspace():
+                in_packages = stripped.startswith("packages:")
+            elif in_packages and stripped.startswith("-"):
+                patterns.append(stripped[1:].strip().strip("\"'"))
+    else:
+        try:
+            with open(work_dir / "package.json", "r", encoding="utf-8") as f:
+                workspaces = json.load(f).get("workspaces", [])
+            patterns = (
+                workspaces.get("packages", []) if isinstance(workspaces, dict) else list(workspaces)
+            )
+        except (FileNotFoundError, json.JSONDecodeError):
+            patterns = []
+
+    excluded = {
+        path
+        for pattern in patterns
+        if pattern.startswith("!")
+        for path in work_dir.glob(pattern[1:])
+    }
+    packages: Dict[str, Path] = {}
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            continue
+        for package_dir in sorted(work_dir.glob(pattern.rstrip("/"))):
+            if package_dir in excluded or "node_modules" in package_dir.parts:
+                continue
+            try:
+                with open(package_dir / "package.json", "r", encoding="utf-8") as f:
+                    name = json.load(f).get("name")
+            except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError):
+                continue
+            if name:
+                packages[name] = package_dir.resolve()
+    return packages
+
+
+def iter_module_files(package_dir: Path) -> List[Path]:
+    """Module sources of a package in a stable order, skipping build output"""
+    files = []
+    for root, dirs, filenames in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1] in SOURCE_EXTENSIONS:
+                files.append(Path(root) / filename)
+    return files
+
+
+def strongly_connected_components(
+    graph: Dict[Hashable, Sequence[Hashable]]
+) -> List[List[Hashable]]:
+    """Tarjan's algorithm, iterative so deep import chains cannot hit the recursion limit"""
+    index: Dict[Hashable, int] = {}
+    lowlink: Dict[Hashable, int] = {}
+    on_stack = set()
+    stack: List[Hashable] = []
+    components: List[List[Hashable]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph.get(root, ())))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, neighbours = work[-1]
+            advanced = False
+            for neighbour in neighbours:
+                if neighbour not in index:
+                    index[neighbour] = lowlink[neighbour] = len(index)
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(graph.get(neighbour, ()))))
+                    advanced = True
+                    break
+                if neighbour in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbour])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component[::-1])
+    return components
+
+
+def cyclic_components(graph: Dict[Hashable, Sequence[Hashable]]) -> List[List[Hashable]]:
+    """Strongly connected components that contain a cycle, including modules importing themselves"""
+    return [
+        component
+        for component in strongly_connected_components(graph)
+        if len(component) > 1 or component[0] in graph.get(component[0], ())
+    ]
+
+
+def shortest_cycle(
+    graph: Dict[Hashable, Sequence[Hashable]], start: Hashable, members: set
+) -> List[Hashable]:
+    """Shortest `start -> ... -> start` path inside a strongly connected component, without the closing node"""
+    previous: Dict[Hashable, Hashable] = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if start in graph.get(node, ()):
+            path = [node]
+            while path[-1] != start:
+                path.append(previous[path[-1]])
+            return path[::-1]
+        for neighbour in graph.get(node, ()):
+            if neighbour in members and neighbour not in previous and neighbour != start:
+                previous[neighbour] = node
+                queue.append(neighbour)
+    return [start]
+
+
+def find_cycles(graph: Dict[Hashable, Sequence[Hashable]]) -> List[List[Hashable]]:
+    """One shortest cycle per strongly connected component, in the `a -> b -> ... -> a` order madge reports"""
+    return [
+        shortest_cycle(graph, component[0], set(component))
+        for component in cyclic_components(graph)
+    ]
+
+
+@dataclass
+class TsConfig:
+    base_url: Optional[Path] = None
+    paths: Dict[str, List[str]] = field(default_factory=dict)
+    # Directory `paths` targets are relative to when there is no baseUrl
+    paths_base: Optional[Path] = None
+
+
+class ModuleResolver:
+    """Resolves specifiers to files: relative paths, tsconfig `paths`/`baseUrl` and workspace packages.
+
+    Anything else is a third-party or Node built-in module and is reported as
+    external.
+    """
+
+    def __init__(self, work_dir: Path, packages: Optional[Dict[str, Path]] = None):
+        self.work_dir = Path(work_dir).resolve()
+        self.packages = packages if packages is not None else workspace_packages(self.work_dir)
+        # Longest names first so "@scope/pkg-extra" is not matched as "@scope/pkg"
+        self._package_names = sorted(self.packages, key=len, reverse=True)
+        self._tsconfigs: Dict[Path, TsConfig] = {}
+        self._probes: Dict[str, Optional[Path]] = {}
+        self._entries: Dict[str, Optional[Path]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def resolve(self, specifier: str, from_file: Path) -> Tuple[str, Optional[Path]]:
+        """("file", path), ("external", None) or ("unresolved", None)"""
+        if specifier.startswith((".", "/")):
+            base = Path(specifier) if specifier.startswith("/") else from_file.parent / specifier
+            found = self._probe(base)
+            return ("file", found) if found else ("unresolved", None)
+
+        tsconfig = self._tsconfig(from_file.parent)
+        for pattern, targets in tsconfig.paths.items():
+            prefix, star, suffix = pattern.partition("*")
+            if star:
+                if not (specifier.startswith(prefix) and specifier.endswith(suffix)) or len(
+                    specifier
+                ) < len(prefix) + len(suffix):
+                    continue
+                matched = specifier[len(prefix) : len(specifier) - len(suffix)]
+            elif specifier != pattern:
+                continue
+            else:
+                matched = ""
+            for target in targets:
+                found = self._probe(
+                    (tsconfig.base_url or tsconfig.paths_base) / target.replace("*", matched)
+                )
+                if found:
+                    return "file", found
+
+        for name in self._package_names:
+            if specifier == name or specifier.startswith(name + "/"):
+                found = self._package_entry(name, specifier[len(name) + 1 :])
+                return ("file", found) if found else ("unresolved", None)
+
+        if tsconfig.base_url:
+            found = self._probe(tsconfig.base_url / specifier)
+            if found:
+                return "file", found
+        return "external", None
+
+    def _probe(self, base: Path) -> Optional[Path]:
+        """First existing module file for an import path, trying TS sources and index files"""
+        key = os.path.normpath(base)
+        if key in self._probes:
+            return self._probes[key]
+
+        stem, extension = os.path.splitext(key)
+        candidates = []
+        if extension in SOURCE_EXTENSIONS or extension == ".json":
+            candidates.append(key)
+        candidates.extend(stem + compiled for compiled in COMPILED_EXTENSIONS.get(extension, ()))
+        candidates.extend(key + ext for ext in SOURCE_EXTENSIONS)
+        candidates.extend(os.path.join(key, "index" + ext) for ext in SOURCE_EXTENSIONS)
+
+        found = next(
+            (Path(candidate) for candidate in candidates if os.path.isfile(candidate)), None
+        )
+        self._probes[key] = found
+        return found
+
+    def _package_entry(self, name: str, subpath: str) -> Optional[Path]:
+        """Source file behind a workspace package import, preferring src/ over build output"""
+        key = f"{name}/{subpath}"
+        if key in self._entries:
+            return self._entries[key]
+
+        package_dir = self.packages[name]
+        candidates: List[str] = []
+        try:
+            with open(package_dir / "package.json", "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            manifest = {}
+
+        export = (
+            (manifest.get("exports") or {}) if isinstance(manifest.get("exports"), dict) else {}
+        )
+        target = export.get(f"./{subpath}" if subpath else ".")
+        candidates.extend(self._export_targets(target))
+        if subpath:
+            candidates.extend([f"src/{subpath}", subpath])
+        else:
+            candidates.append("src/index")
+            candidates.extend(
+                manifest.get(field) for field in ("types", "module", "main") if manifest.get(field)
+            )
+            candidates.append("index")
+
+        found = None
+        for candidate in candidates:
+            # Build output usually mirrors src/, and may not exist in a fresh checkout
+            for variant in (
+                re.sub(r"^\.?/?dist/", "src/", candidate).removesuffix(".d.ts"),
+                candidate,
+            ):
+                found = self._probe(package_dir / variant)
+                if found:
+                    break
+            if found:
+                break
+        self._entries[key] = found
+        return found
+
+    @classmethod
+    def _export_targets(cls, target) -> List[str]:
+        """Every file path in a (possibly conditional) package.json exports target"""
+        if isinstance(target, str):
+            return [target]
+        if isinstance(target, list):
+            return [path for item in target for path in cls._export_targets(item)]
+        if isinstance(target, dict):
+            return [path for value in target.values() for path in cls._export_targets(value)]
+        return []
+
+    def _tsconfig(self, directory: Path) -> TsConfig:
+        """Effective path mapping of the nearest tsconfig.json at or above a directory"""
+        if directory in self._tsconfigs:
+            return self._tsconfigs[directory]
+
+        config_file = directory / "tsconfig.json"
+        if config_file.is_file():
+            config = self._load_tsconfig(config_file, set())
+        elif directory == self.work_dir or directory.parent == directory:
+            config = TsConfig()
+        else:
+            config = self._tsconfig(directory.parent)
+        self._tsconfigs[directory] = config
+        return config
+
+    def _load_tsconfig(self, config_file: Path, seen: set) -> TsConfig:
+        seen.add(config_file)
+        try:
+            data = load_jsonc(config_file)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Could not read {config_file}: {str(e)}")
+            return TsConfig()
+
+        config = TsConfig()
+        extends = data.get("extends") or []
+        for parent in [extends] if isinstance(extends, str) else extends:
+            if parent.startswith("."):
+                parent_file = (config_file.parent / parent).resolve()
+            else:
+                parent_file = self.work_dir / "node_modules" / parent
+                if parent_file.is_dir():
+                    parent_file = parent_file / "tsconfig.json"
+            if parent_file.suffix != ".json":
+                parent_file = parent_file.with_name(parent_file.name + ".json")
+            if parent_file.is_file() and parent_file not in seen:
+                # Later parents override earlier ones option by option, like tsc
+                inherited = self._load_tsconfig(parent_file, seen)
+                if inherited.base_url:
+                    config.base_url = inherited.base_url
+                if inherited.paths:
+                    config.paths, config.paths_base = inherited.paths, inherited.paths_base
+
+        options = data.get("compilerOptions") or {}
+        if options.get("baseUrl"):
+            config.base_url = (config_file.parent / options["baseUrl"]).resolve()
+        if isinstance(options.get("paths"), dict):
+            config.paths = options["paths"]
+            config.paths_base = config_file.parent.resolve()
+        return config
+
+
+class SpecifierCache:
+    """Extracted specifiers keyed by file content hash, persisted between runs.
+
+    Entries not used for `max_age_days` are dropped on save.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, max_age_days: int = 30):
+        # Get the root directory (scripts/bug_hunt)
+        root_dir = Path(__file__).parent.parent
+        self.cache_file = (
+            Path(cache_file)
+            if cache_file
+            else root_dir / "cache" / "dependencies" / "specifiers.json"
+        )
+        self.max_age = max_age_days * 24 * 3600
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+        self._entries = self._load()
+
+    def specifiers(self, path: Path) -> Optional[List[str]]:
+        """Specifiers of a module file, parsing it only if its content is new; None if unreadable"""
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        key = hashlib.sha256(PARSER_VERSION.encode("utf-8") + content).hexdigest()
+        now = int(time.time())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                if now - entry["t"] > 3600:
+                    entry["t"] = now
+                    self._dirty = True
+                return entry["s"]
+            self.misses += 1
+
+        specifiers = parse_specifiers(content.decode("utf-8", errors="replace"), path.suffix)
+        with self._lock:
+            self._entries[key] = {"s": specifiers, "t": now}
+            self._dirty = True
+        return specifiers
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            cutoff = time.time() - self.max_age
+            self._entries = {
+                key: entry for key, entry in self._entries.items() if entry["t"] >= cutoff
+            }
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": PARSER_VERSION, "entries": self._entries}, f)
+                os.replace(tmp_path, self.cache_file)
+                self._dirty = False
+            except OSError as e:
+                self.logger.warning(f"Could not save dependency cache: {str(e)}")
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return data.get("entries", {}) if data.get("version") == PARSER_VERSION else {}
+
+
+class DependencyAnalyzer:
+    """In-process circular dependency check for a plugin, in place of madge.
+
+    Module files are followed from the plugin's sources (or the given files)
+    through every import that resolves inside the plugin; cycles are the
+    strongly connected components of that graph.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        cache: Optional[SpecifierCache] = None,
+        resolver: Optional[ModuleResolver] = None,
+    ):
+        self.work_dir = Path(work_dir).resolve()
+        self.resolver = resolver or ModuleResolver(self.work_dir)
+        self.cache = cache or SpecifierCache()
+        self.logger = logging.getLogger(__name__)
+
+    def analyze(self, plugin_dir: Path, files: Optional[Iterable[str]] = None) -> Dict:
+        plugin_dir = Path(plugin_dir).resolve()
+        roots = [plugin_dir / f for f in files] if files else iter_module_files(plugin_dir)
+        roots = [root for root in roots if root.suffix in SOURCE_EXTENSIONS and root.is_file()]
+
+        graph: Dict[Path, List[Path]] = {}
+        warnings: List[str] = []
+        external = 0
+        queue = deque(roots)
+        while queue:
+            module = queue.popleft()
+            if module in graph:
+                continue
+            graph[module] = []
+            if module.suffix not in SOURCE_EXTENSIONS:
+                continue
+            for specifier in self.cache.specifiers(module) or []:
+                kind, target = self.resolver.resolve(specifier, module)
+                if kind == "unresolved":
+                    warnings.append(
+                        f"{module.relative_to(plugin_dir).as_posix()}: cannot resolve '{specifier}'"
+                    )
+                elif target is None or not target.is_relative_to(plugin_dir):
+                    external += 1
+                else:
+                    graph[module].append(target)
+                    queue.append(target)
+        self.cache.save()
+
+        cycles = [
+            [module.relative_to(plugin_dir).as_posix() for module in cycle]
+            for cycle in find_cycles(graph)
+        ]
+        if cycles:
+            self.logger.warning(f"Found {len(cycles)} circular dependencies in {plugin_dir.name}")
+        return {
+            # Like madge --circular, finding cycles fails the check
+            "success": not cycles,
+            "dependencies": cycles,
+            "errors": "",
+            "warnings": warnings,
+            "stats": {
+                "modules": len(graph),
+                "edges": sum(len(targets) for targets in graph.values()),
+                "external_imports": external,
+            },
+        }
+
+
+class WorkspaceGraph:
+    """Module graph of every workspace package, built once per session.
+
+    Each file is parsed and each import resolved once, whichever plugins
+    import it. Per-plugin questions (cycles touching the plugin, including
+    ones that run through other packages, and fan-in/fan-out) are answered
+    from indexes over that single graph, in time proportional to the
+    plugin's own files.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        cache: Optional[SpecifierCache] = None,
+        resolver: Optional[ModuleResolver] = None,
+    ):
+        self.work_dir = Path(work_dir).resolve()
+        self.resolver = resolver or ModuleResolver(self.work_dir)
+        self.cache = cache or SpecifierCache()
+        self.logger = logging.getLogger(__name__)
+
+        self.graph: Dict[Path, List[Path]] = {}
+        self.importers: Dict[Path, List[Path]] = {}
+        self.package_of: Dict[Path, str] = {}
+        self.package_files: Dict[Path, List[Path]] = {}
+        self.external: Dict[Path, int] = {}
+        self.unresolved: Dict[Path, List[str]] = {}
+        self.components: List[List[Path]] = []
+        self.component_of: Dict[Path, int] = {}
+        self.built = False
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def build(self) -> None:
+        """Parse and link every workspace module; later calls return immediately"""
+        with self._lock:
+            if self.built:
+                return
+            start = time.perf_counter()
+
+            # Shallower packages first, so a package nested inside another claims its own files
+            for name, package_dir in sorted(
+                self.resolver.packages.items(), key=lambda item: len(item[1].parts)
+            ):
+                self.package_files[package_dir] = []
+                for module in iter_module_files(package_dir):
+                    self.package_of[module] = name
+            for module, name in self.package_of.items():
+                self.package_files[self.resolver.packages[name]].append(module)
+
+            queue = deque(self.package_of)
+            while queue:
+                module = queue.popleft()
+                if module in self.graph:
+                    continue
+                targets = self.graph[module] = []
+                self.importers.setdefault(module, [])
+                if module.suffix not in SOURCE_EXTENSIONS:
+                    continue
+                for specifier in self.cache.specifiers(module) or []:
+                    kind, target = self.resolver.resolve(specifier, module)
+                    if kind == "unresolved":
+                        self.unresolved.setdefault(module, []).append(specifier)
+                    elif target is None or "node_modules" in target.parts:
+                        self.external[module] = self.external.get(module, 0) + 1
+                    elif target not in targets:
+                        targets.append(target)
+                        self.importers.setdefault(target, []).append(module)
+                        queue.append(target)
+            self.cache.save()
+
+            # Imported files that are not module sources (e.g. JSON) still belong to a package
+            package_names = {directory: name for name, directory in self.resolver.packages.items()}
+            for module in self.graph:
+                if module not in self.package_of:
+                    owner = next(
+                        (
+                            package_names[parent]
+                            for parent in module.parents
+                            if parent in package_names
+                        ),
+                        None,
+                    )
+                    if owner:
+                        self.package_of[module] = owner
+
+            self.components = cyclic_components(self.graph)
+            for number, component in enumerate(self.components):
+                for module in component:
+                    self.component_of[module] = number
+
+            self.built = True
+            cross = sum(
+                1
+                for component in self.components
+                if len({self.package_of.get(m) for m in component}) > 1
+            )
+            self.logger.info(
+                f"Built workspace dependency graph: {len(self.graph)} modules, "
+                f"{sum(len(t) for t in self.graph.values())} imports, {len(self.components)} cycles "
+                f"({cross} across packages) in {time.perf_counter() - start:.2f}s"
+            )
+
+    def contains(self, plugin_dir: Path) -> bool:
+        """Whether a plugin is one of the workspace packages, answered without building the graph"""
+        return Path(plugin_dir).resolve() in self.resolver.packages.values()
+
+    def fingerprint(self) -> str:
+        """Fingerprint of everything the graph is built from, computed once per session.
+
+        Only file sizes and modification times are read, so it costs a
+        directory walk instead of the parse-and-resolve pass of `build`.
+        """
+        with self._lock:
+            if self._fingerprint is not None:
+                return self._fingerprint
+            digest = hashlib.sha256(PARSER_VERSION.encode("utf-8"))
+            directories = sorted({self.work_dir, *self.resolver.packages.values()})
+            configs = [
+                directory / name
+                for directory in directories
+                for name in ("pnpm-workspace.yaml", "package.json", "tsconfig.json")
+            ]
+            modules = [
+                module
+                for package_dir in sorted(self.resolver.packages.values())
+                for module in iter_module_files(package_dir)
+            ]
+            for path in configs + modules:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+            return self._fingerprint
+
+    def plugin_report(self, plugin_dir: Path) -> Dict:
+        """Dependency result for one workspace package, in the shape run_dependency_check returns"""
+        self.build()
+        plugin_dir = Path(plugin_dir).resolve()
+        files = self.package_files[plugin_dir]
+        package = next(
+            name for name, directory in self.resolver.packages.items() if directory == plugin_dir
+        )
+
+        def outside(module: Path) -> bool:
+            return self.package_of.get(module) != package
+
+        def display(module: Path) -> str:
+            # Modules in other packages are shown relative to the plugin, e.g. ../core/src/index.ts
+            return Path(os.path.relpath(module, plugin_dir)).as_posix()
+
+        cycles: List[List[str]] = []
+        cross_package = 0
+        seen = set()
+        for module in files:
+            number = self.component_of.get(module)
+            if number is None or number in seen:
+                continue
+            seen.add(number)
+            component = self.components[number]
+            # Start from one of the plugin's own modules so the reported cycle goes through it
+            cycle = shortest_cycle(self.graph, module, set(component))
+            cross_package += any(outside(member) for member in component)
+            cycles.append([display(member) for member in cycle])
+
+        imported = {
+            target for module in files for target in self.graph.get(module, ()) if outside(target)
+        }
+        importers = {
+            source
+            for module in files
+            for source in self.importers.get(module, ())
+            if outside(source)
+        }
+        warnings = [
+            f"{display(module)}: cannot resolve '{specifier}'"
+            for module in files
+            for specifier in self.unresolved.get(module, ())
+        ]
+
+        if cycles:
+            self.logger.warning(
+                f"Found {len(cycles)} circular dependencies in {plugin_dir.name} ({cross_package} across packages)"
+            )
+        return {
+            # Like madge --circular, finding cycles fails the check
+            "success": not cycles,
+            "dependencies": cycles,
+            "errors": "",
+            "warnings": warnings,
+            # Lets a cached copy of this report be reused while the workspace is unchanged
+            "workspace_fingerprint": self.fingerprint(),
+            "stats": {
+                "modules": len(files),
+                "edges": sum(len(self.graph.get(module, ())) for module in files),
+                "external_imports": sum(self.external.get(module, 0) for module in files),
+                "cross_package_cycles": cross_package,
+            },
+            "fan_out": {
+                "modules": len(imported),
+                "packages": sorted({self.package_of[m] for m in imported if m in self.package_of}),
+            },
+            "fan_in": {
+                "modules": len(importers),
+                "packages": sorted({self.package_of[m] for m in importers if m in self.package_of}),
+            },
+        }
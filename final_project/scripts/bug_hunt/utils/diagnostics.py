@@ -0,0 +1,261 @@
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Severity codes stored in the table, in report order
+SEVERITIES = ("error", "warning", "info")
+_SEVERITY_CODES = {name: code for code, name in enumerate(SEVERITIES)}
+
+# Marks the serialized columnar form in checkpoints and cache entries
+TABLE_FORMAT = "diagnostic-table/1"
+
+
+@dataclass(slots=True)
+class BiomeDiagnostic:
+    message: str
+    file_path: str
+    line: int
+    column: int
+    severity: str
+    rule: str
+    code_snippet: Optional[List[str]] = None
+
+
+class DiagnosticTable:
+    """Columnar store for the diagnostics of one Biome run.
+
+    Positions and severities live in typed arrays, file paths and rule names
+    are interned into lookup lists, and code snippets are kept sparsely, so a
+    plugin with tens of thousands of diagnostics costs a few machine words per
+    row instead of a dict each. The same object is handed from the parsers to
+    the report generator and is serialized column-wise for checkpoints and the
+    analysis cache.
+    """
+
+    __slots__ = (
+        "paths",
+        "rules",
+        "_path_ids",
+        "_rule_ids",
+        "file_ids",
+        "rule_ids",
+        "lines",
+        "columns",
+        "severities",
+        "messages",
+        "snippets",
+    )
+
+    def __init__(self):
+        self.paths: List[str] = []
+        self.rules: List[str] = []
+        self._path_ids: Dict[str, int] = {}
+        self._rule_ids: Dict[str, int] = {}
+        self.file_ids = array("I")
+        self.rule_ids = array("I")
+        self.lines = array("I")
+        self.columns = array("I")
+        self.severities = array("B")
+        self.messages: List[str] = []
+        self.snippets: Dict[int, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def __iter__(self) -> Iterator[BiomeDiagnostic]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def append(
+        self,
+        file_path: str,
+        line: int,
+        column: int,
+        severity: str,
+        rule: str,
+        message: str,
+        code_snippet: Optional[List[str]] = None,
+    ) -> None:
+        """Add one diagnostic, interning its path and rule"""
+        file_id = self._path_ids.get(file_path)
+        if file_id is None:
+            file_id = self._path_ids[file_path] = len(self.paths)
+            self.paths.append(file_path)
+        rule_id = self._rule_ids.get(rule)
+        if rule_id is None:
+            rule_id = self._rule_ids[rule] = len(self.rules)
+            self.rules.append(rule)
+
+        if code_snippet:
+            self.snippets[len(self.messages)] = code_snippet
+        self.file_ids.append(file_id)
+        self.rule_ids.append(rule_id)
+        self.lines.append(max(int(line or 0), 0))
+        self.columns.append(max(int(column or 0), 0))
+        self.severities.append(_SEVERITY_CODES.get(severity, _SEVERITY_CODES["warning"]))
+        self.messages.append(message or "")
+
+    def add(self, diagnostic: BiomeDiagnostic) -> None:
+        self.append(
+            diagnostic.file_path,
+            diagnostic.line,
+            diagnostic.column,
+            diagnostic.severity,
+            diagnostic.rule,
+            diagnostic.message,
+            diagnostic.code_snippet,
+        )
+
+    def extend(self, other: "DiagnosticTable", skip_files: Iterable[str] = ()) -> None:
+        """Append every row of another table, optionally leaving out some files"""
+        skipped = {other._path_ids[f] for f in skip_files if f in other._path_ids}
+        for index in range(len(other)):
+            if other.file_ids[index] in skipped:
+                continue
+            self.append(
+                other.paths[other.file_ids[index]],
+                other.lines[index],
+                other.columns[index],
+                SEVERITIES[other.severities[index]],
+                other.rules[other.rule_ids[index]],
+                other.messages[index],
+                other.snippets.get(index),
+            )
+
+    def row(self, index: int) -> BiomeDiagnostic:
+        return BiomeDiagnostic(
+            message=self.messages[index],
+            file_path=self.paths[self.file_ids[index]],
+            line=self.lines[index],
+            column=self.columns[index],
+            severity=SEVERITIES[self.severities[index]],
+            rule=self.rules[self.rule_ids[index]],
+            code_snippet=self.snippets.get(index),
+        )
+
+    def counts(self, skip_files: Iterable[str] = ()) -> Dict[str, int]:
+        """Number of diagnostics per severity"""
+        skipped = {self._path_ids[f] for f in skip_files if f in self._path_ids}
+        totals = [0] * len(SEVERITIES)
+        for file_id, code in zip(self.file_ids, self.severities):
+            if file_id not in skipped:
+                totals[code] += 1
+        return dict(zip(SEVERITIES, totals))
+
+    def files(self, skip_files: Iterable[str] = ()) -> List[str]:
+        """Sorted paths that have at least one diagnostic"""
+        used = set(self.file_ids)
+        return sorted(p for p in (self.paths[file_id] for file_id in used) if p not in skip_files)
+
+    def group_by_file_and_rule(
+        self, skip_files: Iterable[str] = ()
+    ) -> Dict[str, Dict[str, List[int]]]:
+        """Row indexes grouped by file, then rule, in a single pass.
+
+        Files and rules come out sorted by name and rows within a rule by line
+        and column, so reports are stable regardless of Biome's output order.
+        """
+        skipped = {self._path_ids[f] for f in skip_files if f in self._path_ids}
+        groups: Dict[int, Dict[int, List[int]]] = {}
+        for index, (file_id, rule_id) in enumerate(zip(self.file_ids, self.rule_ids)):
+            if file_id in skipped:
+                continue
+            by_rule = groups.get(file_id)
+            if by_rule is None:
+                by_rule = groups[file_id] = {}
+            rows = by_rule.get(rule_id)
+            if rows is None:
+                by_rule[rule_id] = [index]
+            else:
+                rows.append(index)
+
+        lines, columns = self.lines, self.columns
+        grouped = {}
+        for file_id in sorted(groups, key=self.paths.__getitem__):
+            by_rule = groups[file_id]
+            grouped[self.paths[file_id]] = {
+                self.rules[rule_id]: sorted(by_rule[rule_id], key=lambda i: (lines[i], columns[i]))
+                for rule_id in sorted(by_rule, key=self.rules.__getitem__)
+            }
+        return grouped
+
+    def to_json(self) -> Dict[str, Any]:
+        """Column-wise, JSON-serializable form of the table"""
+        return {
+            "format": TABLE_FORMAT,
+            "paths": self.paths,
+            "rules": self.rules,
+            "file_ids": self.file_ids.tolist(),
+            "rule_ids": self.rule_ids.tolist(),
+            "lines": self.lines.tolist(),
+            "columns": self.columns.tolist(),
+            "severities": self.severities.tolist(),
+            "messages": self.messages,
+            "snippets": {str(index): lines for index, lines in self.snippets.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "DiagnosticTable":
+        table = cls()
+        table.paths = list(data.get("paths", []))
+        table.rules = list(data.get("rules", []))
+        table._path_ids = {path: i for i, path in enumerate(table.paths)}
+        table._rule_ids = {rule: i for i, rule in enumerate(table.rules)}
+        table.file_ids = array("I", data.get("file_ids", []))
+        table.rule_ids = array("I", data.get("rule_ids", []))
+        table.lines = array("I", data.get("lines", []))
+        table.columns = array("I", data.get("columns", []))
+        table.severities = array("B", data.get("severities", []))
+        table.messages = list(data.get("messages", []))
+        table.snippets = {int(index): lines for index, lines in data.get("snippets", {}).items()}
+        return table
+
+    @classmethod
+    def from_dicts(cls, diagnostics: Iterable[Dict[str, Any]]) -> "DiagnosticTable":
+        """Build a table from the list-of-dicts shape used by older checkpoints"""
+        table = cls()
+        for d in diagnostics:
+            table.append(
+                d.get("file", ""),
+                d.get("line", 0),
+                d.get("column", 0),
+                d.get("severity", "warning"),
+                d.get("rule", ""),
+                d.get("message", ""),
+                d.get("code_snippet") or None,
+            )
+        return table
+
+    @classmethod
+    def coerce(cls, value: Any) -> "DiagnosticTable":
+        """Accept a table, its serialized form, a legacy list of dicts or nothing"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict) and value.get("format") == TABLE_FORMAT:
+            return cls.from_json(value)
+        if isinstance(value, list):
+            return cls.from_dicts(value)
+        return cls()
+
+
+def json_default(value: Any) -> Any:
+    """`default=` hook for json.dump so results holding a table can be written"""
+    if isinstance(value, DiagnosticTable):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def biome_section(result: Any) -> Optional[Dict[str, Any]]:
+    """The Biome part of an analyze_typescript result, if present"""
+    if not isinstance(result, dict):
+        return None
+    biome = result.get("results", {}).get("biome")
+    return biome if isinstance(biome, dict) else None
+
+
+def hydrate_result(result: Any) -> Any:
+    """Turn serialized Biome diagnostics in a loaded result back into a table"""
+    biome = biome_section(result)
+    if biome is not None and "diagnostics" in biome:
+        biome["diagnostics"] = DiagnosticTable.coerce(biome["diagnostics"])
+    return result
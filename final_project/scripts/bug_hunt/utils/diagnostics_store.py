@@ -0,0 +1,305 @@
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.diagnostics import SEVERITIES, DiagnosticTable, biome_section
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    checkpoint TEXT NOT NULL UNIQUE,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS plugin_runs (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    plugin TEXT NOT NULL,
+    analyzed_at TEXT NOT NULL,
+    errors INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    infos INTEGER NOT NULL,
+    PRIMARY KEY (session_id, plugin)
+);
+CREATE TABLE IF NOT EXISTS diagnostics (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    plugin TEXT NOT NULL,
+    file TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at);
+CREATE INDEX IF NOT EXISTS idx_diagnostics_session ON diagnostics(session_id, plugin);
+CREATE INDEX IF NOT EXISTS idx_diagnostics_plugin ON diagnostics(plugin, rule, session_id);
+CREATE INDEX IF NOT EXISTS idx_diagnostics_file ON diagnostics(file);
+CREATE INDEX IF NOT EXISTS idx_diagnostics_rule ON diagnostics(rule, session_id);
+CREATE INDEX IF NOT EXISTS idx_diagnostics_severity ON diagnostics(severity, session_id);
+"""
+
+# Columns `query` can group by, mapped to their SQL expressions
+GROUP_COLUMNS = {"plugin": "d.plugin", "file": "d.file", "rule": "d.rule", "severity": "d.severity"}
+
+# plugin_runs column holding Biome's total for each severity
+SEVERITY_TOTALS = {"error": "errors", "warning": "warnings", "info": "infos"}
+
+
+class DiagnosticsStore:
+    """SQLite history of every diagnostic recorded by `start`, across sessions.
+
+    Each analyzed plugin replaces its rows for the session, so re-analysis on
+    resume does not double count. The connection is meant to be used from the
+    thread that records checkpoints.
+
+    Diagnostic rows are only those Biome printed, so counts by plugin or
+    severity come from the per-plugin totals in `plugin_runs` whenever no
+    rule or file filter needs the individual rows.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        # Get the root directory (scripts/bug_hunt)
+        root_dir = Path(__file__).parent.parent
+        self.db_path = Path(db_path) if db_path else root_dir / "history" / "diagnostics.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        # Keep the planner's statistics current as the history grows
+        self.conn.execute("PRAGMA optimize")
+        self.conn.close()
+
+    def session_id(self, name: str, checkpoint: str, started_at: Optional[str] = None) -> int:
+        """Id of the session stored for a checkpoint, registering it on first use"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO sessions (name, checkpoint, started_at) VALUES (?, ?, ?)",
+                (name, checkpoint, started_at or datetime.now().isoformat()),
+            )
+        return self.conn.execute(
+            "SELECT id FROM sessions WHERE checkpoint = ?", (checkpoint,)
+        ).fetchone()[0]
+
+    def has_session(self, checkpoint: str) -> bool:
+        return (
+            self.conn.execute(
+                "SELECT 1 FROM sessions WHERE checkpoint = ?", (checkpoint,)
+            ).fetchone()
+            is not None
+        )
+
+    def record_plugin(
+        self,
+        session_id: int,
+        plugin: str,
+        result: Dict[str, Any],
+        analyzed_at: Optional[str] = None,
+    ) -> None:
+        """Store the Biome diagnostics of one plugin's analysis result"""
+        biome = biome_section(result) or {}
+        table = DiagnosticTable.coerce(biome.get("diagnostics"))
+        summary_id = table.paths.index("Summary") if "Summary" in table.paths else None
+
+        summary = biome.get("summary")
+        if isinstance(summary, dict):
+            counts = (summary.get("errors", 0), summary.get("warnings", 0), summary.get("infos", 0))
+        else:
+            by_severity = table.counts(skip_files=("Summary",))
+            counts = (by_severity["error"], by_severity["warning"], by_severity["info"])
+
+        rows = (
+            (
+                session_id,
+                plugin,
+                table.paths[file_id],
+                table.rules[rule_id],
+                SEVERITIES[severity],
+                line,
+                column,
+                message,
+            )
+            for file_id, rule_id, severity, line, column, message in zip(
+                table.file_ids,
+                table.rule_ids,
+                table.severities,
+                table.lines,
+                table.columns,
+                table.messages,
+            )
+            if file_id != summary_id
+        )
+
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM diagnostics WHERE session_id = ? AND plugin = ?", (session_id, plugin)
+            )
+            self.conn.executemany("INSERT INTO diagnostics VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO plugin_runs VALUES (?, ?, ?, ?, ?, ?)",
+                (session_id, plugin, analyzed_at or datetime.now().isoformat(), *counts),
+            )
+
+    def import_session(self, checkpoint: str, data: Dict[str, Any]) -> int:
+        """Load a checkpointed session into the store, e.g. one recorded before it existed"""
+        session_id = self.session_id(
+            data.get("session_name", checkpoint), checkpoint, data.get("started_at") or None
+        )
+        for entry in data.get("plugins_analyzed", []):
+            self.record_plugin(
+                session_id, entry["plugin_name"], entry.get("results", {}), entry.get("analyzed_at")
+            )
+        return session_id
+
+    def prune(self, keep_sessions: int) -> int:
+        """Drop everything but the newest `keep_sessions` sessions; returns how many were dropped"""
+        stale = [
+            (session_id,)
+            for (session_id,) in self.conn.execute(
+                "SELECT id FROM sessions ORDER BY started_at DESC LIMIT -1 OFFSET ?",
+                (max(keep_sessions, 0),),
+            )
+        ]
+        if stale:
+            with self.conn:
+                self.conn.executemany("DELETE FROM diagnostics WHERE session_id = ?", stale)
+                self.conn.executemany("DELETE FROM plugin_runs WHERE session_id = ?", stale)
+                self.conn.executemany("DELETE FROM sessions WHERE id = ?", stale)
+            self.logger.info(f"Pruned {len(stale)} sessions from the diagnostics history")
+        return len(stale)
+
+    @staticmethod
+    def _filters(
+        plugin: Optional[str] = None,
+        rule: Optional[str] = None,
+        severity: Optional[str] = None,
+        file: Optional[str] = None,
+        alias: str = "d",
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for column, value in (
+            ("plugin", plugin),
+            ("rule", rule),
+            ("severity", severity),
+            ("file", file),
+        ):
+            if value:
+                # A trailing * turns the filter into a prefix match
+                if value.endswith("*"):
+                    clauses.append(f"{alias}.{column} LIKE ? ESCAPE '\\'")
+                    params.append(
+                        value[:-1].replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                        + "%"
+                    )
+                else:
+                    clauses.append(f"{alias}.{column} = ?")
+                    params.append(value)
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    @staticmethod
+    def _uses_totals(filters: Dict[str, Optional[str]]) -> bool:
+        """Whether the plugin_runs totals can answer a query with these filters"""
+        severity = filters.get("severity")
+        return (
+            not filters.get("rule")
+            and not filters.get("file")
+            and (not severity or severity in SEVERITY_TOTALS)
+        )
+
+    @staticmethod
+    def _total_expression(severity: Optional[str]) -> str:
+        if severity:
+            return f"r.{SEVERITY_TOTALS[severity]}"
+        return "r.errors + r.warnings + r.infos"
+
+    def latest_session(self, name: Optional[str] = None) -> Optional[Tuple[int, str, str]]:
+        """(id, name, started_at) of the newest session, optionally by name"""
+        sql = "SELECT id, name, started_at FROM sessions"
+        params: List[Any] = []
+        if name:
+            sql += " WHERE name = ?"
+            params.append(name)
+        return self.conn.execute(sql + " ORDER BY started_at DESC LIMIT 1", params).fetchone()
+
+    def query(
+        self, session_id: int, group_by: str = "rule", limit: int = 50, **filters: Optional[str]
+    ) -> List[Tuple[str, int]]:
+        """Diagnostic counts in one session grouped by a column, largest first"""
+        if group_by in ("plugin", "severity") and self._uses_totals(filters):
+            return self._query_totals(session_id, group_by, limit, filters)
+
+        column = GROUP_COLUMNS[group_by]
+        where, params = self._filters(**filters)
+        return self.conn.execute(
+            f"SELECT {column}, COUNT(*) AS n FROM diagnostics d WHERE d.session_id = ?{where} "
+            f"GROUP BY {column} ORDER BY n DESC, {column} LIMIT ?",
+            [session_id, *params, limit],
+        ).fetchall()
+
+    def _query_totals(
+        self, session_id: int, group_by: str, limit: int, filters: Dict[str, Optional[str]]
+    ) -> List[Tuple[str, int]]:
+        """`query` grouped by plugin or severity, answered from Biome's per-plugin totals"""
+        where, params = self._filters(plugin=filters.get("plugin"), alias="r")
+        if group_by == "plugin":
+            return self.conn.execute(
+                f"SELECT r.plugin, SUM({self._total_expression(filters.get('severity'))}) AS n "
+                f"FROM plugin_runs r WHERE r.session_id = ?{where} "
+                f"GROUP BY r.plugin HAVING n > 0 ORDER BY n DESC, r.plugin LIMIT ?",
+                [session_id, *params, limit],
+            ).fetchall()
+
+        totals = self.conn.execute(
+            f"SELECT {', '.join(f'COALESCE(SUM(r.{column}), 0)' for column in SEVERITY_TOTALS.values())} "
+            f"FROM plugin_runs r WHERE r.session_id = ?{where}",
+            [session_id, *params],
+        ).fetchone()
+        rows = [
+            (severity, count)
+            for severity, count in zip(SEVERITY_TOTALS, totals)
+            if count and filters.get("severity") in (None, severity)
+        ]
+        return sorted(rows, key=lambda row: (-row[1], row[0]))[:limit]
+
+    def trends(
+        self, last: int = 30, **filters: Optional[str]
+    ) -> List[Tuple[str, str, Optional[int]]]:
+        """Matching diagnostic counts per session for the newest `last` sessions, oldest first.
+
+        Sessions that did not analyze the filtered plugin report None rather than zero.
+        Without rule or file filters the counts are Biome's totals from `plugin_runs`.
+        """
+        if self._uses_totals(filters):
+            where, params = self._filters(plugin=filters.get("plugin"), alias="r")
+            return self.conn.execute(
+                f"SELECT s.name, s.started_at, "
+                f"(SELECT SUM({self._total_expression(filters.get('severity'))}) "
+                f"FROM plugin_runs r WHERE r.session_id = s.id{where}) "
+                f"FROM (SELECT id, name, started_at FROM sessions ORDER BY started_at DESC LIMIT ?) s "
+                f"ORDER BY s.started_at",
+                [*params, last],
+            ).fetchall()
+
+        where, params = self._filters(**filters)
+        plugin = filters.get("plugin")
+        analyzed = "1"
+        analyzed_params: List[Any] = []
+        if plugin and not plugin.endswith("*"):
+            analyzed = (
+                "EXISTS (SELECT 1 FROM plugin_runs r WHERE r.session_id = s.id AND r.plugin = ?)"
+            )
+            analyzed_params.append(plugin)
+
+        return self.conn.execute(
+            f"SELECT s.name, s.started_at, "
+            f"CASE WHEN {analyzed} THEN (SELECT COUNT(*) FROM diagnostics d WHERE d.session_id = s.id{where}) END "
+            f"FROM (SELECT id, name, started_at FROM sessions ORDER BY started_at DESC LIMIT ?) s "
+            f"ORDER BY s.started_at",
+            [*analyzed_params, *params, last],
+        ).fetchall()
@@ -0,0 +1,149 @@
+import logging
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.diagnostics import DiagnosticTable
+
+logger = logging.getLogger(__name__)
+
+# File types Biome and the dependency check care about
+LINTABLE_SUFFIXES = {".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".mts", ".cts"}
+
+
+@dataclass
+class PluginChanges:
+    """Files touched in one plugin since a git ref, relative to the plugin directory"""
+
+    plugin_name: str
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    @property
+    def touched(self) -> set:
+        return set(self.changed) | set(self.deleted)
+
+
+def _git(repo_dir: Path, *args: str) -> List[str]:
+    result = subprocess.run(
+        ["git", *args], cwd=str(repo_dir), capture_output=True, text=True, check=True
+    )
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+def changed_plugin_files(repo_dir: Path, since: str, plugins_dir: Path) -> Dict[str, PluginChanges]:
+    """Group lintable files under each plugin's src/ changed since `since` (including uncommitted and untracked)"""
+    git_root = Path(_git(repo_dir, "rev-parse", "--show-toplevel")[0]).resolve()
+    plugins_dir = plugins_dir.resolve()
+
+    # `--` keeps a ref that shares its name with a path from being read as a path
+    changed = set(_git(git_root, "diff", "--name-only", "--diff-filter=ACMR", since, "--"))
+    changed.update(_git(git_root, "ls-files", "--others", "--exclude-standard"))
+    deleted = set(_git(git_root, "diff", "--name-only", "--diff-filter=D", since, "--"))
+
+    scopes: Dict[str, PluginChanges] = {}
+    for paths, bucket in ((changed, "changed"), (deleted, "deleted")):
+        for rel_path in sorted(paths):
+            path = git_root / rel_path
+            if path.suffix not in LINTABLE_SUFFIXES:
+                continue
+            try:
+                parts = path.relative_to(plugins_dir).parts
+            except ValueError:
+                continue
+            # Biome only checks each plugin's src tree, so changes elsewhere need no re-lint
+            if len(parts) < 3 or parts[1] != "src" or "node_modules" in parts:
+                continue
+            plugin_name = parts[0]
+            scope = scopes.setdefault(plugin_name, PluginChanges(plugin_name))
+            getattr(scope, bucket).append(Path(*parts[1:]).as_posix())
+
+    logger.info(f"Found changes since {since} in {len(scopes)} plugins")
+    return scopes
+
+
+def _summary_counts(result: Dict[str, Any], table: DiagnosticTable) -> Dict[str, int]:
+    """Biome's own totals for a result, falling back to counting its diagnostics rows"""
+    summary = result.get("summary")
+    if isinstance(summary, dict):
+        return {
+            "error": summary.get("errors", 0),
+            "warning": summary.get("warnings", 0),
+            "info": summary.get("infos", 0),
+        }
+    return table.counts(skip_files=("Summary",))
+
+
+def merge_biome_results(
+    previous: Dict[str, Any], fresh: Dict[str, Any], touched: set
+) -> Dict[str, Any]:
+    """Combine fresh diagnostics for touched files with previous diagnostics for the rest.
+
+    Counts start from Biome's previous totals minus the rows of the touched
+    files, so diagnostics Biome did not print for untouched files are kept;
+    the not-printed counts of both runs are carried along for the same reason.
+    Summary rows from verbose output stay with the run that produced them.
+    Success follows the merged error count, as Biome's exit code would.
+    """
+    previous_table = DiagnosticTable.coerce(previous.get("diagnostics"))
+    fresh_table = DiagnosticTable.coerce(fresh.get("diagnostics"))
+
+    diagnostics = DiagnosticTable()
+    diagnostics.extend(previous_table, skip_files=touched)
+    kept = len(diagnostics)
+    diagnostics.extend(fresh_table)
+
+    previous_counts = _summary_counts(previous, previous_table)
+    all_rows = previous_table.counts(skip_files=("Summary",))
+    untouched_rows = previous_table.counts(skip_files={*touched, "Summary"})
+    fresh_counts = _summary_counts(fresh, fresh_table)
+    counts = {
+        severity: max(
+            previous_counts[severity] - (all_rows[severity] - untouched_rows[severity]), 0
+        )
+        + fresh_counts[severity]
+        for severity in previous_counts
+    }
+
+    previous_summary = previous.get("summary") if isinstance(previous.get("summary"), dict) else {}
+    fresh_summary = fresh.get("summary") if isinstance(fresh.get("summary"), dict) else {}
+    files = {f for f in previous_summary.get("files", previous_table.files()) if f not in touched}
+    files.update(fresh_summary.get("files", fresh_table.files()))
+    files.update(diagnostics.files())
+    files.discard("Summary")
+
+    merged = dict(fresh)
+    merged["diagnostics"] = diagnostics
+    merged["summary"] = {
+        "errors": counts["error"],
+        "warnings": counts["warning"],
+        "infos": counts["info"],
+        "files": sorted(f for f in files if f),
+        "diagnostics_not_printed": previous_summary.get("diagnostics_not_printed", 0)
+        + fresh_summary.get("diagnostics_not_printed", 0),
+    }
+    merged["merged_from_previous"] = kept
+    # A fresh run that failed without reporting errors (e.g. Biome crashed) still fails
+    fresh_broken = not fresh.get("success", False) and not fresh_counts["error"]
+    merged["success"] = counts["error"] == 0 and not fresh_broken
+    return merged
+
+
+def merge_analysis_results(
+    previous: Optional[Dict[str, Any]], fresh: Dict[str, Any], changes: PluginChanges
+) -> Dict[str, Any]:
+    """Merge a file-scoped analysis into the previous full result for the same plugin"""
+    if not previous:
+        return fresh
+
+    merged = dict(fresh)
+    merged["results"] = dict(fresh.get("results", {}))
+    merged["results"]["biome"] = merge_biome_results(
+        previous.get("results", {}).get("biome", {}),
+        fresh.get("results", {}).get("biome", {}),
+        changes.touched,
+    )
+    merged["scope"] = {"changed": changes.changed, "deleted": changes.deleted}
+    merged["success"] = all(result.get("success", False) for result in merged["results"].values())
+    return merged
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Fields that change on every run without changing what the model is asked
+VOLATILE_KEYS = {"timestamp", "analyzed_at", "analysis_timestamp", "generated_at", "last_updated"}
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def normalize_payload(payload: str) -> str:
+    """Canonical form of a report payload: sorted JSON without volatile fields, or trimmed text"""
+    try:
+        data = json.loads(payload)
+    except (json.JSONDecodeError, TypeError):
+        return "\n".join(line.rstrip() for line in str(payload).strip().splitlines())
+    return json.dumps(
+        _strip_volatile(data), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+class ResponseCache:
+    """On-disk cache of agent responses keyed by payload, instructions and model.
+
+    Entries expire after `ttl_seconds`; beyond `max_size_mb` the least
+    recently used entries (by mtime, refreshed on every hit) are evicted.
+    The total size is scanned once and then tracked, so the directory is
+    only listed again when a write pushes the cache over its budget.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_size_mb: int = 64,
+    ):
+        # Get the root directory (scripts/bug_hunt)
+        self.root_dir = Path(__file__).parent.parent
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root_dir / "cache" / "llm"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        self._lock = threading.Lock()
+        # Bytes on disk; None until the first write needs it
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def compute_key(payload: str, instructions: Any, model: str) -> str:
+        """Hash of the normalized payload, the agent's prompt setup and the model name"""
+        digest = hashlib.sha256()
+        digest.update(normalize_payload(payload).encode("utf-8"))
+        digest.update(json.dumps(instructions, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(model.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for a key, or None on a miss or expired entry"""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if time.time() - data.get("created_at", 0) > self.ttl_seconds:
+            size = self._file_size(entry)
+            entry.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+                self.expired += 1
+                if self._size is not None:
+                    self._size = max(self._size - size, 0)
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        os.utime(entry)
+        with self._lock:
+            self.hits += 1
+        return data.get("response")
+
+    def put(self, key: str, response: str, model: str = "") -> None:
+        """Store a response atomically"""
+        entry = self._entry_path(key)
+        replaced = self._file_size(entry)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"created_at": time.time(), "model": model, "response": response}, f)
+            os.replace(tmp_path, entry)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(self._file_size(path) for path in self.cache_dir.glob("*.json"))
+            else:
+                self._size += self._file_size(entry) - replaced
+            if self._size > self.max_size_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this run"""
+        return {"hits": self.hits, "misses": self.misses, "expired": self.expired}
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size budget"""
+        entries: List[tuple[float, int, Path]] = []
+        total = 0
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            self.logger.debug(f"Evicted response cache entry: {entry.name}")
+        self._size = total
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
@@ -0,0 +1,182 @@
+import json
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+@dataclass
+class AgentReply:
+    """Text of one agent call plus the usage reported for it"""
+
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Time to the first streamed chunk of any kind, reasoning steps included
+    ttft: Optional[float] = None
+    # Time to the first chunk of the answer itself, i.e. after any reasoning phase
+    time_to_answer: Optional[float] = None
+    # Token counts were estimated from the text because the model reported none
+    estimated: bool = False
+
+
+@dataclass
+class CallMetric:
+    kind: str  # "agent" for a round-trip, "cache" for a response served from the cache
+    labels: List[str]
+    model: str
+    status: str
+    attempts: int = 0
+    # The agent call alone (last attempt)
+    latency: float = 0.0
+    # Including rate-limit waits, backoff and failed attempts
+    queued_latency: float = 0.0
+    ttft: Optional[float] = None
+    time_to_answer: Optional[float] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    tokens_estimated: bool = False
+    cost: Optional[float] = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+def usage_from_metrics(metrics: Any) -> Optional[Dict[str, Any]]:
+    """Token counts and time to first token from a phi run's metrics, if it reported any.
+
+    phi keeps one value per model response under each key, so values may be
+    lists (summed) or plain numbers.
+    """
+    if not isinstance(metrics, dict):
+        return None
+
+    def total(*keys: str) -> Optional[float]:
+        for key in keys:
+            value = metrics.get(key)
+            if isinstance(value, list):
+                value = sum(v for v in value if isinstance(v, (int, float)))
+            if isinstance(value, (int, float)):
+                return value
+        return None
+
+    prompt_tokens = total("prompt_tokens", "input_tokens")
+    completion_tokens = total("completion_tokens", "output_tokens")
+    if prompt_tokens is None and completion_tokens is None:
+        return None
+    ttft = metrics.get("time_to_first_token")
+    if isinstance(ttft, list):
+        ttft = ttft[0] if ttft else None
+    return {
+        "prompt_tokens": int(prompt_tokens or 0),
+        "completion_tokens": int(completion_tokens or 0),
+        "ttft": ttft if isinstance(ttft, (int, float)) else None,
+    }
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Linearly interpolated percentile, `q` in 0-100"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class MetricsRecorder:
+    """Appends one JSON line per agent call and summarizes the calls of a run.
+
+    Prices are in USD per million tokens; without them no cost is computed.
+    Records are kept in memory as well, so `summary` needs no re-read.
+    """
+
+    def __init__(
+        self,
+        metrics_path: Optional[Path] = None,
+        input_price: Optional[float] = None,
+        output_price: Optional[float] = None,
+    ):
+        # Get the root directory (scripts/bug_hunt)
+        root_dir = Path(__file__).parent.parent
+        self.metrics_path = (
+            Path(metrics_path) if metrics_path else root_dir / "logs" / "agent_metrics.jsonl"
+        )
+        self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
+        self.input_price = input_price
+        self.output_price = output_price
+        self.records: List[CallMetric] = []
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def record(self, metric: CallMetric) -> None:
+        if self.input_price is not None or self.output_price is not None:
+            metric.cost = (
+                metric.prompt_tokens * (self.input_price or 0)
+                + metric.completion_tokens * (self.output_price or 0)
+            ) / 1_000_000
+
+        line = json.dumps({**asdict(metric), "retries": metric.retries}, ensure_ascii=False)
+        with self._lock:
+            self.records.append(metric)
+            try:
+                with open(self.metrics_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                self.logger.warning(f"Could not write agent metrics: {str(e)}")
+
+    def mark(self) -> int:
+        """Position to pass to `summary` to cover only the calls made after it"""
+        with self._lock:
+            return len(self.records)
+
+    def summary(self, since: int = 0, top: int = 5) -> Dict[str, Any]:
+        """Totals, latency and TTFT percentiles, and the labels with the most tokens"""
+        with self._lock:
+            records = self.records[since:]
+        calls = [r for r in records if r.kind == "agent"]
+        latencies = [r.latency for r in calls]
+        queued = [r.queued_latency for r in calls]
+        ttfts = [r.ttft for r in calls if r.ttft is not None]
+        answers = [r.time_to_answer for r in calls if r.time_to_answer is not None]
+
+        # A batched call is shared by several reports; split its usage evenly between them
+        by_label: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"tokens": 0.0, "latency": 0.0, "calls": 0.0}
+        )
+        for r in calls:
+            share = 1 / max(len(r.labels), 1)
+            for label in r.labels or ["unknown"]:
+                by_label[label]["tokens"] += (r.prompt_tokens + r.completion_tokens) * share
+                by_label[label]["latency"] += r.latency * share
+                by_label[label]["calls"] += share
+
+        costs = [r.cost for r in calls if r.cost is not None]
+        return {
+            "calls": len(calls),
+            "cache_hits": sum(1 for r in records if r.kind == "cache"),
+            "failed": sum(1 for r in calls if r.status != "success"),
+            "retries": sum(r.retries for r in calls),
+            "prompt_tokens": sum(r.prompt_tokens for r in calls),
+            "completion_tokens": sum(r.completion_tokens for r in calls),
+            "tokens_estimated": any(r.tokens_estimated for r in calls),
+            "cost": round(sum(costs), 6) if costs else None,
+            "latency": {f"p{q}": percentile(latencies, q) for q in (50, 95, 99)},
+            "queued_latency": {f"p{q}": percentile(queued, q) for q in (50, 95, 99)},
+            "ttft": {f"p{q}": percentile(ttfts, q) for q in (50, 95, 99)},
+            "time_to_answer": {f"p{q}": percentile(answers, q) for q in (50, 95, 99)},
+            "top_labels": sorted(
+                (
+                    {"label": label, **{k: round(v, 3) for k, v in usage.items()}}
+                    for label, usage in by_label.items()
+                ),
+                key=lambda item: item["tokens"],
+                reverse=True,
+            )[:top],
+        }
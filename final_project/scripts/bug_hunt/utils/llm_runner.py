@@ -0,0 +1,170 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying besides 5xx: timeouts and rate limiting
+RETRYABLE_STATUS = {408, 429}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0, sleep: Callable[[float], None] = time.sleep) -> float:
+        """Block until `tokens` are available; returns the time spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            sleep(delay)
+            waited += delay
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an SDK exception, if any"""
+    for candidate in (error, getattr(error, "response", None)):
+        status = getattr(candidate, "status_code", None) or getattr(candidate, "status", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS or status >= 500
+    # Dropped connections and timeouts carry no status but are transient too
+    return isinstance(error, (ConnectionError, TimeoutError)) or type(error).__name__ in (
+        "APIConnectionError",
+        "APITimeoutError",
+    )
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Server-requested delay from a Retry-After header"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RunOutcome(Generic[T]):
+    item: T
+    value: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+    # Wall time from the first token request to the end, including rate-limit waits and backoff
+    elapsed: float = 0.0
+    # Duration of the last attempt's call alone
+    call_time: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ConcurrentRunner:
+    """Runs a blocking call over many inputs with bounded concurrency.
+
+    Every attempt first takes a token from a shared bucket, so the request
+    rate stays under `requests_per_minute` no matter how many workers are
+    running. Rate-limit and server errors are retried with full-jitter
+    exponential backoff (or the server's Retry-After); results come back in
+    input order. A `requests_per_minute` of zero or less means no rate limit.
+    """
+
+    def __init__(
+        self,
+        call: Callable[[T], R],
+        max_concurrency: int = 4,
+        requests_per_minute: float = 60.0,
+        burst: Optional[float] = None,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.call = call
+        self.max_concurrency = max(1, max_concurrency)
+        self.bucket: Optional[TokenBucket] = None
+        if requests_per_minute > 0:
+            self.bucket = TokenBucket(
+                requests_per_minute / 60.0, burst if burst is not None else self.max_concurrency
+            )
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+
+    def _attempt(self, item: T) -> RunOutcome:
+        outcome = RunOutcome(item)
+        start = time.perf_counter()
+        while True:
+            if self.bucket:
+                self.bucket.acquire(sleep=self.sleep)
+            outcome.attempts += 1
+            call_start = time.perf_counter()
+            try:
+                outcome.value = self.call(item)
+                outcome.error = None
+                outcome.call_time = time.perf_counter() - call_start
+                break
+            except Exception as e:
+                outcome.call_time = time.perf_counter() - call_start
+                outcome.error = e
+                if outcome.attempts > self.max_retries or not is_retryable(e):
+                    break
+                delay = retry_after(e)
+                if delay is None:
+                    delay = random.uniform(
+                        0, min(self.max_delay, self.base_delay * 2 ** (outcome.attempts - 1))
+                    )
+                logger.warning(
+                    f"Attempt {outcome.attempts} failed ({error_status(e) or type(e).__name__}); "
+                    f"retrying in {delay:.1f}s"
+                )
+                self.sleep(delay)
+        outcome.elapsed = time.perf_counter() - start
+        return outcome
+
+    def run(self, items: Sequence[T]) -> List[RunOutcome]:
+        """Process every item, returning outcomes in the same order as `items`"""
+        if not items:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(items)), thread_name_prefix="llm"
+        ) as executor:
+            # map() yields in submission order regardless of completion order
+            return list(executor.map(self._attempt, items))
@@ -1,25 +1,638 @@
 import os
+import asyncio
+import codecs
+import gzip
 import subprocess
+import tempfile
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 import nodeenv
 import logging
 
+from utils.analysis_cache import AnalysisCache, hash_plugin_sources
+from utils.biome_daemon import BiomeDaemon
+from utils.biome_json import BiomeJsonStreamParser
+from utils.dependency_graph import PARSER_VERSION, DependencyAnalyzer, WorkspaceGraph
+from utils.diagnostics import DiagnosticTable, json_default
+from utils.tool_resolver import ToolResolver
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+
+class BiomeVerboseParser:
+    """Line-at-a-time parser for `biome check --verbose` output.
+
+    Lines can be fed straight from a pipe; only the diagnostic currently being
+    assembled and the summary counters are kept in memory, finished ones go
+    into a DiagnosticTable.
+    """
+
+    def __init__(self):
+        self.diagnostics = DiagnosticTable()
+        self.current_diagnostic: Optional[Dict[str, Any]] = None
+        self.current_message: List[str] = []
+        self.in_error_block = False
+        self.summary_info = {"total_warnings": 0, "total_errors": 0, "files_processed": []}
+
+    def feed_line(self, raw_line: str) -> None:
+        line = raw_line.strip()
+        if not line:
+            return
+
+        # Capture summary information
+        if "Found" in line and ("warnings" in line or "errors" in line):
+            try:
+                count = int(line.split()[1])
+                if "warnings" in line:
+                    self.summary_info["total_warnings"] = count
+                elif "errors" in line:
+                    self.summary_info["total_errors"] = count
+            except ValueError:
+                pass
+
+        # Capture processed files
+        elif line.startswith("- src/"):
+            self.summary_info["files_processed"].append(line.strip("- "))
+
+        # Check for file location and rule
+        elif ".ts:" in line and not line.startswith("i "):
+            # New diagnostic starts
+            if self.current_diagnostic:
+                self._finish_diagnostic()
+
+            parts = line.split(" ", 1)
+            location = parts[0]
+            rule = parts[1] if len(parts) > 1 else ""
+
+            file_parts = location.split(":")
+            self.current_diagnostic = {
+                "file": file_parts[0],
+                "line": int(file_parts[1]) if len(file_parts) > 1 else 0,
+                "column": int(file_parts[2]) if len(file_parts) > 2 else 0,
+                "rule": rule.split("  ")[0] if "  " in rule else rule,
+                "severity": "error" if "error" in rule.lower() else "warning",
+                "message": "",
+                "code_snippet": [],
+            }
+            self.in_error_block = True
+
+        # Capture error messages and code snippets
+        elif self.in_error_block:
+            # Block structure is carried by indentation, so match on the unstripped line
+            if raw_line.startswith(("  !", "  i ", "  ×")):  # Main error message
+                self.current_message.append(raw_line[4:].rstrip())
+            elif raw_line.startswith(("  >", "     ")):  # Code snippet
+                if self.current_diagnostic:
+                    self.current_diagnostic["code_snippet"].append(raw_line.rstrip())
+            elif raw_line.startswith(("  -", "  +")):  # Fix suggestions
+                if self.current_diagnostic:
+                    self.current_diagnostic["code_snippet"].append(raw_line.rstrip())
+            else:
+                self.in_error_block = False
+
+    def _finish_diagnostic(self) -> None:
+        diagnostic = self.current_diagnostic
+        self.diagnostics.append(
+            diagnostic["file"],
+            diagnostic["line"],
+            diagnostic["column"],
+            diagnostic["severity"],
+            diagnostic["rule"],
+            "\n".join(self.current_message),
+            diagnostic["code_snippet"],
+        )
+        self.current_diagnostic = None
+        self.current_message = []
+
+    def close(self) -> DiagnosticTable:
+        """Finish parsing and return the diagnostics"""
+        # Add the last diagnostic if exists
+        if self.current_diagnostic:
+            self._finish_diagnostic()
+
+        summary_info = self.summary_info
+        # If we have no diagnostics but have summary info, create a summary diagnostic
+        if not self.diagnostics and (
+            summary_info["total_warnings"] > 0 or summary_info["total_errors"] > 0
+        ):
+            self.diagnostics.append(
+                "Summary",
+                0,
+                0,
+                "warning",
+                "multiple-issues",
+                f"Found {summary_info['total_warnings']} warnings and {summary_info['total_errors']} errors across {len(summary_info['files_processed'])} files",
+                [f"Affected files:"] + [f"  - {f}" for f in summary_info["files_processed"]],
+            )
+
+        return self.diagnostics
+
+
 class NodeManager:
     """Manages Node.js tools for JavaScript/TypeScript analysis"""
 
-    def __init__(self, work_dir: str = "."):
+    # Biome reporters understood by run_biome
+    REPORTERS = ("verbose", "json")
+    # Biome prints only 20 diagnostics by default; JSON reports need the full list
+    DEFAULT_MAX_DIAGNOSTICS = 10000
+    # A batched run covers every plugin at once, so it always asks for a far larger cap
+    BATCH_MAX_DIAGNOSTICS = 65535
+
+    def __init__(
+        self,
+        work_dir: str = ".",
+        max_processes: Optional[int] = None,
+        process_timeout: float = 300.0,
+        reporter: str = "verbose",
+        cache: Optional[AnalysisCache] = None,
+        use_daemon: bool = False,
+        tools: Optional[ToolResolver] = None,
+        stream_output: bool = False,
+        raw_output_dir: Optional[Path] = None,
+        log_raw_output: bool = False,
+        dependencies: Optional[DependencyAnalyzer] = None,
+        workspace_graph: Optional[WorkspaceGraph] = None,
+    ):
         self.work_dir = Path(work_dir).resolve()
         self.package_json = self.work_dir / "package.json"
         self.logger = logging.getLogger(__name__)
         self.logger.debug(f"Initialized NodeManager with work_dir: {work_dir}")
 
-    def run_biome(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Run Biome analysis on target path"""
+        # Async engine settings: cap on concurrent child processes and per-process timeout
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self.process_timeout = process_timeout
+
+        if reporter not in self.REPORTERS:
+            raise ValueError(
+                f"Unknown Biome reporter '{reporter}', expected one of {self.REPORTERS}"
+            )
+        self.reporter = reporter
+
+        # Optional content-hash cache of analyze_typescript results
+        self.cache = cache
+        self._tool_versions: Optional[Dict[str, str]] = None
+
+        # Streaming mode parses Biome output off the pipe and spills the raw text to disk
+        self.stream_output = stream_output
+        self.raw_output_dir = (
+            Path(raw_output_dir)
+            if raw_output_dir
+            else Path(__file__).parent.parent / "logs" / "raw"
+        )
+
+        # Per-line logging of Biome output is opt-in; it can dwarf the useful log records
+        self.log_raw_output = log_raw_output
+
+        # Tool executables are resolved once per session and exec'd directly
+        self.tools = tools or ToolResolver(self.work_dir)
+
+        # Circular dependency checks run in-process over a cached import graph
+        self.dependencies = dependencies or DependencyAnalyzer(self.work_dir)
+        # Workspace packages are answered from one graph of the whole monorepo, built on first use
+        self.workspace_graph = workspace_graph or WorkspaceGraph(
+            self.work_dir, cache=self.dependencies.cache, resolver=self.dependencies.resolver
+        )
+
+        # Optional long-lived Biome server, started lazily on the first check
+        self.daemon = BiomeDaemon(self.work_dir) if use_daemon else None
+
+    def close(self) -> None:
+        """Release session-scoped resources such as the Biome daemon"""
+        if self.daemon:
+            self.daemon.stop()
+            if self.daemon.restarts:
+                self.logger.warning(
+                    f"Biome daemon was restarted {self.daemon.restarts} times this session"
+                )
+
+    def _daemon_active(self) -> bool:
+        """Make sure the daemon is healthy before routing a check through it"""
+        if not self.daemon:
+            return False
+        if not self.daemon.running:
+            self.daemon.base_cmd = self.tools.resolve("biome")
+        return self.daemon.ensure_running()
+
+    @staticmethod
+    def _biome_run_failed(result: Dict[str, Any]) -> bool:
+        """Biome produced nothing but errors that point at a dropped server connection"""
+        return (
+            not result.get("success")
+            and not result.get("output")
+            and not result.get("diagnostics")
+            and BiomeDaemon.is_server_failure(result.get("errors", ""))
+        )
+
+    def tool_versions(self) -> Dict[str, str]:
+        """Versions of the workspace tools, read once from node_modules"""
+        if self._tool_versions is None:
+            versions = {"reporter": self.reporter, "dependency_graph": PARSER_VERSION}
+            for tool, package in (("biome", "@biomejs/biome"),):
+                package_json = self.work_dir / "node_modules" / package / "package.json"
+                try:
+                    with open(package_json, "r", encoding="utf-8") as f:
+                        versions[tool] = json.load(f).get("version", "unknown")
+                except (FileNotFoundError, json.JSONDecodeError):
+                    versions[tool] = "unknown"
+            self._tool_versions = versions
+        return self._tool_versions
+
+    def _biome_config_files(self, plugin_dir: Path) -> List[Path]:
+        """Biome config files that apply to a plugin, from the plugin up to the workspace root"""
+        config_files = []
+        current = plugin_dir.resolve()
+        while True:
+            for name in ("biome.json", "biome.jsonc"):
+                if (current / name).exists():
+                    config_files.append(current / name)
+            if current == self.work_dir or current.parent == current:
+                break
+            current = current.parent
+        return config_files
+
+    def has_own_biome_config(self, plugin_dir: Path) -> bool:
+        """Whether a plugin overrides the workspace Biome config with its own"""
+        return any((Path(plugin_dir) / name).exists() for name in ("biome.json", "biome.jsonc"))
+
+    def _cache_key(
+        self, target_path: str, config: Optional[Dict[str, Any]], source_hash: Optional[str] = None
+    ) -> str:
+        plugin_dir = Path(target_path)
+        return self.cache.compute_key(
+            plugin_dir,
+            config,
+            self._biome_config_files(plugin_dir),
+            self.tool_versions(),
+            source_hash,
+        )
+
+    def has_cached_result(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> bool:
+        """Whether analyze_typescript would be served from the cache"""
+        if not self.cache:
+            return False
+        return self.cache.contains(Path(target_path).name, self._cache_key(target_path, config))
+
+    @staticmethod
+    def _is_cacheable(results: Dict[str, Any]) -> bool:
+        """Only cache runs where Biome actually produced a complete report"""
+        biome = results["results"].get("biome", {})
+        if biome.get("incomplete"):
+            return False
+        return bool(biome.get("output")) or isinstance(biome.get("summary"), dict)
+
+    def _biome_command(
+        self, config: Optional[Dict[str, Any]] = None, files: Optional[List[str]] = None
+    ) -> List[str]:
+        """Command used to check a plugin's src directory, or specific files (no fixes)"""
+        cmd = [
+            *self.tools.command("biome"),
+            "check",
+            *(files or ["src"]),  # Just check src directory unless scoped to files
+        ]
+        if self.daemon and self.daemon.running:
+            cmd.append("--use-server")
+        if self.reporter == "json":
+            cmd.append("--reporter=json")
+            max_diagnostics = (config or {}).get("biome", {}).get(
+                "max_diagnostics"
+            ) or self.DEFAULT_MAX_DIAGNOSTICS
+            cmd.append(f"--max-diagnostics={max_diagnostics}")
+        else:
+            cmd.append("--verbose")
+        return cmd
+
+    def _log_stderr(self, error_logs: List[str]) -> None:
+        """Log Biome stderr line by line when raw logging is on, otherwise just its size"""
+        if not error_logs:
+            return
+        if self.log_raw_output:
+            self.logger.error("=== Biome Errors ===")
+            for line in error_logs:
+                self.logger.error(f"ERR: {line}")
+        else:
+            self.logger.error(
+                f"Biome wrote {len(error_logs)} lines to stderr; first: {error_logs[0]}"
+            )
+
+    def _build_biome_result(self, returncode: int, stdout: str, stderr: str) -> Dict[str, Any]:
+        """Shape Biome process output into the result dict consumed by the reporters"""
+        self.logger.info("=== Biome Execution Results ===")
+        self.logger.info(f"Exit code: {returncode}")
+
+        # Store all output and errors
+        all_output = stdout.splitlines() if stdout else []
+        error_logs = stderr.splitlines() if stderr else []
+
+        if all_output and self.log_raw_output:
+            self.logger.debug("=== Biome Output ===")
+            for line in all_output:
+                self.logger.debug(f"OUT: {line}")
+        self._log_stderr(error_logs)
+
+        # Parse the output into structured format
+        diagnostics = self._parse_biome_verbose_output(stdout)
+
+        self.logger.info("=== Parsing Results ===")
+        self.logger.info(f"Found {len(diagnostics)} issues")
+
+        return {
+            "success": returncode == 0,
+            "output": stdout,
+            "errors": stderr,
+            "diagnostics": diagnostics,
+            "raw_output": f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}",
+            "all_output": all_output,
+            "error_logs": error_logs,
+        }
+
+    def _build_biome_json_result(
+        self,
+        returncode: int,
+        parser: BiomeJsonStreamParser,
+        diagnostics: DiagnosticTable,
+        stderr: str,
+    ) -> Dict[str, Any]:
+        """Shape JSON reporter diagnostics and summary into the run_biome result dict"""
+        summary = parser.close()
+        error_logs = stderr.splitlines()
+
+        self.logger.info("=== Biome Execution Results ===")
+        self.logger.info(f"Exit code: {returncode}")
+        self.logger.info(f"Found {len(diagnostics)} issues across {len(parser.files)} files")
+        self._log_stderr(error_logs)
+
+        return {
+            "success": returncode == 0,
+            "reporter": "json",
+            "output": "",
+            "errors": stderr,
+            "diagnostics": diagnostics,
+            "summary": {
+                # Biome's own totals are authoritative even when --max-diagnostics truncates the list
+                "errors": summary.get("errors", parser.counts["error"]),
+                "warnings": summary.get("warnings", parser.counts["warning"]),
+                "infos": parser.counts["info"],
+                "files": sorted(parser.files),
+                "diagnostics_not_printed": summary.get("diagnosticsNotPrinted", 0),
+            },
+            "raw_output": f"STDERR:\n{stderr}",
+            "all_output": [],
+            "error_logs": error_logs,
+        }
+
+    def _stream_biome_json(
+        self, cwd: Path, cmd: List[str], on_diagnostic
+    ) -> tuple[int, BiomeJsonStreamParser, str]:
+        """Run Biome with the JSON reporter, handing each diagnostic to on_diagnostic as it is parsed"""
+        parser = BiomeJsonStreamParser()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                cmd, cwd=str(cwd), stdout=subprocess.PIPE, stderr=stderr_file, env={**os.environ}
+            ) as proc:
+                for chunk in iter(lambda: proc.stdout.read(65536), b""):
+                    for diagnostic in parser.feed(decoder.decode(chunk)):
+                        on_diagnostic(diagnostic)
+                for diagnostic in parser.feed(decoder.decode(b"", final=True)):
+                    on_diagnostic(diagnostic)
+                returncode = proc.wait()
+
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+        return returncode, parser, stderr
+
+    def _run_biome_json(self, plugin_dir: Path, cmd: List[str]) -> Dict[str, Any]:
+        """Run Biome with the JSON reporter, parsing diagnostics straight off the pipe"""
+        diagnostics = DiagnosticTable()
+        returncode, parser, stderr = self._stream_biome_json(plugin_dir, cmd, diagnostics.add)
+        return self._build_biome_json_result(returncode, parser, diagnostics, stderr)
+
+    def run_biome_batch(
+        self, targets: Dict[str, Optional[List[str]]], config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Check many plugins with a single Biome process and split the diagnostics per plugin.
+
+        `targets` maps plugin directories to an optional list of files relative to
+        them (None checks the plugin's `src`). Biome runs once from the workspace
+        root, so plugins carrying their own biome.json should be checked per plugin
+        instead. Returns run_biome-shaped results keyed by plugin directory name.
+        """
+        plugin_dirs = {str(Path(t).resolve()): Path(t).name for t in targets}
+        roots = []
+        for target, files in targets.items():
+            plugin_dir = Path(target).resolve()
+            for rel in files or ["src"]:
+                roots.append(os.path.relpath(plugin_dir / rel, self.work_dir))
+
+        def batch_command() -> List[str]:
+            cmd = self._biome_command(config, roots)
+            cmd = [
+                arg
+                for arg in cmd
+                if arg not in ("--verbose", "--reporter=json")
+                and not arg.startswith("--max-diagnostics")
+            ]
+            return cmd + ["--reporter=json", f"--max-diagnostics={self.BATCH_MAX_DIAGNOSTICS}"]
+
+        self._daemon_active()
+        generation = self.daemon.generation if self.daemon else 0
+        self.logger.info(f"=== Starting batched Biome analysis of {len(targets)} plugins ===")
+
+        routed: Dict[str, DiagnosticTable] = {
+            name: DiagnosticTable() for name in plugin_dirs.values()
+        }
+        unrouted = []
+
+        def route(diagnostic) -> None:
+            # Find the plugin owning this path by walking up its parents
+            path = (self.work_dir / diagnostic.file_path).resolve()
+            for parent in path.parents:
+                plugin_name = plugin_dirs.get(str(parent))
+                if plugin_name:
+                    # Report paths relative to the plugin, as a per-plugin run would
+                    diagnostic.file_path = path.relative_to(parent).as_posix()
+                    routed[plugin_name].add(diagnostic)
+                    return
+            unrouted.append(diagnostic)
+
+        try:
+            returncode, parser, stderr = self._stream_biome_json(
+                self.work_dir, batch_command(), route
+            )
+            summary = parser.close()
+
+            # Nothing parsed from a run the server failed: restart it and retry once
+            if (
+                self.daemon
+                and self.daemon.running
+                and returncode != 0
+                and not summary
+                and not parser.files
+                and BiomeDaemon.is_server_failure(stderr)
+            ):
+                if self.daemon.restart(generation):
+                    routed = {name: DiagnosticTable() for name in routed}
+                    unrouted.clear()
+                    returncode, parser, stderr = self._stream_biome_json(
+                        self.work_dir, batch_command(), route
+                    )
+                    summary = parser.close()
+        except Exception as e:
+            self.logger.error(f"Batched Biome run failed: {str(e)}")
+            return {
+                name: {
+                    "success": False,
+                    "output": "",
+                    "errors": str(e),
+                    "diagnostics": DiagnosticTable(),
+                    "raw_output": f"ERROR:\n{str(e)}",
+                    "all_output": [],
+                    "error_logs": [str(e)],
+                }
+                for name in routed
+            }
+
+        if unrouted:
+            self.logger.warning(
+                f"{len(unrouted)} diagnostics did not belong to any selected plugin"
+            )
+        # Withheld diagnostics cannot be attributed to a plugin, so every result is incomplete
+        not_printed = summary.get("diagnosticsNotPrinted", 0)
+        if not_printed:
+            self.logger.warning(
+                f"Biome withheld {not_printed} diagnostics from the batched run; "
+                "per-plugin results are incomplete and will not be cached"
+            )
+
+        # A non-zero exit without any error diagnostics means Biome itself failed
+        process_failed = returncode != 0 and parser.counts["error"] == 0
+        results = {}
+        for plugin_name, diagnostics in routed.items():
+            counts = diagnostics.counts()
+            results[plugin_name] = {
+                "success": not process_failed and not not_printed and counts["error"] == 0,
+                "incomplete": bool(not_printed),
+                "reporter": "json",
+                "output": "",
+                "errors": (
+                    f"Batched Biome run withheld {not_printed} diagnostics; counts are a lower bound\n{stderr}"
+                    if not_printed
+                    else stderr
+                ),
+                "diagnostics": diagnostics,
+                "summary": {
+                    "errors": counts["error"],
+                    "warnings": counts["warning"],
+                    "infos": counts["info"],
+                    "files": diagnostics.files(),
+                    "diagnostics_not_printed": not_printed,
+                },
+                "raw_output": f"STDERR:\n{stderr}",
+                "all_output": [],
+                "error_logs": stderr.splitlines(),
+            }
+        return results
+
+    def _run_biome_streaming(
+        self, plugin_dir: Path, cmd: List[str], stderr_tail: int = 200
+    ) -> Dict[str, Any]:
+        """Run verbose Biome with bounded memory.
+
+        stdout lines go straight into BiomeVerboseParser, both streams are
+        spilled to a gzip file under raw_output_dir, and only the last
+        `stderr_tail` stderr lines are kept for the report.
+        """
+        self.raw_output_dir.mkdir(parents=True, exist_ok=True)
+        spill_path = self.raw_output_dir / f"{plugin_dir.name}.log.gz"
+        parser = BiomeVerboseParser()
+        error_logs: deque = deque(maxlen=stderr_tail)
+        spill_lock = threading.Lock()
+
+        with gzip.open(spill_path, "wt", encoding="utf-8") as spill:
+            with subprocess.Popen(
+                cmd,
+                cwd=str(plugin_dir),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                env={**os.environ},
+            ) as proc:
+
+                def drain_stderr() -> None:
+                    for line in proc.stderr:
+                        error_logs.append(line.rstrip("\n"))
+                        with spill_lock:
+                            spill.write(f"ERR: {line}")
+
+                stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+                stderr_thread.start()
+
+                for line in proc.stdout:
+                    parser.feed_line(line.rstrip("\n"))
+                    with spill_lock:
+                        spill.write(line)
+
+                stderr_thread.join()
+                returncode = proc.wait()
+
+        diagnostics = parser.close()
+        summary_info = parser.summary_info
+        stderr = "\n".join(error_logs)
+
+        self.logger.info("=== Biome Execution Results ===")
+        self.logger.info(f"Exit code: {returncode}")
+        self.logger.info(f"Found {len(diagnostics)} issues; raw output saved to {spill_path}")
+
+        return {
+            "success": returncode == 0,
+            "output": "",
+            "errors": stderr,
+            "diagnostics": diagnostics,
+            "summary": {
+                "errors": summary_info["total_errors"],
+                "warnings": summary_info["total_warnings"],
+                "infos": 0,
+                "files": summary_info["files_processed"],
+                "diagnostics_not_printed": 0,
+            },
+            "raw_output": f"Raw output saved to {spill_path}",
+            "raw_output_path": str(spill_path),
+            "all_output": [],
+            "error_logs": list(error_logs),
+        }
+
+    def _execute_biome(self, plugin_dir: Path, cmd: List[str]) -> Dict[str, Any]:
+        """Run one Biome check in plugin_dir and shape its output"""
+        if self.reporter == "json":
+            return self._run_biome_json(plugin_dir, cmd)
+        if self.stream_output:
+            return self._run_biome_streaming(plugin_dir, cmd)
+
+        result = subprocess.run(
+            cmd,
+            cwd=str(plugin_dir),  # Execute in plugin directory
+            capture_output=True,
+            text=True,
+            env={**os.environ},
+        )
+
+        return self._build_biome_result(result.returncode, result.stdout, result.stderr)
+
+    def run_biome(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        files: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Run Biome analysis on target path, optionally limited to files relative to it"""
         try:
             self.logger.info("=== Starting Biome Analysis ===")
             self.logger.info(f"Target path: {target_path}")
@@ -28,62 +641,24 @@ class NodeManager:
             # Change to the plugin directory first
             plugin_dir = Path(target_path)
 
+            self._daemon_active()
+            generation = self.daemon.generation if self.daemon else 0
+
             # Base command for checking only (no fixes)
-            cmd = [
-                "pnpm",
-                "biome",
-                "check",
-                "src",  # Just check src directory
-                "--verbose"
-            ]
+            cmd = self._biome_command(config, files)
 
             self.logger.info("=== Command Configuration ===")
             self.logger.info(f"Initial command: {' '.join(cmd)}")
             self.logger.info(f"Will execute in directory: {plugin_dir}")
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(plugin_dir),  # Execute in plugin directory
-                capture_output=True,
-                text=True,
-                env={**os.environ}
-            )
-
-            self.logger.info("=== Biome Execution Results ===")
-            self.logger.info(f"Exit code: {result.returncode}")
-
-            # Store all output and errors
-            all_output = []
-            error_logs = []
-
-            # Log all output for debugging
-            if result.stdout:
-                self.logger.info("=== Biome Output ===")
-                for line in result.stdout.splitlines():
-                    self.logger.info(f"OUT: {line}")
-                    all_output.append(line)
-
-            if result.stderr:
-                self.logger.error("=== Biome Errors ===")
-                for line in result.stderr.splitlines():
-                    self.logger.error(f"ERR: {line}")
-                    error_logs.append(line)
+            result = self._execute_biome(plugin_dir, cmd)
 
-            # Parse the output into structured format
-            diagnostics = self._parse_biome_verbose_output(result.stdout)
+            # A crashed daemon surfaces as an empty run failing with a server error; restart it and retry once
+            if self.daemon and self.daemon.running and self._biome_run_failed(result):
+                if self.daemon.restart(generation):
+                    result = self._execute_biome(plugin_dir, self._biome_command(config, files))
 
-            self.logger.info("=== Parsing Results ===")
-            self.logger.info(f"Found {len(diagnostics)} issues")
-
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "errors": result.stderr,
-                "diagnostics": diagnostics,
-                "raw_output": f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}",
-                "all_output": all_output,
-                "error_logs": error_logs
-            }
+            return result
 
         except subprocess.CalledProcessError as e:
             self.logger.error(f"=== Biome Execution Failed ===")
@@ -98,10 +673,10 @@ class NodeManager:
                 "success": False,
                 "output": e.stdout if e.stdout else "",
                 "errors": str(e),
-                "diagnostics": [],
+                "diagnostics": DiagnosticTable(),
                 "raw_output": f"STDOUT:\n{e.stdout if e.stdout else ''}\n\nSTDERR:\n{e.stderr if e.stderr else ''}",
                 "all_output": [],
-                "error_logs": [str(e)]
+                "error_logs": [str(e)],
             }
         except Exception as e:
             self.logger.error(f"=== Unexpected Error ===")
@@ -113,54 +688,93 @@ class NodeManager:
                 "success": False,
                 "output": "",
                 "errors": str(e),
-                "diagnostics": [],
+                "diagnostics": DiagnosticTable(),
                 "raw_output": f"ERROR:\n{str(e)}\n\n{traceback.format_exc()}",
                 "all_output": [],
-                "error_logs": [str(e), traceback.format_exc()]
+                "error_logs": [str(e), traceback.format_exc()],
             }
 
-    def run_dependency_check(self, target_path: str) -> Dict[str, Any]:
-        """Run dependency analysis using pnpm-based madge"""
-        try:
-            cmd = [
-                "pnpm",
-                "dlx",
-                "madge",
-                "--json",
-                "--warning",
-                "--circular",
-                target_path
-            ]
+    def run_dependency_check(
+        self, target_path: str, files: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Detect circular dependencies from the plugin's import graph.
 
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.work_dir),
-                capture_output=True,
-                text=True,
-                env={**os.environ}
-            )
-            return {
-                "success": result.returncode == 0,
-                "dependencies": json.loads(result.stdout) if result.stdout else {},
-                "errors": result.stderr
-            }
-        except subprocess.CalledProcessError as e:
+        Whole-plugin checks of workspace packages come from the shared
+        workspace graph, which also sees cycles through other packages;
+        file-scoped checks and plugins outside the workspace get a graph of
+        their own.
+        """
+        try:
+            if not files and self.workspace_graph.contains(Path(target_path)):
+                return self.workspace_graph.plugin_report(Path(target_path))
+            return self.dependencies.analyze(Path(target_path), files)
+        except Exception as e:
             self.logger.error(f"Dependency check failed: {str(e)}")
-            return {
-                "success": False,
-                "dependencies": {},
-                "errors": str(e)
-            }
+            return {"success": False, "dependencies": [], "errors": str(e)}
+
+    def _refresh_dependencies(
+        self, cached: Dict[str, Any], target_path: str, cache_key: str
+    ) -> None:
+        """Bring the dependency check of a cached result up to date.
+
+        The cache key only covers the plugin's own sources, while cycles and
+        fan-in of a workspace package can change with any other package. The
+        cached check is kept while the workspace fingerprint it records still
+        matches; otherwise it is re-answered from the workspace graph and the
+        cache entry rewritten. Plugins outside the workspace are checked
+        within their own sources, which the cache key already covers.
+        """
+        if not self.workspace_graph.contains(Path(target_path)):
+            return
+        dependencies = cached["results"].get("dependencies") or {}
+        if dependencies.get("workspace_fingerprint") == self.workspace_graph.fingerprint():
+            return
+        cached["results"]["dependencies"] = self.run_dependency_check(target_path)
+        cached["success"] = all(
+            result.get("success", False) for result in cached["results"].values()
+        )
+        if self._is_cacheable(cached):
+            entry = {key: value for key, value in cached.items() if key != "cached"}
+            self.cache.put(Path(target_path).name, cache_key, entry)
+
+    def analyze_typescript(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        files: Optional[List[str]] = None,
+        biome_result: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run comprehensive TypeScript analysis, optionally scoped to files relative to target_path.
+
+        A `biome_result` already produced by run_biome_batch is used instead of
+        running Biome again for this plugin.
+        """
+        plugin_name = Path(target_path).name
+        # File-scoped runs are partial results, so they bypass the whole-plugin cache.
+        # The source fingerprint goes into the result so callers need not hash again.
+        source_hash = hash_plugin_sources(Path(target_path)) if self.cache and not files else None
+        cache_key = self._cache_key(target_path, config, source_hash) if source_hash else None
+        if cache_key:
+            cached = self.cache.get(plugin_name, cache_key)
+            if cached:
+                cached["cached"] = True
+                cached["source_hash"] = source_hash
+                self._refresh_dependencies(cached, target_path, cache_key)
+                return cached
 
-    def analyze_typescript(self, target_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Run comprehensive TypeScript analysis"""
         results = {
             "success": True,
             "results": {
-                "biome": self.run_biome(target_path, config),
-                "dependencies": self.run_dependency_check(target_path)
-            }
+                "biome": (
+                    biome_result
+                    if biome_result is not None
+                    else self.run_biome(target_path, config, files)
+                ),
+                "dependencies": self.run_dependency_check(target_path, files),
+            },
         }
+        if source_hash:
+            results["source_hash"] = source_hash
 
         # Check overall success
         results["success"] = all(
@@ -168,105 +782,160 @@ class NodeManager:
             for key in results["results"]
         )
 
+        if cache_key and self._is_cacheable(results):
+            self.cache.put(plugin_name, cache_key, results)
+
         return results
 
-    def _parse_biome_verbose_output(self, output: str) -> list[Dict[str, Any]]:
-        """Parse Biome verbose output into structured format"""
-        diagnostics = []
-        current_diagnostic = None
-        current_file = None
-        current_message = []
-        in_error_block = False
-        summary_info = {
-            "total_warnings": 0,
-            "total_errors": 0,
-            "files_processed": []
+    async def _run_process_async(
+        self, cmd: List[str], cwd: str, semaphore: asyncio.Semaphore
+    ) -> tuple[int, str, str]:
+        """Run a command without blocking the event loop, bounded by the shared semaphore and timeout"""
+        async with semaphore:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ},
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=self.process_timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise TimeoutError(
+                    f"Command timed out after {self.process_timeout}s: {' '.join(cmd)}"
+                )
+
+        return (
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    async def run_biome_async(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of run_biome built on asyncio subprocesses"""
+        semaphore = semaphore or asyncio.Semaphore(self.max_processes)
+
+        async def run_once() -> Dict[str, Any]:
+            cmd = self._biome_command(config)
+            self.logger.info(f"Running (async) {' '.join(cmd)} in {target_path}")
+            returncode, stdout, stderr = await self._run_process_async(
+                cmd, str(Path(target_path)), semaphore
+            )
+            if self.reporter == "json":
+                parser = BiomeJsonStreamParser()
+                diagnostics = DiagnosticTable()
+                for diagnostic in parser.feed(stdout):
+                    diagnostics.add(diagnostic)
+                return self._build_biome_json_result(returncode, parser, diagnostics, stderr)
+            return self._build_biome_result(returncode, stdout, stderr)
+
+        try:
+            await asyncio.to_thread(self._daemon_active)
+            generation = self.daemon.generation if self.daemon else 0
+            result = await run_once()
+
+            # Same crash handling as run_biome: restart the daemon once and retry
+            if self.daemon and self.daemon.running and self._biome_run_failed(result):
+                if await asyncio.to_thread(self.daemon.restart, generation):
+                    result = await run_once()
+            return result
+        except Exception as e:
+            self.logger.error(f"Async Biome run failed for {target_path}: {str(e)}")
+            return {
+                "success": False,
+                "output": "",
+                "errors": str(e),
+                "diagnostics": DiagnosticTable(),
+                "raw_output": f"ERROR:\n{str(e)}",
+                "all_output": [],
+                "error_logs": [str(e)],
+            }
+
+    async def run_dependency_check_async(self, target_path: str) -> Dict[str, Any]:
+        """Async variant of run_dependency_check; the analysis runs on a worker thread"""
+        return await asyncio.to_thread(self.run_dependency_check, target_path)
+
+    async def analyze_typescript_async(
+        self,
+        target_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Any]:
+        """Run comprehensive TypeScript analysis with Biome and the dependency check running concurrently"""
+        plugin_name = Path(target_path).name
+        source_hash = (
+            await asyncio.to_thread(hash_plugin_sources, Path(target_path)) if self.cache else None
+        )
+        cache_key = (
+            await asyncio.to_thread(self._cache_key, target_path, config, source_hash)
+            if source_hash
+            else None
+        )
+        if cache_key:
+            cached = self.cache.get(plugin_name, cache_key)
+            if cached:
+                cached["cached"] = True
+                cached["source_hash"] = source_hash
+                await asyncio.to_thread(self._refresh_dependencies, cached, target_path, cache_key)
+                return cached
+
+        biome_result, dependency_result = await asyncio.gather(
+            self.run_biome_async(target_path, config, semaphore),
+            self.run_dependency_check_async(target_path),
+        )
+        results = {
+            "success": True,
+            "results": {"biome": biome_result, "dependencies": dependency_result},
         }
+        if source_hash:
+            results["source_hash"] = source_hash
 
-        lines = output.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
+        # Check overall success
+        results["success"] = all(
+            results["results"][key].get("success", False) for key in results["results"]
+        )
 
-            # Capture summary information
-            if "Found" in line and ("warnings" in line or "errors" in line):
-                try:
-                    count = int(line.split()[1])
-                    if "warnings" in line:
-                        summary_info["total_warnings"] = count
-                    elif "errors" in line:
-                        summary_info["total_errors"] = count
-                except ValueError:
-                    pass
-
-            # Capture processed files
-            elif line.startswith("- src/"):
-                summary_info["files_processed"].append(line.strip("- "))
-
-            # Check for file location and rule
-            elif '.ts:' in line and not line.startswith('i '):
-                # New diagnostic starts
-                if current_diagnostic:
-                    current_diagnostic["message"] = "\n".join(current_message)
-                    diagnostics.append(current_diagnostic)
-                    current_message = []
-
-                parts = line.split(" ", 1)
-                location = parts[0]
-                rule = parts[1] if len(parts) > 1 else ""
-
-                file_parts = location.split(":")
-                current_diagnostic = {
-                    "file": file_parts[0],
-                    "line": int(file_parts[1]) if len(file_parts) > 1 else 0,
-                    "column": int(file_parts[2]) if len(file_parts) > 2 else 0,
-                    "rule": rule.split("  ")[0] if "  " in rule else rule,
-                    "severity": "error" if "error" in rule.lower() else "warning",
-                    "message": "",
-                    "code_snippet": []
-                }
-                in_error_block = True
-
-            # Capture error messages and code snippets
-            elif in_error_block:
-                if line.startswith(("  !", "  i ")):  # Main error message
-                    current_message.append(line.replace("  ! ", "").replace("  i ", ""))
-                elif line.startswith(("  >", "     ")):  # Code snippet
-                    if current_diagnostic:
-                        current_diagnostic["code_snippet"].append(line)
-                elif line.startswith("  -") or line.startswith("  +"): # Fix suggestions
-                    if current_diagnostic:
-                        current_diagnostic["code_snippet"].append(line)
-                else:
-                    in_error_block = False
-
-            i += 1
+        if cache_key and self._is_cacheable(results):
+            self.cache.put(plugin_name, cache_key, results)
 
-        # Add the last diagnostic if exists
-        if current_diagnostic:
-            current_diagnostic["message"] = "\n".join(current_message)
-            diagnostics.append(current_diagnostic)
+        return results
 
-        # If we have no diagnostics but have summary info, create a summary diagnostic
-        if not diagnostics and (summary_info["total_warnings"] > 0 or summary_info["total_errors"] > 0):
-            summary_diagnostic = {
-                "file": "Summary",
-                "line": 0,
-                "column": 0,
-                "rule": "multiple-issues",
-                "severity": "warning",
-                "message": f"Found {summary_info['total_warnings']} warnings and {summary_info['total_errors']} errors across {len(summary_info['files_processed'])} files",
-                "code_snippet": [f"Affected files:"] + [f"  - {f}" for f in summary_info['files_processed']]
-            }
-            diagnostics.append(summary_diagnostic)
+    async def analyze_plugins_async(
+        self, target_paths: List[str], config: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Analyze several plugins concurrently; results are returned in input order.
+
+        The process semaphore is created here, on the running event loop, so
+        every `asyncio.run` gets its own.
+        """
+        semaphore = asyncio.Semaphore(self.max_processes)
+        return await asyncio.gather(
+            *(
+                self.analyze_typescript_async(target_path, config, semaphore)
+                for target_path in target_paths
+            )
+        )
+
+    def _parse_biome_verbose_output(self, output: str) -> DiagnosticTable:
+        """Parse Biome verbose output into structured format"""
+        parser = BiomeVerboseParser()
+        for line in output.splitlines():
+            parser.feed_line(line)
+        return parser.close()
 
-        return diagnostics
 
 if __name__ == "__main__":
     # Test the Node manager
     node_mgr = NodeManager()
     result = node_mgr.run_biome("../../packages/plugin-test")
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    print(json.dumps(result, indent=2, default=json_default))
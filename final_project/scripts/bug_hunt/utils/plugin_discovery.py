@@ -0,0 +1,160 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern
+
+# Files that make a plugin worth analyzing
+QUALIFYING_SUFFIXES = (".ts", ".tsx")
+
+
+def compile_exclude_patterns(patterns: Iterable[str]) -> Optional[Pattern]:
+    """Compile glob-style exclude patterns into one regex over plugin-relative posix paths.
+
+    `**/` matches any number of leading directories, `**` anything, `*` and `?`
+    stay within a single path segment.
+    """
+    alternatives = []
+    for pattern in patterns:
+        regex = []
+        i = 0
+        while i < len(pattern):
+            if pattern.startswith("**/", i):
+                regex.append("(?:.*/)?")
+                i += 3
+            elif pattern.startswith("**", i):
+                regex.append(".*")
+                i += 2
+            elif pattern[i] == "*":
+                regex.append("[^/]*")
+                i += 1
+            elif pattern[i] == "?":
+                regex.append("[^/]")
+                i += 1
+            else:
+                regex.append(re.escape(pattern[i]))
+                i += 1
+        alternatives.append("".join(regex))
+
+    if not alternatives:
+        return None
+    return re.compile("(?:" + "|".join(alternatives) + r")\Z")
+
+
+class PluginDiscovery:
+    """Finds `plugin-*` directories that contain TypeScript sources.
+
+    Each plugin tree is walked with `os.scandir`, excluded directories are
+    pruned before descending, and the walk stops at the first qualifying file.
+    Results are cached between runs: a qualifying plugin is re-confirmed by
+    checking its remembered file still exists, a non-qualifying one by checking
+    that none of the directories it walked have a newer mtime.
+    """
+
+    def __init__(self, exclude_patterns: Iterable[str] = (), cache_file: Optional[Path] = None):
+        self.exclude_patterns = list(exclude_patterns)
+        self.matcher = compile_exclude_patterns(self.exclude_patterns)
+        # Get the root directory (scripts/bug_hunt)
+        root_dir = Path(__file__).parent.parent
+        self.cache_file = (
+            Path(cache_file) if cache_file else root_dir / "cache" / "discovery" / "plugins.json"
+        )
+        self.logger = logging.getLogger(__name__)
+
+        self._patterns_key = hashlib.sha256(
+            json.dumps(self.exclude_patterns).encode("utf-8")
+        ).hexdigest()
+        self._cache = self._load_cache()
+
+    def discover(self, plugins_dir: Path) -> List[Path]:
+        """Return qualifying plugin directories, sorted by name"""
+        plugin_paths = []
+        try:
+            entries = sorted(os.scandir(plugins_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            return []
+
+        for entry in entries:
+            if entry.name.startswith("plugin-") and entry.is_dir(follow_symlinks=False):
+                if self._qualifies(Path(entry.path)):
+                    plugin_paths.append(Path(entry.path))
+
+        self._save_cache()
+        return plugin_paths
+
+    def _is_excluded(self, rel_path: str) -> bool:
+        return bool(self.matcher and self.matcher.match(rel_path))
+
+    def _qualifies(self, plugin_dir: Path) -> bool:
+        key = str(plugin_dir)
+        cached = self._cache.get(key)
+        if cached and self._cache_valid(plugin_dir, cached):
+            return cached["witness"] is not None
+
+        witness, dir_mtimes = self._scan(plugin_dir)
+        self._cache[key] = {
+            "witness": witness,
+            # Directory mtimes are only needed to prove a negative result is still current
+            "dirs": {} if witness else dir_mtimes,
+        }
+        return witness is not None
+
+    def _cache_valid(self, plugin_dir: Path, cached: Dict) -> bool:
+        if cached["witness"] is not None:
+            return (plugin_dir / cached["witness"]).is_file()
+        for rel_dir, mtime_ns in cached["dirs"].items():
+            try:
+                if os.stat(plugin_dir / rel_dir).st_mtime_ns != mtime_ns:
+                    return False
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _scan(self, plugin_dir: Path) -> tuple[Optional[str], Dict[str, int]]:
+        """Depth-first scan returning the first qualifying file and the mtimes of walked dirs"""
+        dir_mtimes: Dict[str, int] = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = plugin_dir / rel_dir if rel_dir else plugin_dir
+            try:
+                dir_mtimes[rel_dir or "."] = os.stat(abs_dir).st_mtime_ns
+                with os.scandir(abs_dir) as it:
+                    subdirs = []
+                    for entry in it:
+                        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._is_excluded(rel_path + "/"):
+                                subdirs.append(rel_path)
+                        elif entry.name.endswith(QUALIFYING_SUFFIXES) and not self._is_excluded(
+                            rel_path
+                        ):
+                            return rel_path, dir_mtimes
+                    stack.extend(subdirs)
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                continue
+        return None, dir_mtimes
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        # Cached answers are only valid for the same exclude patterns
+        if data.get("patterns_key") != self._patterns_key:
+            return {}
+        return data.get("plugins", {})
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"patterns_key": self._patterns_key, "plugins": self._cache}, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not save discovery cache: {str(e)}")
@@ -0,0 +1,248 @@
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from utils.biome_json import BiomeJsonStreamParser
+from utils.diagnostics import SEVERITIES, DiagnosticTable
+
+# Rough characters-per-token ratio for budgeting; errs on the side of smaller chunks
+CHARS_PER_TOKEN = 4
+
+T = TypeVar("T")
+
+_QUOTED = re.compile(r"`[^`]*`|\"[^\"]*\"|'[^']*'")
+_NUMBER = re.compile(r"\b\d+\b")
+# Section marker the agent is asked to put before each report's analysis in a batch;
+# tolerates markdown emphasis or heading marks around it
+_BATCH_MARKER = re.compile(r"^[ \t#*_]*=== REPORT (\d+) ===[ \t*_]*$", re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def normalize_message(message: str) -> str:
+    """Message with identifiers, literals and numbers masked so variants of one problem match"""
+    first_line = message.strip().splitlines()[0] if message.strip() else ""
+    return _NUMBER.sub("N", _QUOTED.sub("…", first_line)).strip()
+
+
+@dataclass
+class DiagnosticCluster:
+    rule: str
+    message: str
+    severity: str
+    count: int = 0
+    files: Counter = field(default_factory=Counter)
+    examples: List[Tuple[str, int, List[str]]] = field(default_factory=list)
+
+    def render(self) -> str:
+        top_files = ", ".join(f"{path} ({n})" for path, n in self.files.most_common(3))
+        more = f" and {len(self.files) - 3} more" if len(self.files) > 3 else ""
+        lines = [
+            f"- [{self.severity}] `{self.rule or 'unknown'}` x{self.count} in {len(self.files)} files: {self.message}",
+            f"  Files: {top_files}{more}",
+        ]
+        for path, line, snippet in self.examples:
+            lines.append(f"  Example {path}:{line}")
+            lines.extend(f"    {snippet_line}" for snippet_line in snippet)
+        return "\n".join(lines)
+
+
+def extract_diagnostics(payload: str) -> Optional[DiagnosticTable]:
+    """Diagnostics from a report payload, or None when it carries none in a known shape.
+
+    Understands the Biome JSON reporter document, NodeManager results (list
+    of dicts or a serialized DiagnosticTable) and analysis results that nest
+    them under results.biome.
+    """
+    try:
+        data = json.loads(payload)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    source = data
+    results = data.get("results")
+    if isinstance(results, dict) and isinstance(results.get("biome"), dict):
+        source = results["biome"]
+    diagnostics = source.get("diagnostics")
+    if diagnostics is None:
+        return None
+
+    if (
+        isinstance(diagnostics, list)
+        and diagnostics
+        and isinstance(diagnostics[0], dict)
+        and ("category" in diagnostics[0] or "location" in diagnostics[0])
+    ):
+        # Raw `biome check --reporter=json` output
+        table = DiagnosticTable()
+        parser = BiomeJsonStreamParser()
+        for element in diagnostics:
+            table.add(parser.to_diagnostic(element))
+        return table
+    return DiagnosticTable.coerce(diagnostics)
+
+
+def cluster_diagnostics(table: DiagnosticTable, max_examples: int = 2) -> List[DiagnosticCluster]:
+    """Collapse diagnostics by rule and normalized message, most severe and frequent first"""
+    clusters: Dict[Tuple[int, str], DiagnosticCluster] = {}
+    summary_id = table.paths.index("Summary") if "Summary" in table.paths else None
+    severity_rank = {name: rank for rank, name in enumerate(SEVERITIES)}
+
+    for index in range(len(table)):
+        file_id = table.file_ids[index]
+        if file_id == summary_id:
+            continue
+        message = table.messages[index]
+        key = (table.rule_ids[index], normalize_message(message))
+        cluster = clusters.get(key)
+        severity = SEVERITIES[table.severities[index]]
+        if cluster is None:
+            cluster = clusters[key] = DiagnosticCluster(
+                table.rules[key[0]],
+                message.strip().splitlines()[0] if message.strip() else "",
+                severity,
+            )
+        elif severity_rank[severity] < severity_rank[cluster.severity]:
+            cluster.severity = severity
+
+        path = table.paths[file_id]
+        cluster.count += 1
+        cluster.files[path] += 1
+        # Prefer examples from different files
+        if len(cluster.examples) < max_examples and all(
+            example[0] != path for example in cluster.examples
+        ):
+            cluster.examples.append(
+                (path, table.lines[index], (table.snippets.get(index) or [])[:6])
+            )
+
+    return sorted(clusters.values(), key=lambda c: (severity_rank[c.severity], -c.count, c.rule))
+
+
+def pack_blocks(
+    blocks: Iterable[T],
+    token_budget: int,
+    max_blocks: Optional[int] = None,
+    size: Callable[[T], int] = estimate_tokens,
+) -> List[List[T]]:
+    """Greedily group blocks into chunks that stay within the token budget"""
+    chunks: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+    for block in blocks:
+        tokens = size(block)
+        if current and (
+            used + tokens > token_budget or (max_blocks and len(current) >= max_blocks)
+        ):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(block)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ReportDigest:
+    """Turns a report payload into one or more token-budgeted prompts.
+
+    Structured reports are condensed into counted clusters of identical
+    problems with a few examples each, so prompt size follows the number of
+    distinct problems rather than the raw diagnostic count. Anything that
+    still exceeds the budget is split into chunks for a map step, and
+    `reduce_prompt` merges the partial analyses.
+    """
+
+    def __init__(self, token_budget: int = 12000, max_examples: int = 2):
+        self.token_budget = token_budget
+        self.max_examples = max_examples
+
+    def prompts(self, payload: str, label: str) -> List[str]:
+        """Map prompts for a report; a single prompt means no reduce step is needed"""
+        table = extract_diagnostics(payload)
+        if table is None:
+            if estimate_tokens(payload) <= self.token_budget:
+                return [payload]
+            header_tokens = estimate_tokens(self._header(label, 1, 2, "Raw report excerpt"))
+            chunks = pack_blocks(payload.splitlines(), max(self.token_budget - header_tokens, 1))
+            return [
+                self._header(label, i, len(chunks), "Raw report excerpt") + "\n".join(chunk)
+                for i, chunk in enumerate(chunks, 1)
+            ]
+
+        clusters = cluster_diagnostics(table, self.max_examples)
+        counts = table.counts(skip_files=("Summary",))
+        overview = (
+            f"{sum(counts.values())} diagnostics ({counts['error']} errors, {counts['warning']} warnings, "
+            f"{counts['info']} infos) in {len(table.files(skip_files=('Summary',)))} files, "
+            f"collapsed into {len(clusters)} distinct problems"
+        )
+        if not clusters:
+            return [f"Biome report for {label}: {overview}. No diagnostics to analyze."]
+
+        # Leave room for the header repeated on every chunk
+        header_tokens = estimate_tokens(self._header(label, 1, 2, overview))
+        chunks = pack_blocks(
+            (cluster.render() for cluster in clusters), max(self.token_budget - header_tokens, 1)
+        )
+        return [
+            self._header(label, i, len(chunks), overview) + "\n".join(chunk)
+            for i, chunk in enumerate(chunks, 1)
+        ]
+
+    @staticmethod
+    def _header(label: str, part: int, parts: int, overview: str) -> str:
+        scope = f" (part {part} of {parts})" if parts > 1 else ""
+        return (
+            f"Biome report for {label}{scope}.\n"
+            f"{overview}.\n"
+            "Each entry is one distinct problem with its occurrence count and representative examples.\n\n"
+        )
+
+    def reduce_prompt(self, label: str, partials: List[str]) -> str:
+        """Prompt merging the partial analyses of one report into a single analysis"""
+        sections = "\n\n".join(
+            f"## Partial analysis {i}\n\n{text}" for i, text in enumerate(partials, 1)
+        )
+        return (
+            f"The Biome report for {label} was too large for one request and was analyzed in "
+            f"{len(partials)} parts. Merge these partial analyses into a single analysis in the "
+            "expected format: combine counts, remove duplicated advice and keep the overall "
+            "prioritization consistent.\n\n" + sections
+        )
+
+
+def batch_prompt(payloads: List[str]) -> str:
+    """One prompt asking for separate analyses of several independent reports"""
+    reports = "\n\n".join(
+        f'<report id="{i}">\n{payload}\n</report>' for i, payload in enumerate(payloads, 1)
+    )
+    return (
+        f"The following {len(payloads)} Biome reports are independent. Analyze each one on its own, "
+        "in the expected format, without referring to the other reports.\n"
+        "Reply with exactly one section per report, in the same order. Start each section with a "
+        "marker line containing only `=== REPORT <id> ===` (for example `=== REPORT 1 ===`) and "
+        "write nothing before the first marker.\n\n" + reports
+    )
+
+
+def split_batch_response(response: str, count: int) -> Dict[int, str]:
+    """Per-report analyses from a batched response, keyed by 0-based position.
+
+    Reports whose section is missing or empty are left out so the caller can
+    analyze them on their own.
+    """
+    markers = list(_BATCH_MARKER.finditer(response))
+    sections: Dict[int, str] = {}
+    for marker, following in zip(markers, markers[1:] + [None]):
+        position = int(marker.group(1)) - 1
+        text = response[marker.end() : following.start() if following else len(response)].strip()
+        if 0 <= position < count and text and position not in sections:
+            sections[position] = text
+    return sections
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from rich.console import Console
+from rich.markdown import Markdown
+
+# Lines starting a new page: one per file section of a Biome report
+SECTION_PREFIX = b"### "
+FENCE_PREFIX = b"```"
+
+
+@dataclass
+class ReportPage:
+    title: str
+    start: int
+    end: int
+    # The page begins inside a fenced code block opened on an earlier page
+    in_fence: bool
+
+
+class ReportPager:
+    """Splits a markdown report into pages without loading it whole.
+
+    Pages break at every `### ` section and after `page_lines` lines inside a
+    long section. The file is scanned forward only as far as the page being
+    asked for, and only byte offsets are kept, so showing the first page costs
+    the same for a 10 KB report as for a 100 MB one.
+    """
+
+    def __init__(self, report_path: Path, page_lines: int = 200):
+        self.report_path = Path(report_path)
+        self.page_lines = page_lines
+        self.pages: List[ReportPage] = []
+        self.complete = False
+        self._offset = 0
+        self._in_fence = False
+        self._title = "Summary"
+
+    def page(self, number: int) -> Optional[ReportPage]:
+        """Page by 0-based number, scanning further into the file if needed"""
+        while len(self.pages) <= number and not self.complete:
+            self._scan_page()
+        return self.pages[number] if number < len(self.pages) else None
+
+    def read(self, page: ReportPage) -> str:
+        """Markdown for one page, with code fences balanced at the page edges"""
+        with open(self.report_path, "rb") as f:
+            f.seek(page.start)
+            text = f.read(page.end - page.start).decode("utf-8", errors="replace")
+
+        fences = sum(1 for line in text.splitlines() if line.lstrip().startswith("```"))
+        if page.in_fence:
+            text = "```\n" + text
+        if (fences + page.in_fence) % 2:
+            text += "\n```\n"
+        return text
+
+    def _scan_page(self) -> None:
+        start = self._offset
+        in_fence = self._in_fence
+        title = self._title
+        lines = 0
+
+        with open(self.report_path, "rb") as f:
+            f.seek(start)
+            while True:
+                position = f.tell()
+                line = f.readline()
+                if not line:
+                    self.complete = True
+                    end = position
+                    break
+
+                is_section = not self._in_fence and line.startswith(SECTION_PREFIX)
+                if is_section:
+                    section_title = (
+                        line[len(SECTION_PREFIX) :].decode("utf-8", errors="replace").strip()
+                    )
+                    if lines:
+                        self._title = section_title
+                        end = position
+                        break
+                    title = section_title
+                elif lines >= self.page_lines:
+                    self._title = title if title.endswith("(cont.)") else f"{title} (cont.)"
+                    end = position
+                    break
+
+                if line.lstrip().startswith(FENCE_PREFIX):
+                    self._in_fence = not self._in_fence
+                lines += 1
+
+        self._offset = end
+        if end > start:
+            self.pages.append(ReportPage(title, start, end, in_fence))
+
+
+def page_report(console: Console, report_path: Path, page_lines: int = 200) -> None:
+    """Show a report one page at a time, rendering each page only when it is reached"""
+    pager = ReportPager(report_path, page_lines)
+
+    # Without a terminal there is nobody to page for; stream every page instead
+    if not console.is_terminal:
+        number = 0
+        while (page := pager.page(number)) is not None:
+            console.print(Markdown(pager.read(page)))
+            number += 1
+        return
+
+    number = 0
+    while True:
+        page = pager.page(number)
+        if page is None:
+            number = max(len(pager.pages) - 1, 0)
+            if not pager.pages:
+                console.print("[yellow]Report is empty[/yellow]")
+                return
+            continue
+
+        total = str(len(pager.pages)) if pager.complete else f"{len(pager.pages)}+"
+        console.rule(f"{page.title} (page {number + 1} of {total})")
+        console.print(Markdown(pager.read(page)))
+
+        choice = (
+            console.input("[dim]Enter: next, p: previous, number: go to page, q: quit[/dim] ")
+            .strip()
+            .lower()
+        )
+        if choice == "q":
+            return
+        if choice == "p":
+            number = max(number - 1, 0)
+        elif choice.isdigit():
+            number = max(int(choice) - 1, 0)
+        elif pager.complete and number >= len(pager.pages) - 1:
+            return
+        else:
+            number += 1
@@ -1,41 +1,25 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Optional, TextIO
+import io
 import json
 from pathlib import Path
 import os
+import tempfile
+import threading
 from termcolor import colored
 from datetime import datetime
 import logging
 
-# Setup logging configuration at module level
-def setup_logging():
-    # Create logs directory if it doesn't exist
-    logs_dir = Path(__file__).parent.parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            # File handler for biome.log
-            logging.FileHandler(logs_dir / "biome.log", encoding='utf-8'),
-            # Console handler for immediate feedback
-            logging.StreamHandler()
-        ]
-    )
-
-# Call setup_logging when module is imported
-setup_logging()
+from utils.diagnostics import SEVERITIES, BiomeDiagnostic, DiagnosticTable
 
-@dataclass
-class BiomeDiagnostic:
-    message: str
-    file_path: str
-    line: int
-    column: int
-    severity: str
-    rule: str
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock still serializes our own writers
+    fcntl = None
+
+# Number of most frequent rules recorded per report in the index
+REPORT_INDEX_TOP_RULES = 5
 
 @dataclass
 class BiomeReport:
@@ -61,29 +45,38 @@ class BiomeReportGenerator:
             "file_issues": {},
             "logs": []
         }
+        self.diagnostics = DiagnosticTable()
 
     def parse_biome_output(self, biome_output: str, plugin_name: str) -> None:
-        """Parse the raw Biome output and store it in the report data structure"""
+        """Parse serialized Biome output and store it in the report data structure"""
+        try:
+            result = json.loads(biome_output)
+        except json.JSONDecodeError:
+            # If it's not JSON, treat it as raw output
+            result = {"all_output": biome_output.splitlines()}
+        self.load_result(
+            result if isinstance(result, dict) else {}, plugin_name, raw_output=biome_output
+        )
+
+    def load_result(self, result: Dict[str, Any], plugin_name: str, raw_output: str = "") -> None:
+        """Store a NodeManager Biome result in the report data structure"""
         logger = logging.getLogger(__name__)
         logger.info("=== Starting Biome Output Parsing ===")
 
         self.report_data["timestamp"] = datetime.now().isoformat()
         self.report_data["plugin_name"] = plugin_name
-        self.report_data["raw_output"] = biome_output
+        self.report_data["raw_output"] = raw_output or result.get("raw_output", "")
+        self.report_data["logs"] = result.get("all_output", []) + result.get("error_logs", [])
+        self.diagnostics = DiagnosticTable.coerce(result.get("diagnostics"))
 
         # Parse the text output
         files_processed = []
         diagnostics_limit_msg = None
 
-        # Get the output from node_manager's result
-        try:
-            result = json.loads(biome_output)
-            all_output = result.get("all_output", [])
-            error_logs = result.get("error_logs", [])
-            self.report_data["logs"] = all_output + error_logs
-        except json.JSONDecodeError:
-            # If it's not JSON, treat it as raw output
-            self.report_data["logs"] = biome_output.splitlines()
+        # The JSON reporter (or a merged --since run) already produced structured counts
+        if isinstance(result.get("summary"), dict):
+            self._apply_json_summary(result["summary"])
+            return
 
         for line in self.report_data["logs"]:
             line = line.strip()
@@ -145,58 +138,120 @@ class BiomeReportGenerator:
                 self.report_data["file_issues"]["Summary"] = []
             self.report_data["file_issues"]["Summary"].insert(0, summary)
 
+    def _apply_json_summary(self, summary: Dict[str, Any]) -> None:
+        """Populate counts from a JSON reporter summary produced by NodeManager"""
+        severity_counts = {
+            "error": summary.get("errors", 0),
+            "warning": summary.get("warnings", 0),
+            "info": summary.get("infos", 0),
+        }
+        self.report_data["issues_by_severity"] = severity_counts
+        self.report_data["total_issues"] = sum(severity_counts.values())
+
+        files_processed = summary.get("files", [])
+        self.report_data["files_analyzed"] = len(files_processed)
+
+        if self.report_data["total_issues"] > 0:
+            summary_entry = {
+                "severity": "error" if severity_counts["error"] else "warning",
+                "line": 0,
+                "column": 0,
+                "rule": "summary",
+                "message": f"Found {severity_counts['warning']} warnings and {severity_counts['error']} errors",
+                "code_snippet": ["Files with diagnostics:", ""]
+                + [f"  - {f}" for f in files_processed],
+                "additional_info": [],
+            }
+            if summary.get("diagnostics_not_printed"):
+                summary_entry["additional_info"].append(
+                    f"{summary['diagnostics_not_printed']} diagnostics were not printed by Biome"
+                )
+            self.report_data["file_issues"].setdefault("Summary", []).insert(0, summary_entry)
+
     def generate_markdown_report(self) -> str:
         """Generate a formatted markdown report from the parsed data"""
-        report = []
+        buffer = io.StringIO()
+        self.write_markdown_report(buffer)
+        return buffer.getvalue()
+
+    def write_markdown_report(self, out: TextIO) -> None:
+        """Stream the markdown report to a text file object"""
+        write = out.write
 
         # Header
-        report.append(f"# Biome Analysis Report: {self.report_data['plugin_name']}")
-        report.append(f"\nGenerated at: {self.report_data['timestamp']}\n")
+        write(f"# Biome Analysis Report: {self.report_data['plugin_name']}\n")
+        write(f"\nGenerated at: {self.report_data['timestamp']}\n\n")
 
         # Summary
-        report.append("## Summary")
-        report.append(f"- Total Issues: {self.report_data['total_issues']}")
-        report.append(f"- Files Analyzed: {self.report_data['files_analyzed']}")
-        report.append("\nIssues by Severity:")
+        write("## Summary\n")
+        write(f"- Total Issues: {self.report_data['total_issues']}\n")
+        write(f"- Files Analyzed: {self.report_data['files_analyzed']}\n")
+        write("\nIssues by Severity:\n")
         for severity, count in self.report_data["issues_by_severity"].items():
             if count > 0:  # Only show non-zero counts
-                report.append(f"- {severity.capitalize()}: {count}")
+                write(f"- {severity.capitalize()}: {count}\n")
 
         # Detailed Issues
-        report.append("\n## Detailed Issues")
+        write("\n## Detailed Issues\n")
 
         # First show summary if it exists
         if "Summary" in self.report_data["file_issues"]:
-            report.append("\n### Overview")
+            write("\n### Overview\n")
             for issue in self.report_data["file_issues"]["Summary"]:
                 severity_marker = "🔴" if issue["severity"] == "error" else "⚠️"
-                report.append(f"\n{severity_marker} **{issue['message']}**")
+                write(f"\n{severity_marker} **{issue['message']}**\n")
 
                 # Add any additional info (like diagnostics limit message)
-                if issue.get("additional_info"):
-                    for info in issue["additional_info"]:
-                        report.append(f"\n> {info}")
+                for info in issue.get("additional_info") or []:
+                    write(f"\n> {info}\n")
 
                 # Add file list
                 if issue.get("code_snippet"):
-                    report.append("\n```")
-                    report.extend(issue["code_snippet"])
-                    report.append("```")
-
-        # Show all logs
-        if self.report_data.get("logs"):
-            report.append("\n### Full Diagnostic Output")
-            report.append("\n```")
-            for log in self.report_data["logs"]:
-                report.append(log)
-            report.append("```")
-
-        # Then show all other files
+                    write("\n```\n")
+                    self._write_lines(out, issue["code_snippet"])
+                    write("```\n")
+
+        grouped = self.diagnostics.group_by_file_and_rule(skip_files=("Summary",))
+
+        # Raw logs are only worth showing when no structured diagnostics were parsed
+        if self.report_data.get("logs") and not grouped:
+            write("\n### Full Diagnostic Output\n")
+            write("\n```\n")
+            self._write_lines(out, self.report_data["logs"])
+            write("```\n")
+
+        # Then one section per file, with issues grouped by rule
+        table = self.diagnostics
+        for file_path, rules in grouped.items():
+            write(f"\n### {file_path}\n")
+            for rule, rows in rules.items():
+                write(f"\n#### `{rule or 'unknown'}` ({len(rows)})\n")
+                for index in rows:
+                    severity = SEVERITIES[table.severities[index]]
+                    severity_marker = "🔴" if severity == "error" else "⚠️"
+                    write(
+                        f"\n{severity_marker} **{severity.upper()}** - "
+                        f"line {table.lines[index]}, column {table.columns[index]}\n"
+                    )
+
+                    # Add message with proper formatting
+                    message = table.messages[index]
+                    if message:
+                        write(f"- Message: {message}\n")
+
+                    # Add code snippet if available
+                    snippet = table.snippets.get(index)
+                    if snippet:
+                        write("\n```typescript\n")
+                        self._write_lines(out, snippet)
+                        write("```\n")
+
+        # Legacy per-file entries that were not parsed into the diagnostics table
         for file_path, issues in self.report_data["file_issues"].items():
             if file_path == "Summary":
                 continue
 
-            report.append(f"\n### {file_path}")
+            write(f"\n### {file_path}\n")
 
             for issue in issues:
                 severity_marker = "🔴" if issue["severity"] == "error" else "⚠️"
@@ -205,53 +260,156 @@ class BiomeReportGenerator:
                 if issue.get("fixable"):
                     rule_text += " (FIXABLE)"
 
-                report.append(f"\n{severity_marker} **{issue['severity'].upper()}** - {location}")
-                report.append(f"- Rule: {rule_text}")
+                write(f"\n{severity_marker} **{issue['severity'].upper()}** - {location}\n")
+                write(f"- Rule: {rule_text}\n")
 
                 # Add message with proper formatting
                 if issue.get("message"):
-                    report.append(f"- Message: {issue['message']}")
+                    write(f"- Message: {issue['message']}\n")
 
                 # Add code snippet if available
                 if issue.get("code_snippet"):
-                    report.append("\n```typescript")
-                    report.extend(issue["code_snippet"])
-                    report.append("```")
+                    write("\n```typescript\n")
+                    self._write_lines(out, issue["code_snippet"])
+                    write("```\n")
 
                 # Add additional info if available
                 if issue.get("additional_info"):
-                    report.append("\nℹ️ Additional Information:")
+                    write("\nℹ️ Additional Information:\n")
                     for info in issue["additional_info"]:
-                        report.append(f"- {info}")
+                        write(f"- {info}\n")
 
         # Commented out Raw Output section but preserved in code
         """
-        report.append("\n## Raw Biome Output")
-        report.append("```")
-        report.append(self.report_data["raw_output"])
-        report.append("```")
+        write("\n## Raw Biome Output\n")
+        write("```\n")
+        write(self.report_data["raw_output"] + "\n")
+        write("```\n")
         """
 
-        return "\n".join(report)
+    @staticmethod
+    def _write_lines(out: TextIO, lines: List[str]) -> None:
+        for line in lines:
+            out.write(line)
+            out.write("\n")
 
-    def save_report(self, output_dir: Path) -> None:
-        """Save the generated report to a markdown file"""
+    def save_report(self, output_dir: Path, index: Optional["ReportIndex"] = None) -> None:
+        """Stream the generated report to a markdown file and record it in the index.
+
+        With an `index` the entry is only staged; the caller flushes it.
+        """
         output_dir.mkdir(parents=True, exist_ok=True)
         report_path = output_dir / f"plugin-{self.report_data['plugin_name']}_report.md"
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(self.generate_markdown_report())
+        with open(report_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            self.write_markdown_report(f)
+
+        if index is not None:
+            index.stage(self.index_entry(report_path))
+        else:
+            ReportIndex(output_dir).update(self.index_entry(report_path))
+
+    def index_entry(self, report_path: Path) -> Dict[str, Any]:
+        """Metadata describing this report for the report index"""
+        rule_counts = Counter()
+        summary_id = (
+            self.diagnostics.paths.index("Summary") if "Summary" in self.diagnostics.paths else None
+        )
+        for file_id, rule_id in zip(self.diagnostics.file_ids, self.diagnostics.rule_ids):
+            if file_id != summary_id:
+                rule_counts[rule_id] += 1
+
+        return {
+            "plugin": self.report_data["plugin_name"],
+            "report": report_path.name,
+            "timestamp": self.report_data["timestamp"],
+            "total_issues": self.report_data["total_issues"],
+            "issues_by_severity": dict(self.report_data["issues_by_severity"]),
+            "files_analyzed": self.report_data["files_analyzed"],
+            "top_rules": [
+                [self.diagnostics.rules[rule_id], count]
+                for rule_id, count in rule_counts.most_common(REPORT_INDEX_TOP_RULES)
+            ],
+            "size": report_path.stat().st_size,
+        }
+
+
+class ReportIndex:
+    """Metadata for every report in a directory, kept in a single `index.json`.
+
+    Entries are keyed by plugin and rewritten atomically (temp file plus
+    rename) under a lock, so concurrent report writers never lose updates and
+    readers never see a half-written index. Listing reports only needs this
+    one file instead of opening every markdown report.
+
+    A session stages its entries with `stage` and writes them all with one
+    `flush` at the end, instead of rewriting the index for every report.
+    """
+
+    FILE_NAME = "index.json"
+    _lock = threading.Lock()
+
+    def __init__(self, reports_dir: Path):
+        self.reports_dir = Path(reports_dir)
+        self.index_path = self.reports_dir / self.FILE_NAME
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("reports", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Index entries keyed by plugin name, staged ones included"""
+        with self._pending_lock:
+            pending = dict(self._pending)
+        return {**self._read(), **pending}
+
+    def get(self, plugin: str) -> Optional[Dict[str, Any]]:
+        return self.entries().get(plugin)
+
+    def stage(self, entry: Dict[str, Any]) -> None:
+        """Remember the entry for one plugin until the next `flush`"""
+        with self._pending_lock:
+            self._pending[entry["plugin"]] = entry
+
+    def update(self, entry: Dict[str, Any]) -> None:
+        """Insert or replace the entry for one plugin right away"""
+        self.stage(entry)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write every staged entry to the index in one atomic replace"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.reports_dir / f"{self.FILE_NAME}.lock", "w") as lock_file:
+            if fcntl:
+                # Also serialize against other processes writing the same reports directory
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            reports = self._read()
+            reports.update(pending)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.reports_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"reports": reports}, f, indent=2)
+                os.replace(tmp_path, self.index_path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
 
 class ReportGenerator:
     def __init__(self, reports_dir: str = "reports"):
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(exist_ok=True)
 
-        # Setup logging
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
         self.logger = logging.getLogger(__name__)
 
     def parse_biome_output(self, output: str, plugin_name: str) -> BiomeReport:
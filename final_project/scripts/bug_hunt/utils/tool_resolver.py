@@ -0,0 +1,172 @@
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Tool name -> (executable, npm package, pnpm fallback command)
+TOOLS = {
+    "biome": ("biome", "@biomejs/biome", ["pnpm", "biome"]),
+}
+
+
+class ToolResolver:
+    """Resolves Node tool executables once per session so they can be exec'd directly.
+
+    Lookup order is the workspace `node_modules/.bin`, the bug hunter's own
+    `node_modules/.bin`, then a local tools cache that is populated with a
+    one-time `npm install`. Only if all of those fail does a tool go back to
+    running through pnpm.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        tools_dir: Optional[Path] = None,
+        allow_install: bool = True,
+        install_timeout: float = 300.0,
+    ):
+        self.work_dir = Path(work_dir)
+        # Get the root directory (scripts/bug_hunt)
+        self.root_dir = Path(__file__).parent.parent
+        self.tools_dir = Path(tools_dir) if tools_dir else self.root_dir / "tools"
+        self.allow_install = allow_install
+        # Resolution holds the lock, so a hung registry must not block every worker for long
+        self.install_timeout = install_timeout
+
+        self._resolved: Dict[str, List[str]] = {}
+        self._direct: Dict[str, bool] = {}
+        self.invocations: Dict[str, int] = {tool: 0 for tool in TOOLS}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def resolve(self, tool: str) -> List[str]:
+        """Command prefix for a tool, resolving it on first use, without counting an invocation"""
+        with self._lock:
+            if tool not in self._resolved:
+                self._resolved[tool] = self._resolve(tool)
+            return list(self._resolved[tool])
+
+    def command(self, tool: str) -> List[str]:
+        """Command prefix for a tool that is about to run; counted in `invocations`"""
+        cmd = self.resolve(tool)
+        with self._lock:
+            self.invocations[tool] += 1
+        return cmd
+
+    def _resolve(self, tool: str) -> List[str]:
+        executable, package, fallback = TOOLS[tool]
+
+        for bin_dir in self._bin_dirs():
+            found = self._find_executable(bin_dir, executable)
+            if found:
+                self.logger.info(f"Resolved {tool} at {found}")
+                self._direct[tool] = True
+                return [str(found)]
+
+        if self.allow_install and self._install(package):
+            found = self._find_executable(self.tools_dir / "node_modules" / ".bin", executable)
+            if found:
+                self.logger.info(f"Installed {tool} into tools cache at {found}")
+                self._direct[tool] = True
+                return [str(found)]
+
+        self.logger.warning(f"Could not resolve {tool}; falling back to {' '.join(fallback)}")
+        self._direct[tool] = False
+        return list(fallback)
+
+    def _bin_dirs(self) -> List[Path]:
+        return [
+            self.work_dir / "node_modules" / ".bin",
+            self.root_dir / "node_modules" / ".bin",
+            self.tools_dir / "node_modules" / ".bin",
+        ]
+
+    @staticmethod
+    def _find_executable(bin_dir: Path, executable: str) -> Optional[Path]:
+        for name in (executable, f"{executable}.cmd"):
+            candidate = bin_dir / name
+            if candidate.is_file() and os.access(candidate, os.X_OK):
+                return candidate
+        return None
+
+    def _install(self, package: str) -> bool:
+        """One-time install of a package into the tools cache"""
+        npm = shutil.which("npm")
+        if not npm:
+            return False
+
+        self.tools_dir.mkdir(parents=True, exist_ok=True)
+        self.logger.info(f"Installing {package} into {self.tools_dir}")
+        try:
+            result = subprocess.run(
+                [
+                    npm,
+                    "install",
+                    "--prefix",
+                    str(self.tools_dir),
+                    "--no-audit",
+                    "--no-fund",
+                    "--silent",
+                    package,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=self.install_timeout,
+                env={**os.environ},
+            )
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Installing {package} timed out after {self.install_timeout:.0f}s")
+            return False
+        except OSError as e:
+            self.logger.error(f"Failed to run npm to install {package}: {str(e)}")
+            return False
+        if result.returncode != 0:
+            self.logger.error(f"Failed to install {package}: {result.stderr.strip()}")
+            return False
+        return True
+
+    def _time_version(self, cmd: List[str]) -> Optional[float]:
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                [*cmd, "--version"],
+                cwd=str(self.work_dir),
+                capture_output=True,
+                text=True,
+                timeout=120,
+                env={**os.environ},
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        return time.perf_counter() - start
+
+    def overhead_report(self) -> Dict[str, Dict[str, object]]:
+        """Estimate the startup time saved by exec'ing tools directly.
+
+        Measures one `--version` call through the pnpm wrapper against the
+        resolved executable and multiplies the difference by the session's
+        invocation count. This spawns both commands, so it is an opt-in
+        diagnostic rather than part of every session.
+        """
+        report = {}
+        for tool, count in self.invocations.items():
+            if not count or not self._direct.get(tool):
+                continue
+            direct = self._time_version(self._resolved[tool])
+            wrapped = self._time_version(TOOLS[tool][2])
+            per_call = (
+                max(wrapped - direct, 0.0) if direct is not None and wrapped is not None else None
+            )
+            report[tool] = {
+                "command": self._resolved[tool][0],
+                "invocations": count,
+                "saved_per_call": per_call,
+                "saved_total": per_call * count if per_call is not None else None,
+            }
+        return report